@@ -1,14 +1,64 @@
 from dotenv import load_dotenv
 import os
 
-load_dotenv()  
+load_dotenv()
 
 class Settings:
     """Configuración de la aplicación"""
     REST_API_URL = os.getenv("REST_API_URL", "http://localhost:8080")
     GRAPHQL_HOST = os.getenv("GRAPHQL_HOST", "0.0.0.0")
-    GRAPHQL_PORT = int(os.getenv("GRAPHQL_PORT", "4000"))
+    GRAPHQL_PORT = int(os.getenv("GRAPHQL_PORT", "8000"))
     DEBUG = os.getenv("DEBUG", "True").lower() == "true"
     HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", "30"))
 
+    # Pool de conexiones HTTP compartido por todos los repositorios
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    # Los GET idénticos simultáneos comparten una sola petición al backend
+    HTTP_SINGLE_FLIGHT = os.getenv("HTTP_SINGLE_FLIGHT", "True").lower() == "true"
+
+    # Peticiones simultáneas por lote en los DataLoaders
+    DATALOADER_MAX_CONCURRENCY = int(os.getenv("DATALOADER_MAX_CONCURRENCY", "10"))
+
+    # Segundos que el catálogo indexado de animales se considera vigente
+    ANIMAL_CATALOG_TTL = float(os.getenv("ANIMAL_CATALOG_TTL", "30"))
+
+    # Caché de datos de referencia: TTL (segundos, 0 = sin caché) y máximo de entradas por entidad
+    CACHE_REFUGIO_TTL = float(os.getenv("CACHE_REFUGIO_TTL", "300"))
+    CACHE_REFUGIO_MAX_ITEMS = int(os.getenv("CACHE_REFUGIO_MAX_ITEMS", "1000"))
+    CACHE_TIPO_CAMPANIA_TTL = float(os.getenv("CACHE_TIPO_CAMPANIA_TTL", "600"))
+    CACHE_TIPO_CAMPANIA_MAX_ITEMS = int(os.getenv("CACHE_TIPO_CAMPANIA_MAX_ITEMS", "500"))
+    CACHE_ESPECIE_TTL = float(os.getenv("CACHE_ESPECIE_TTL", "600"))
+    CACHE_ESPECIE_MAX_ITEMS = int(os.getenv("CACHE_ESPECIE_MAX_ITEMS", "100"))
+    CACHE_DEFAULT_TTL = float(os.getenv("CACHE_DEFAULT_TTL", "60"))
+    CACHE_DEFAULT_MAX_ITEMS = int(os.getenv("CACHE_DEFAULT_MAX_ITEMS", "1000"))
+
+    # Listados completos (animales, publicaciones, adopciones, voluntarios) con
+    # stale-while-revalidate: hasta el TTL suave se sirven sin más; hasta el TTL
+    # duro se sirven mientras se refrescan en segundo plano (0 = sin caché)
+    LIST_CACHE_SOFT_TTL = float(os.getenv("LIST_CACHE_SOFT_TTL", "5"))
+    LIST_CACHE_HARD_TTL = float(os.getenv("LIST_CACHE_HARD_TTL", "60"))
+
+    # Caché negativa de búsquedas por ID (404): segundos y máximo de IDs recordados
+    NEGATIVE_CACHE_TTL = float(os.getenv("NEGATIVE_CACHE_TTL", "15"))
+    NEGATIVE_CACHE_MAX_ITEMS = int(os.getenv("NEGATIVE_CACHE_MAX_ITEMS", "5000"))
+
+    # POST /internal/invalidate: token compartido con el backend (vacío = deshabilitado),
+    # entradas del registro en memoria y archivo JSONL opcional donde se agregan
+    CACHE_INVALIDATION_TOKEN = os.getenv("CACHE_INVALIDATION_TOKEN", "")
+    CACHE_INVALIDATION_LOG_SIZE = int(os.getenv("CACHE_INVALIDATION_LOG_SIZE", "1000"))
+    CACHE_INVALIDATION_LOG_FILE = os.getenv("CACHE_INVALIDATION_LOG_FILE", "")
+
+    # Paginación por cursor: vigencia de los snapshots indexados y tamaño máximo de página
+    KEYSET_SNAPSHOT_TTL = float(os.getenv("KEYSET_SNAPSHOT_TTL", "30"))
+    CONNECTION_MAX_PAGE_SIZE = int(os.getenv("CONNECTION_MAX_PAGE_SIZE", "100"))
+
+    # Parámetros de consulta que acepta cada ruta del backend (ver app/shared/infrastructure/rest_query.py)
+    REST_PUSHDOWN = os.getenv("REST_PUSHDOWN", "")
+    REST_PUSHDOWN_AUTODETECT = os.getenv("REST_PUSHDOWN_AUTODETECT", "False").lower() == "true"
+    REST_PUSHDOWN_PROBE_ROUTES = os.getenv("REST_PUSHDOWN_PROBE_ROUTES", "animals,campanias")
+
 settings = Settings()
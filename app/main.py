@@ -1,14 +1,54 @@
+import logging
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 from app.schema.schema import schema
 from app.reports.routes import router as reports_router
+from app.shared.interface.internal_routes import router as internal_router
+from app.reports.routes.report_routes import report_service, report_jobs, report_scheduler
+from app.reports.generators import pdf_render_pool
+from app.config.settings import settings
+from app.shared.infrastructure.http_client import init_http_client, close_http_client
+from app.shared.infrastructure.rest_query import capacidades_rest
+from app.shared.infrastructure.negative_cache import cache_no_encontrados
+from app.shared.infrastructure.ttl_cache import cache_listados, cache_referencias
+from app.shared.interface.context import get_context
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Abre y cierra los recursos compartidos del proceso"""
+    client = await init_http_client()
+    if settings.REST_PUSHDOWN_AUTODETECT:
+        await capacidades_rest.detectar_paginacion(
+            client, settings.REST_PUSHDOWN_PROBE_ROUTES.split(",")
+        )
+    try:
+        await report_service.graphql_client.connect()
+    except Exception as e:
+        # Se reintentará en la primera consulta de reportes
+        logger.warning(f"No se pudo abrir la sesión GraphQL de reportes: {e}")
+    await report_jobs.iniciar()
+    await report_scheduler.iniciar()
+    try:
+        yield
+    finally:
+        await report_scheduler.detener()
+        await report_jobs.detener()
+        await report_service.graphql_client.close()
+        pdf_render_pool.shutdown()
+        await close_http_client()
+
 
 app = FastAPI(
     title="Love4Pets GraphQL API",
     version="1.0.0",
-    description="API GraphQL para gestión de refugio animal con generación de reportes PDF"
+    description="API GraphQL para gestión de refugio animal con generación de reportes PDF",
+    lifespan=lifespan
 )
 
 # Configurar CORS
@@ -29,9 +69,21 @@ app.add_middleware(
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/health/cache")
+async def cache_stats():
+    """Aciertos, fallos y desalojos de las cachés de referencia, de listados y de 404"""
+    return {
+        **cache_referencias.estadisticas(),
+        **cache_listados.estadisticas(),
+        cache_no_encontrados.nombre: cache_no_encontrados.estadisticas(),
+    }
+
 # GraphQL endpoint
-graphql_app = GraphQLRouter(schema)
+graphql_app = GraphQLRouter(schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/graphql")
 
 # Reports endpoints
-app.include_router(reports_router)
\ No newline at end of file
+app.include_router(reports_router)
+
+# Avisos de cambios del backend
+app.include_router(internal_router)
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Snapshot de datos para las agregaciones de adopciones.
+
+Se construye una vez por operación con los listados ya descargados y
+calcula todas las métricas del dashboard (totales, mes y año actual,
+ranking de especies y tendencia mensual) en una sola pasada sobre las
+adopciones.
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.modules.adopcion.domain.entities import Adopcion
+from app.modules.animal.domain.entities import Animal
+from app.modules.publicacion.domain.entities import Publicacion
+
+# Adopciones que no cuentan para las estadísticas
+ESTADOS_EXCLUIDOS = {'rechazada', 'rechazado', 'cancelada', 'cancelado'}
+
+
+def especies_por_adopcion(
+    adopciones: List[Adopcion],
+    publicaciones: List[Publicacion],
+    animales: List[Animal]
+) -> Dict[UUID, str]:
+    """
+    Resuelve la especie del animal de cada adopción con hash joins:
+    adopcion.id_publicacion -> publicacion.id_animal -> animal.especie.
+
+    Returns:
+        Diccionario id_adopcion -> nombre de la especie
+    """
+    especie_por_animal = {a.id_animal: a.especie for a in animales if a.especie}
+    especie_por_publicacion = {
+        p.id_publicacion: especie_por_animal[p.id_animal]
+        for p in publicaciones
+        if p.id_animal in especie_por_animal
+    }
+    return {
+        a.id_adopcion: especie_por_publicacion[a.id_publicacion]
+        for a in adopciones
+        if a.id_publicacion in especie_por_publicacion
+    }
+
+
+def _conteos(contador: Counter, total: int) -> List[Dict[str, any]]:
+    """Convierte un Counter en la lista categoria/cantidad/porcentaje"""
+    return [
+        {
+            "categoria": categoria,
+            "cantidad": cantidad,
+            "porcentaje": round((cantidad / total * 100), 2) if total > 0 else 0
+        }
+        for categoria, cantidad in contador.most_common()
+    ]
+
+
+class SnapshotAdopciones:
+    """Métricas de adopciones calculadas en una sola pasada"""
+
+    def __init__(
+        self,
+        adopciones: List[Adopcion],
+        publicaciones: List[Publicacion],
+        animales: List[Animal],
+        meses: int = 12,
+        ahora: Optional[datetime] = None
+    ):
+        ahora = ahora or datetime.now(timezone.utc)
+        primer_dia_mes = ahora.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        primer_dia_anio = primer_dia_mes.replace(month=1)
+        fecha_limite = ahora - timedelta(days=30 * meses)
+
+        completadas = [a for a in adopciones if a.estado and a.estado.lower() not in ESTADOS_EXCLUIDOS]
+        especies = especies_por_adopcion(completadas, publicaciones, animales)
+
+        self.total_adopciones = len(completadas)
+        self.adopciones_mes_actual = 0
+        self.adopciones_anio_actual = 0
+        self._especies = Counter()
+        self._por_mes = Counter()
+        self._especies_por_mes: Dict[str, Counter] = defaultdict(Counter)
+
+        for adopcion in completadas:
+            especie = especies.get(adopcion.id_adopcion)
+            if especie:
+                self._especies[especie] += 1
+
+            if not adopcion.fecha_adopcion:
+                continue
+            # Si la fecha no tiene timezone, asumimos UTC
+            fecha = adopcion.fecha_adopcion
+            if fecha.tzinfo is None:
+                fecha = fecha.replace(tzinfo=timezone.utc)
+
+            if fecha >= primer_dia_mes:
+                self.adopciones_mes_actual += 1
+            if fecha >= primer_dia_anio:
+                self.adopciones_anio_actual += 1
+            if fecha >= fecha_limite:
+                # Formato: "2024-01"
+                periodo = adopcion.fecha_adopcion.strftime("%Y-%m")
+                self._por_mes[periodo] += 1
+                if especie:
+                    self._especies_por_mes[periodo][especie] += 1
+
+    def especies_mas_adoptadas(self) -> List[Dict[str, any]]:
+        """Ranking de especies con conteo y porcentaje sobre las adopciones con especie conocida"""
+        return _conteos(self._especies, sum(self._especies.values()))
+
+    def tendencia_mensual(self) -> List[Dict[str, any]]:
+        """Adopciones por mes dentro de la ventana, ordenadas por periodo"""
+        return [
+            {
+                "periodo": periodo,
+                "total_adopciones": self._por_mes[periodo],
+                "especies_adoptadas": _conteos(self._especies_por_mes[periodo], self._por_mes[periodo])
+            }
+            for periodo in sorted(self._por_mes)
+        ]
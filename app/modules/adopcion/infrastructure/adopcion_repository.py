@@ -2,24 +2,21 @@ import httpx
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_listados
 from app.modules.adopcion.domain.entities import Adopcion, NewAdopcion, UpdateAdopcion
 
 
 class AdopcionRepository:
     """Repositorio para gestionar adopciones mediante REST API"""
     
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self._cache = cache or cache_listados.para("adopciones")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_adopcion(self, data: dict) -> Adopcion:
         """Convierte la respuesta del API REST en una entidad Adopcion"""
@@ -35,21 +32,25 @@ class AdopcionRepository:
     
     async def listar_adopciones(self) -> list[Adopcion]:
         """GET /adopciones - Obtener todas las adopciones"""
-        async with await self._get_client() as client:
-            response = await client.get("/adopciones")
-            response.raise_for_status()
-            adopciones_data = response.json()
-            return [self._parse_adopcion(data) for data in adopciones_data]
-    
+        return list(await self._cache.obtener_o_cargar("*", self._descargar_adopciones))
+
+    async def _descargar_adopciones(self) -> list[Adopcion]:
+        client = self._get_client()
+        response = await client.get("/adopciones")
+        response.raise_for_status()
+        adopciones_data = response.json()
+        return [self._parse_adopcion(data) for data in adopciones_data]
+
+    @recordar_no_encontrados("adopciones")
     async def obtener_adopcion_por_id(self, id_adopcion: UUID) -> Optional[Adopcion]:
         """GET /adopciones/{id} - Obtener una adopción por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/adopciones/{str(id_adopcion)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_adopcion(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        client = self._get_client()
+        try:
+            response = await client.get(f"/adopciones/{str(id_adopcion)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_adopcion(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
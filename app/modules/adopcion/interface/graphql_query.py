@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.adopcion.interface.graphql_type import AdopcionType
 from app.modules.adopcion.application.adopcion_service import AdopcionService
 from app.modules.adopcion.infrastructure.adopcion_repository import AdopcionRepository
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -29,11 +30,9 @@ class AdopcionQuery:
         ]
     
     @strawberry.field
-    async def adopcion(self, id_adopcion: strawberry.ID) -> Optional[AdopcionType]:
+    async def adopcion(self, info: strawberry.Info, id_adopcion: strawberry.ID) -> Optional[AdopcionType]:
         """Obtener una adopción por ID"""
-        adapter = AdopcionRepository()
-        service = AdopcionService(adapter)
-        adopcion = await service.obtener_adopcion_por_id(UUID(id_adopcion))
+        adopcion = await get_loaders(info).adopcion.load(UUID(id_adopcion))
         
         if adopcion is None:
             return None
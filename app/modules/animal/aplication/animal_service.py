@@ -1,64 +1,50 @@
 from app.modules.animal.infraestructure.animal_repository import AnimalRepository
+from app.modules.animal.infraestructure.animal_catalog import AnimalCatalog, animal_catalog
 from app.modules.animal.domain.entities import Animal
+from app.shared.infrastructure.keyset import PaginaKeyset
+from app.shared.infrastructure.rest_query import capacidades_rest
 from uuid import UUID
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 
 class AnimalService:
-    def __init__(self, repo: AnimalRepository):
+    def __init__(self, repo: AnimalRepository, catalog: Optional[AnimalCatalog] = None):
         self.repo = repo
+        self.catalog = catalog or animal_catalog
 
     async def obtener_animales(self) -> List[Animal]:
-        return await self.repo.listar_animales()
+        return await self.catalog.listar()
 
     async def obtener_animal_por_id(self, id_animal: UUID) -> Optional[Animal]:
+        animal = await self.catalog.obtener(id_animal)
+        if animal is not None:
+            return animal
+        # Puede ser un animal creado después del último refresco del catálogo
         return await self.repo.obtener_animal_por_id(id_animal)
     
     async def obtener_animales_por_especie(self, id_especie: UUID) -> List[Animal]:
         """Obtener animales filtrados por especie"""
-        todos_animales = await self.repo.listar_animales()
-        return [animal for animal in todos_animales if animal.id_especie == id_especie]
+        return await self.catalog.por_especie(id_especie)
     
     async def obtener_animales_por_refugio(self, id_refugio: UUID) -> List[Animal]:
         """Obtener animales filtrados por refugio"""
-        todos_animales = await self.repo.listar_animales()
-        return [animal for animal in todos_animales if animal.id_refugio == id_refugio]
+        return await self.catalog.por_refugio(id_refugio)
     
     async def obtener_animales_por_estado_adopcion(self, estado: str) -> List[Animal]:
         """Obtener animales filtrados por estado de adopción"""
-        todos_animales = await self.repo.listar_animales()
-        return [animal for animal in todos_animales if animal.estado_adopcion == estado]
+        return await self.catalog.por_estado_adopcion(estado)
     
-    async def buscar_animales_por_nombre(self, nombre: str) -> List[Animal]:
-        """Buscar animales por nombre (búsqueda parcial, case-insensitive)"""
-        todos_animales = await self.repo.listar_animales()
-        nombre_lower = nombre.lower()
-        return [
-            animal for animal in todos_animales 
-            if animal.nombre and nombre_lower in animal.nombre.lower()
-        ]
+    async def buscar_animales_por_nombre(self, nombre: str, modo: str = "contiene", umbral: float = 0.3) -> List[Animal]:
+        """
+        Buscar animales por nombre (case-insensitive y sin acentos).
+        modo: "contiene" (parcial), "prefijo" o "difuso" (ordenado por similitud)
+        """
+        return await self.catalog.buscar_por_nombre(nombre, modo, umbral)
     
     async def obtener_animales_por_rango_edad(self, edad_min: Optional[int] = None, edad_max: Optional[int] = None) -> List[Animal]:
         """Filtrar animales por rango de edad (ambos parámetros opcionales)"""
-        todos_animales = await self.repo.listar_animales()
-        
-        resultado = []
-        for animal in todos_animales:
-            # Si no tiene edad, no incluir en resultados filtrados
-            if animal.edad is None:
-                continue
-            
-            # Verificar edad mínima
-            if edad_min is not None and animal.edad < edad_min:
-                continue
-            
-            # Verificar edad máxima
-            if edad_max is not None and animal.edad > edad_max:
-                continue
-            
-            resultado.append(animal)
-        
-        return resultado
+        # Los animales sin edad no forman parte del índice de edades
+        return await self.catalog.por_rango_edad(edad_min, edad_max)
     
     async def obtener_animales_filtrados(
         self,
@@ -73,44 +59,14 @@ class AnimalService:
         Filtrar animales con múltiples criterios combinados.
         Todos los parámetros son opcionales.
         """
-        todos_animales = await self.repo.listar_animales()
-        
-        resultado = []
-        for animal in todos_animales:
-            # Filtro por nombre (búsqueda parcial, case-insensitive)
-            if nombre:
-                if not animal.nombre or nombre.lower() not in animal.nombre.lower():
-                    continue
-            
-            # Filtro por especie
-            if id_especie:
-                if animal.id_especie != id_especie:
-                    continue
-            
-            # Filtro por refugio
-            if id_refugio:
-                if animal.id_refugio != id_refugio:
-                    continue
-            
-            # Filtro por estado de adopción
-            if estado_adopcion:
-                if animal.estado_adopcion != estado_adopcion:
-                    continue
-            
-            # Filtro por edad mínima
-            if edad_min is not None:
-                if animal.edad is None or animal.edad < edad_min:
-                    continue
-            
-            # Filtro por edad máxima
-            if edad_max is not None:
-                if animal.edad is None or animal.edad > edad_max:
-                    continue
-            
-            # Si pasó todos los filtros, agregarlo
-            resultado.append(animal)
-        
-        return resultado
+        return await self.catalog.filtrar(
+            nombre=nombre,
+            id_especie=id_especie,
+            id_refugio=id_refugio,
+            estado_adopcion=estado_adopcion,
+            edad_min=edad_min,
+            edad_max=edad_max
+        )
     
     async def obtener_animales_paginados(
         self,
@@ -126,28 +82,55 @@ class AnimalService:
         """
         Obtener animales con paginación y filtros opcionales.
         Retorna un diccionario con los resultados paginados y metadata.
+        
+        Si la ruta /animals soporta todos los filtros y la paginación, se pide
+        solo la página al backend, esté o no vigente el catálogo, para que el
+        resultado no dependa de la edad de la caché. En otro caso se recurre
+        al catálogo (que descarga la lista completa una vez por TTL).
+        
+        Si el backend no informa X-Total-Count, `total_count` y `total_pages`
+        se devuelven como None: solo se conocería una cota inferior.
         """
+        filtros = {
+            "nombre": nombre or None,
+            "id_especie": id_especie,
+            "id_refugio": id_refugio,
+            "estado_adopcion": estado_adopcion or None,
+            "edad_min": edad_min,
+            "edad_max": edad_max
+        }
+        
+        if limit > 0:
+            # Se pide un elemento extra para saber si hay más páginas
+            plan = capacidades_rest.planificar("/animals", limit + 1, offset, filtros)
+            if plan.delegada:
+                animales, total = await self.repo.listar_animales_consulta(plan.params)
+                has_more = len(animales) > limit
+                animales_paginados = animales[:limit]
+                return self._pagina(animales_paginados, total, has_more, limit, offset)
+        
         # Primero obtener todos los animales filtrados
-        animales_filtrados = await self.obtener_animales_filtrados(
-            nombre=nombre,
-            id_especie=id_especie,
-            id_refugio=id_refugio,
-            estado_adopcion=estado_adopcion,
-            edad_min=edad_min,
-            edad_max=edad_max
-        )
+        animales_filtrados = await self.obtener_animales_filtrados(**filtros)
         
         # Calcular metadata de paginación
         total_count = len(animales_filtrados)
         has_more = offset + limit < total_count
-        total_pages = (total_count + limit - 1) // limit if limit > 0 else 0
-        current_page = (offset // limit) + 1 if limit > 0 else 1
         
         # Aplicar paginación
         animales_paginados = animales_filtrados[offset:offset + limit]
         
+        return self._pagina(animales_paginados, total_count, has_more, limit, offset)
+    
+    def _pagina(self, animales: List[Animal], total_count: Optional[int], has_more: bool, limit: int, offset: int) -> dict:
+        """Arma la respuesta paginada con su metadata (total None si se desconoce)"""
+        if total_count is None:
+            total_pages = None
+        else:
+            total_pages = (total_count + limit - 1) // limit if limit > 0 else 0
+        current_page = (offset // limit) + 1 if limit > 0 else 1
+        
         return {
-            "animales": animales_paginados,
+            "animales": animales,
             "total_count": total_count,
             "has_more": has_more,
             "total_pages": total_pages,
@@ -156,41 +139,63 @@ class AnimalService:
             "offset": offset
         }
     
+    async def paginar_animales(
+        self,
+        orden: str = "nombre",
+        descendente: bool = False,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        nombre: Optional[str] = None,
+        id_especie: Optional[UUID] = None,
+        id_refugio: Optional[UUID] = None,
+        estado_adopcion: Optional[str] = None,
+        edad_min: Optional[int] = None,
+        edad_max: Optional[int] = None
+    ) -> Tuple[PaginaKeyset[Animal], Callable[[], Awaitable[int]]]:
+        """
+        Página por cursor (keyset) sobre el catálogo indexado.
+        Devuelve la página y una función que entrega el total filtrado.
+        """
+        return await self.catalog.pagina(
+            orden, descendente, first, after, last, before,
+            nombre=nombre or None,
+            id_especie=id_especie,
+            id_refugio=id_refugio,
+            estado_adopcion=estado_adopcion or None,
+            edad_min=edad_min,
+            edad_max=edad_max
+        )
+    
     async def obtener_animales_ordenados(
         self,
         order_by: str = "nombre",
-        order: str = "asc"
+        order: str = "asc",
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Animal]:
         """
-        Obtener animales ordenados por un campo específico.
+        Obtener animales ordenados por uno o varios campos.
         
         Args:
-            order_by: Campo por el cual ordenar ("nombre", "edad", "fecha_creacion")
+            order_by: Campos separados por coma ("nombre", "edad", "fecha_creacion");
+                un "-" delante invierte el sentido de ese campo (ej. "edad,-nombre")
             order: Dirección del ordenamiento ("asc" o "desc")
+            limit: Cantidad máxima de resultados (None = todos)
+            offset: Cantidad de resultados a saltar
         
         Returns:
             Lista de animales ordenados
         """
-        todos_animales = await self.repo.listar_animales()
-        
-        # Determinar función de ordenamiento según el campo
-        if order_by == "nombre":
-            key_func = lambda animal: (animal.nombre or "").lower()
-        elif order_by == "edad":
-            # Poner None al final en ambos casos
-            key_func = lambda animal: (animal.edad if animal.edad is not None else float('inf'))
-        elif order_by == "fecha_creacion":
-            # Ordenar por fecha de creación (más recientes primero si desc)
-            key_func = lambda animal: animal.fecha_creacion if animal.fecha_creacion else ""
-        else:
-            # Por defecto, ordenar por nombre
-            key_func = lambda animal: (animal.nombre or "").lower()
-        
-        # Ordenar
-        animales_ordenados = sorted(
-            todos_animales,
-            key=key_func,
-            reverse=(order.lower() == "desc")
-        )
+        descendente = order.lower() == "desc"
+        criterios = []
+        for campo in (c.strip() for c in order_by.split(",")):
+            if not campo:
+                continue
+            if campo.startswith("-"):
+                criterios.append((campo[1:], not descendente))
+            else:
+                criterios.append((campo, descendente))
         
-        return animales_ordenados
\ No newline at end of file
+        return await self.catalog.ordenar(criterios or [("nombre", descendente)], limit, offset)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID, uuid4
 from typing import Optional, List
 
@@ -14,6 +15,7 @@ class Animal:
     fotos: Optional[List[str]]
     estado_adopcion: Optional[str]
     id_refugio: Optional[UUID]
+    fecha_creacion: Optional[datetime] = None
 
 @dataclass
 class NewAnimal:
@@ -0,0 +1,388 @@
+"""
+Catálogo indexado de animales en memoria.
+
+Mantiene una instantánea de `GET /animals` con índices para que los filtros
+de `AnimalService` no recorran toda la lista en cada request:
+
+- índices hash por `id_especie`, `id_refugio` y `estado_adopcion`
+- índice ordenado por `edad` para rangos con `bisect`
+- mapa por `id_animal` para búsquedas puntuales
+- índices ordenados por `nombre`, `edad` y `fecha_creacion` para listados
+  ordenados y paginación por cursor
+- índice de n-gramas sobre `nombre` (sin acentos ni mayúsculas) para búsquedas
+
+La instantánea se refresca cuando vence su TTL o bajo demanda con
+`refrescar()` / `invalidar()`. Cada lectura informa su antigüedad (la del
+listado al cargarla más el tiempo desde entonces) a `extensions.cache`.
+"""
+
+import asyncio
+import heapq
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.config.settings import settings
+from app.modules.animal.domain.entities import Animal
+from app.modules.animal.infraestructure.animal_repository import AnimalRepository
+from app.shared.infrastructure.keyset import IndiceKeyset, PaginaKeyset, clave_orden
+from app.shared.infrastructure.trigram_index import IndiceTrigramas, normalizar
+from app.shared.infrastructure.ttl_cache import cargar_con_edad, registrar_edad
+
+# Campos por los que se puede paginar con cursor
+ORDENES_ANIMAL = {
+    "nombre": lambda a: a.nombre,
+    "edad": lambda a: a.edad,
+    "fecha_creacion": lambda a: a.fecha_creacion,
+}
+
+
+class _ClaveCompuesta:
+    """
+    Clave de orden con varios criterios, cada uno con su propio sentido.
+    Los nulos van siempre al final de su criterio.
+    """
+    __slots__ = ("partes",)
+
+    def __init__(self, partes: List[Tuple[tuple, bool]]):
+        self.partes = partes
+
+    def __lt__(self, otra: "_ClaveCompuesta") -> bool:
+        for (a, descendente), (b, _) in zip(self.partes, otra.partes):
+            if a == b:
+                continue
+            if a[0] != b[0]:
+                return a[0] < b[0]
+            return a[1] > b[1] if descendente else a[1] < b[1]
+        return False
+
+
+class _IndicesAnimales:
+    """Índices inmutables construidos a partir de una lista de animales"""
+
+    def __init__(self, animales: List[Animal]):
+        self.animales = animales
+        self.por_id: Dict[UUID, int] = {}
+        self.por_especie: Dict[UUID, Set[int]] = defaultdict(set)
+        self.por_refugio: Dict[UUID, Set[int]] = defaultdict(set)
+        self.por_estado: Dict[str, Set[int]] = defaultdict(set)
+
+        con_edad = []
+        for posicion, animal in enumerate(animales):
+            self.por_id[animal.id_animal] = posicion
+            if animal.id_especie is not None:
+                self.por_especie[animal.id_especie].add(posicion)
+            if animal.id_refugio is not None:
+                self.por_refugio[animal.id_refugio].add(posicion)
+            if animal.estado_adopcion is not None:
+                self.por_estado[animal.estado_adopcion].add(posicion)
+            if animal.edad is not None:
+                con_edad.append((animal.edad, posicion))
+
+        con_edad.sort()
+        self.edades = [edad for edad, _ in con_edad]
+        self.posiciones_por_edad = [posicion for _, posicion in con_edad]
+        self.ordenados: Dict[str, IndiceKeyset[Animal]] = {
+            orden: IndiceKeyset(animales, lambda a, valor_de=valor_de: clave_orden(valor_de(a), a.id_animal))
+            for orden, valor_de in ORDENES_ANIMAL.items()
+        }
+        self.nombres = IndiceTrigramas([animal.nombre for animal in animales])
+        # Totales por filtro, calculados solo cuando se piden
+        self.conteos: Dict[tuple, int] = {}
+
+    def ordenado(self, orden: str) -> IndiceKeyset[Animal]:
+        """Índice ordenado por `orden`"""
+        if orden not in self.ordenados:
+            raise ValueError(f"Orden no soportado: {orden}. Opciones: {', '.join(ORDENES_ANIMAL)}")
+        return self.ordenados[orden]
+
+    def rango_edad(self, edad_min: Optional[int], edad_max: Optional[int]) -> Set[int]:
+        """Posiciones de los animales con edad dentro de [edad_min, edad_max]"""
+        inicio = bisect_left(self.edades, edad_min) if edad_min is not None else 0
+        fin = bisect_right(self.edades, edad_max) if edad_max is not None else len(self.edades)
+        return set(self.posiciones_por_edad[inicio:fin])
+
+    def materializar(self, posiciones: Set[int]) -> List[Animal]:
+        """Devuelve los animales en el mismo orden que entrega el backend"""
+        return [self.animales[posicion] for posicion in sorted(posiciones)]
+
+
+class AnimalCatalog:
+    """Catálogo de animales con refresco por TTL compartido por todo el proceso"""
+
+    def __init__(
+        self,
+        repo: Optional[AnimalRepository] = None,
+        ttl: Optional[float] = None,
+        nombre: str = "animales"
+    ):
+        self.repo = repo or AnimalRepository()
+        self.ttl = settings.ANIMAL_CATALOG_TTL if ttl is None else ttl
+        # Nombre con el que se informa la antigüedad (el del listado de origen)
+        self.nombre = nombre
+        self._indices: Optional[_IndicesAnimales] = None
+        self._cargado_en = 0.0
+        # Momento en que el backend entregó los datos de la instantánea
+        self._datos_desde = 0.0
+        self._obsoleta = False
+        # Cambia con cada invalidación: una recarga iniciada antes queda vencida
+        self._generacion = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def vigente(self) -> bool:
+        """True si hay una instantánea cargada y su TTL no ha vencido"""
+        return self._indices is not None and (time.monotonic() - self._cargado_en) < self.ttl
+
+    async def _obtener_indices(self) -> _IndicesAnimales:
+        """Devuelve los índices vigentes, recargándolos si el TTL venció"""
+        if not self.vigente:
+            async with self._lock:
+                # Otro request pudo haber recargado mientras esperábamos el lock
+                if not self.vigente:
+                    await self._recargar()
+        registrar_edad(self.nombre, time.monotonic() - self._datos_desde, self._obsoleta)
+        return self._indices
+
+    async def _recargar(self) -> None:
+        generacion = self._generacion
+        animales, edad, obsoleta = await cargar_con_edad(self.repo.listar_animales)
+        datos_desde = time.monotonic() - edad
+        # Construir los índices fuera del event loop: con catálogos grandes
+        # el índice de n-gramas tarda lo suficiente como para bloquearlo
+        self._indices = await asyncio.to_thread(_IndicesAnimales, animales)
+        self._datos_desde, self._obsoleta = datos_desde, obsoleta
+        self._cargado_en = time.monotonic() if generacion == self._generacion else 0.0
+
+    async def refrescar(self) -> None:
+        """Fuerza la recarga inmediata del catálogo"""
+        async with self._lock:
+            await self._recargar()
+
+    def invalidar(self) -> None:
+        """Marca el catálogo como vencido; se recarga en el próximo acceso"""
+        self._generacion += 1
+        self._cargado_en = 0.0
+
+    async def listar(self) -> List[Animal]:
+        """Todos los animales del catálogo"""
+        indices = await self._obtener_indices()
+        return list(indices.animales)
+
+    async def obtener(self, id_animal: UUID) -> Optional[Animal]:
+        """Búsqueda puntual por ID; None si no está en el catálogo"""
+        indices = await self._obtener_indices()
+        posicion = indices.por_id.get(id_animal)
+        return indices.animales[posicion] if posicion is not None else None
+
+    async def por_especie(self, id_especie: UUID) -> List[Animal]:
+        indices = await self._obtener_indices()
+        return indices.materializar(indices.por_especie.get(id_especie, set()))
+
+    async def por_refugio(self, id_refugio: UUID) -> List[Animal]:
+        indices = await self._obtener_indices()
+        return indices.materializar(indices.por_refugio.get(id_refugio, set()))
+
+    async def por_estado_adopcion(self, estado: str) -> List[Animal]:
+        indices = await self._obtener_indices()
+        return indices.materializar(indices.por_estado.get(estado, set()))
+
+    async def buscar_por_nombre(self, nombre: str, modo: str = "contiene", umbral: float = 0.3) -> List[Animal]:
+        """
+        Búsqueda por nombre ignorando acentos y mayúsculas.
+
+        Modos: "contiene" (subcadena), "prefijo" o "difuso" (similitud de
+        trigramas >= umbral, ordenado de más a menos parecido).
+        """
+        indices = await self._obtener_indices()
+        if modo == "contiene":
+            return indices.materializar(indices.nombres.contiene(nombre))
+        if modo == "prefijo":
+            return indices.materializar(indices.nombres.prefijo(nombre))
+        if modo == "difuso":
+            return [indices.animales[posicion] for posicion, _ in indices.nombres.similares(nombre, umbral)]
+        raise ValueError(f"Modo de búsqueda no soportado: {modo}. Opciones: contiene, prefijo, difuso")
+
+    async def por_rango_edad(self, edad_min: Optional[int] = None, edad_max: Optional[int] = None) -> List[Animal]:
+        indices = await self._obtener_indices()
+        return indices.materializar(indices.rango_edad(edad_min, edad_max))
+
+    async def ordenar(
+        self,
+        criterios: List[Tuple[str, bool]],
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Animal]:
+        """
+        Animales ordenados por `criterios` ([(campo, descendente), ...]).
+
+        Con un solo criterio se lee directamente del índice ordenado, en
+        O(offset + limit). Con varios se usa un heap acotado (top-k) de
+        tamaño offset + limit, o un sort completo si no hay límite. Los
+        nulos van al final y los empates se resuelven por id, en el sentido
+        del último criterio.
+
+        Raises:
+            ValueError: Si un campo no se puede ordenar o `limit`/`offset`
+                son negativos
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("'limit' no puede ser negativo")
+        if offset < 0:
+            raise ValueError("'offset' no puede ser negativo")
+        indices = await self._obtener_indices()
+        for campo, _ in criterios:
+            indices.ordenado(campo)
+        fin = None if limit is None else offset + limit
+
+        if len(criterios) == 1:
+            campo, descendente = criterios[0]
+            return indices.ordenado(campo).rebanada(offset, fin, descendente)
+
+        def clave(animal: Animal) -> _ClaveCompuesta:
+            partes = [(clave_orden(ORDENES_ANIMAL[campo](animal), "")[:2], descendente) for campo, descendente in criterios]
+            partes.append(((0, str(animal.id_animal)), criterios[-1][1]))
+            return _ClaveCompuesta(partes)
+
+        if fin is None:
+            return sorted(indices.animales, key=clave)[offset:]
+        return heapq.nsmallest(fin, indices.animales, key=clave)[offset:]
+
+    async def filtrar(
+        self,
+        nombre: Optional[str] = None,
+        id_especie: Optional[UUID] = None,
+        id_refugio: Optional[UUID] = None,
+        estado_adopcion: Optional[str] = None,
+        edad_min: Optional[int] = None,
+        edad_max: Optional[int] = None
+    ) -> List[Animal]:
+        """
+        Filtro combinado: intersecta los conjuntos candidatos de cada índice,
+        empezando por el más pequeño; el nombre se resuelve con el índice de
+        n-gramas.
+        """
+        indices = await self._obtener_indices()
+        posiciones = self._posiciones_filtradas(
+            indices, nombre, id_especie, id_refugio, estado_adopcion, edad_min, edad_max
+        )
+        return indices.materializar(posiciones)
+
+    async def pagina(
+        self,
+        orden: str = "nombre",
+        descendente: bool = False,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        **filtros
+    ) -> Tuple[PaginaKeyset[Animal], Callable[[], Awaitable[int]]]:
+        """
+        Página por cursor sobre el índice ordenado por `orden`.
+
+        Devuelve la página y una función que entrega el total de animales que
+        cumplen los filtros. Los filtros se evalúan animal por animal mientras
+        se recorre el índice, así que la página solo visita lo necesario; el
+        total recorre el catálogo únicamente si se pide, y queda cacheado por
+        filtro hasta la próxima recarga.
+        """
+        indices = await self._obtener_indices()
+        indice = indices.ordenado(orden)
+
+        if not any(valor is not None for valor in filtros.values()):
+            pagina = indice.pagina(first, after, last, before, descendente)
+
+            async def total() -> int:
+                return len(indices.animales)
+
+            return pagina, total
+
+        pagina = indice.pagina(
+            first, after, last, before, descendente,
+            incluir=self._predicado(indices, **filtros)
+        )
+
+        async def contar() -> int:
+            clave = tuple(sorted(filtros.items()))
+            if clave not in indices.conteos:
+                indices.conteos[clave] = len(self._posiciones_filtradas(indices, **filtros))
+            return indices.conteos[clave]
+
+        return pagina, contar
+
+    @staticmethod
+    def _predicado(
+        indices: _IndicesAnimales,
+        nombre: Optional[str] = None,
+        id_especie: Optional[UUID] = None,
+        id_refugio: Optional[UUID] = None,
+        estado_adopcion: Optional[str] = None,
+        edad_min: Optional[int] = None,
+        edad_max: Optional[int] = None
+    ) -> Callable[[Animal], bool]:
+        """Mismo criterio que `_posiciones_filtradas`, evaluado para un animal"""
+        consulta = normalizar(nombre) if nombre else None
+
+        def incluir(animal: Animal) -> bool:
+            if id_especie and animal.id_especie != id_especie:
+                return False
+            if id_refugio and animal.id_refugio != id_refugio:
+                return False
+            if estado_adopcion and animal.estado_adopcion != estado_adopcion:
+                return False
+            if edad_min is not None or edad_max is not None:
+                if animal.edad is None:
+                    return False
+                if edad_min is not None and animal.edad < edad_min:
+                    return False
+                if edad_max is not None and animal.edad > edad_max:
+                    return False
+            if consulta is not None:
+                texto = indices.nombres.textos[indices.por_id[animal.id_animal]]
+                if not texto or consulta not in texto:
+                    return False
+            return True
+
+        return incluir
+
+    @staticmethod
+    def _posiciones_filtradas(
+        indices: _IndicesAnimales,
+        nombre: Optional[str] = None,
+        id_especie: Optional[UUID] = None,
+        id_refugio: Optional[UUID] = None,
+        estado_adopcion: Optional[str] = None,
+        edad_min: Optional[int] = None,
+        edad_max: Optional[int] = None
+    ) -> Set[int]:
+        candidatos: List[Set[int]] = []
+        if id_especie:
+            candidatos.append(indices.por_especie.get(id_especie, set()))
+        if id_refugio:
+            candidatos.append(indices.por_refugio.get(id_refugio, set()))
+        if estado_adopcion:
+            candidatos.append(indices.por_estado.get(estado_adopcion, set()))
+        if edad_min is not None or edad_max is not None:
+            candidatos.append(indices.rango_edad(edad_min, edad_max))
+
+        if candidatos:
+            candidatos.sort(key=len)
+            posiciones = set(candidatos[0])
+            for conjunto in candidatos[1:]:
+                if not posiciones:
+                    break
+                posiciones &= conjunto
+        else:
+            posiciones = set(range(len(indices.animales)))
+
+        if nombre:
+            posiciones &= indices.nombres.contiene(nombre)
+
+        return posiciones
+
+
+# Instancia compartida por todo el proceso
+animal_catalog = AnimalCatalog()
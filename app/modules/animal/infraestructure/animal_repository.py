@@ -1,7 +1,10 @@
 import httpx
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
-from app.config.settings import settings
+from datetime import datetime
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_listados
 from app.modules.animal.domain.entities import Animal, NewAnimal, UpdateAnimal
 
 
@@ -9,17 +12,12 @@ from app.modules.animal.domain.entities import Animal, NewAnimal, UpdateAnimal
 class AnimalRepository:
     """Repositorio para gestionar animales mediante REST API"""
     
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-
-    async def _get_animal(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self._cache = cache or cache_listados.para("animales")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_animal(self, data: dict) -> Animal:
         """Convierte la respuesta del API REST en una entidad Animal"""
@@ -33,27 +31,52 @@ class AnimalRepository:
             descripcion=data.get("descripcion"),
             fotos=data.get("fotos"),
             estado_adopcion=data.get("estado_adopcion"),
-            id_refugio=UUID(data["id_refugio"]) if data.get("id_refugio") and isinstance(data["id_refugio"], str) else data.get("id_refugio")
-
+            id_refugio=UUID(data["id_refugio"]) if data.get("id_refugio") and isinstance(data["id_refugio"], str) else data.get("id_refugio"),
+            fecha_creacion=self._parse_fecha(data.get("fecha_creacion") or data.get("created_at"))
         )
 
+    @staticmethod
+    def _parse_fecha(valor) -> Optional[datetime]:
+        """Convierte una fecha ISO 8601 del backend (acepta sufijo Z)"""
+        if not valor or not isinstance(valor, str):
+            return valor or None
+        return datetime.fromisoformat(valor.replace("Z", "+00:00"))
+
     async def listar_animales(self) -> list[Animal]:
         """GET /animals - Obtener todos los animales"""
-        async with await self._get_animal() as client:
-            response = await client.get("/animals")
-            response.raise_for_status()
-            animales_data = response.json()
-            return [self._parse_animal(data) for data in animales_data]
+        return list(await self._cache.obtener_o_cargar("*", self._descargar_animales))
+
+    async def _descargar_animales(self) -> list[Animal]:
+        client = self._get_client()
+        response = await client.get("/animals")
+        response.raise_for_status()
+        animales_data = response.json()
+        return [self._parse_animal(data) for data in animales_data]
 
+    async def listar_animales_consulta(self, params: Dict[str, Any]) -> tuple[list[Animal], Optional[int]]:
+        """
+        GET /animals?... - Listado con filtros y paginación resueltos por el backend.
+        
+        Returns:
+            Tuple con (animales, total informado en X-Total-Count o None)
+        """
+        client = self._get_client()
+        response = await client.get("/animals", params=params)
+        response.raise_for_status()
+        animales_data = response.json()
+        total = response.headers.get("X-Total-Count")
+        return [self._parse_animal(data) for data in animales_data], int(total) if total and total.isdigit() else None
+
+    @recordar_no_encontrados("animals")
     async def obtener_animal_por_id(self, id_animal: UUID) -> Optional[Animal]:
         """GET /animals/{id} - Obtener un animal por ID"""
-        async with await self._get_animal() as client:
-            try:
-                response = await client.get(f"/animals/{str(id_animal)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_animal(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
\ No newline at end of file
+        client = self._get_client()
+        try:
+            response = await client.get(f"/animals/{str(id_animal)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_animal(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
\ No newline at end of file
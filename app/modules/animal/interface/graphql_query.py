@@ -4,6 +4,8 @@ from uuid import UUID
 from app.modules.animal.interface.graphql_type import AnimalType, AnimalesPaginadosType
 from app.modules.animal.aplication.animal_service import AnimalService
 from app.modules.animal.infraestructure.animal_repository import AnimalRepository
+from app.shared.interface.connection import Connection, crear_conexion, validar_argumentos
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -29,15 +31,14 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]   
 
     @strawberry.field
-    async def animal(self, id_animal: strawberry.ID) -> Optional[AnimalType]:
+    async def animal(self, info: strawberry.Info, id_animal: strawberry.ID) -> Optional[AnimalType]:
         """Obtener un animal específico por ID"""
-        adapter = AnimalRepository()
-        service = AnimalService(adapter)
-        animal = await service.obtener_animal_por_id(UUID(id_animal))
+        animal = await get_loaders(info).animal.load(UUID(id_animal))
         
         if animal is None:
             return None
@@ -52,7 +53,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         )
 
     @strawberry.field
@@ -71,7 +73,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
 
     @strawberry.field
@@ -90,7 +93,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
 
     @strawberry.field
@@ -109,15 +113,28 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
     
     @strawberry.field
-    async def buscar_animales(self, nombre: str) -> List[AnimalType]:
-        """Buscar animales por nombre (búsqueda parcial, case-insensitive)"""
+    async def buscar_animales(
+        self,
+        nombre: str,
+        modo: str = "contiene",
+        umbral: float = 0.3
+    ) -> List[AnimalType]:
+        """
+        Buscar animales por nombre (case-insensitive, ignora acentos).
+        
+        Parámetros:
+        - modo: "contiene" (búsqueda parcial), "prefijo" o "difuso"
+        - umbral: similitud mínima (0-1) para el modo "difuso"; los
+          resultados difusos vienen ordenados del más parecido al menos
+        """
         adapter = AnimalRepository()
         service = AnimalService(adapter)
-        animales = await service.buscar_animales_por_nombre(nombre)
+        animales = await service.buscar_animales_por_nombre(nombre, modo, umbral)
         return [AnimalType(
             id_animal=strawberry.ID(str(animal.id_animal)),
             nombre=animal.nombre,
@@ -128,7 +145,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
     
     @strawberry.field
@@ -151,7 +169,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
     
     @strawberry.field
@@ -194,7 +213,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
     
     @strawberry.field
@@ -241,7 +261,8 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in resultado["animales"]]
         
         return AnimalesPaginadosType(
@@ -258,26 +279,33 @@ class AnimalQuery:
     async def animales_ordenados(
         self,
         order_by: str = "nombre",
-        order: str = "asc"
+        order: str = "asc",
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[AnimalType]:
         """
-        Obtener animales ordenados por un campo específico.
+        Obtener animales ordenados por uno o varios campos.
         
         Parámetros:
-        - order_by: Campo para ordenar ("nombre", "edad", "fecha_creacion")
+        - order_by: Campos para ordenar ("nombre", "edad", "fecha_creacion"),
+          separados por coma; "-campo" invierte el sentido de ese campo
         - order: Dirección ("asc" o "desc")
+        - limit/offset: Página a devolver (sin limit se devuelven todos; no pueden ser negativos)
         
         Ejemplos:
         - order_by="nombre", order="asc" → A-Z
         - order_by="edad", order="desc" → Más viejos primero
-        - order_by="fecha_creacion", order="desc" → Más recientes primero
+        - order_by="fecha_creacion", order="desc", limit=10 → Los 10 más recientes
+        - order_by="edad,-nombre" → Por edad y, a igual edad, Z-A
         """
         adapter = AnimalRepository()
         service = AnimalService(adapter)
         
         animales = await service.obtener_animales_ordenados(
             order_by=order_by,
-            order=order
+            order=order,
+            limit=limit,
+            offset=offset
         )
         
         return [AnimalType(
@@ -290,7 +318,69 @@ class AnimalQuery:
             descripcion=animal.descripcion,
             fotos=animal.fotos,
             estado_adopcion=animal.estado_adopcion,
-            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
         ) for animal in animales]
 
-
+    @strawberry.field
+    async def animales_conexion(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        order_by: str = "nombre",
+        order: str = "asc",
+        nombre: Optional[str] = None,
+        id_especie: Optional[strawberry.ID] = None,
+        id_refugio: Optional[strawberry.ID] = None,
+        estado_adopcion: Optional[str] = None,
+        edad_min: Optional[int] = None,
+        edad_max: Optional[int] = None
+    ) -> Connection[AnimalType]:
+        """
+        Paginación por cursor (estilo Relay) con filtros opcionales.
+        
+        Parámetros:
+        - first/after: siguientes elementos después del cursor
+        - last/before: elementos anteriores al cursor
+        - order_by: "nombre", "edad" o "fecha_creacion"; order: "asc" o "desc"
+        
+        Los cursores solo son válidos con el mismo order_by. Los animales sin
+        valor en el campo de orden van al final en ambos sentidos.
+        """
+        validar_argumentos(first, last)
+        if first is None and last is None:
+            first = 20
+        
+        adapter = AnimalRepository()
+        service = AnimalService(adapter)
+        
+        pagina, contar = await service.paginar_animales(
+            orden=order_by,
+            descendente=order.lower() == "desc",
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+            nombre=nombre,
+            id_especie=UUID(id_especie) if id_especie else None,
+            id_refugio=UUID(id_refugio) if id_refugio else None,
+            estado_adopcion=estado_adopcion,
+            edad_min=edad_min,
+            edad_max=edad_max
+        )
+        
+        return crear_conexion(pagina, lambda animal: AnimalType(
+            id_animal=strawberry.ID(str(animal.id_animal)),
+            nombre=animal.nombre,
+            id_especie=strawberry.ID(str(animal.id_especie)) if animal.id_especie else None,
+            especie=animal.especie,
+            edad=animal.edad,
+            estado=animal.estado,
+            descripcion=animal.descripcion,
+            fotos=animal.fotos,
+            estado_adopcion=animal.estado_adopcion,
+            id_refugio=strawberry.ID(str(animal.id_refugio)) if animal.id_refugio else None,
+            fecha_creacion=animal.fecha_creacion
+        ), contar)
@@ -1,4 +1,5 @@
 import strawberry
+from datetime import datetime
 from uuid import UUID
 from typing import Optional, List
 
@@ -14,14 +15,15 @@ class AnimalType:
     fotos: Optional[List[str]]
     estado_adopcion: Optional[str]
     id_refugio: Optional[UUID]
+    fecha_creacion: Optional[datetime] = None
 
 @strawberry.type
 class AnimalesPaginadosType:
     """Tipo de respuesta para queries con paginación"""
     animales: List[AnimalType]
-    total_count: int
+    total_count: Optional[int]  # None si el backend no informa el total
     has_more: bool
-    total_pages: int
+    total_pages: Optional[int]
     current_page: int
     limit: int
     offset: int
@@ -1,14 +1,34 @@
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional, Tuple
 from uuid import UUID
 from app.modules.campania.domain.entitie import Campania
 from app.modules.campania.infrastructure.campania_respository import CampaniaRepository
+from app.modules.campania.infrastructure.campania_catalog import campania_catalog
+from app.shared.infrastructure.keyset import PaginaKeyset
 
 class CampaniaApplicationService:
     def __init__(self):
         self.repo = CampaniaRepository()
+        self.catalog = campania_catalog
 
     async def obtener_campania(self, id_campania: UUID) -> Optional[Campania]:
         return await self.repo.obtener_campania_por_id(id_campania)
 
     async def listar_campanias(self, limit: int, offset: int) -> List[Campania]:
-        return await self.repo.listar_campanias(limit, offset)
\ No newline at end of file
+        return await self.repo.listar_campanias(limit, offset)
+
+    async def paginar_campanias(
+        self,
+        orden: str = "fecha_inicio",
+        descendente: bool = False,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        estado: Optional[str] = None
+    ) -> Tuple[PaginaKeyset[Campania], Callable[[], Awaitable[int]]]:
+        """Página por cursor de campañas, opcionalmente filtradas por estado"""
+        incluir = (lambda c: c.estado == estado) if estado else None
+        return await self.catalog.pagina(
+            orden, descendente, first, after, last, before,
+            incluir=incluir, clave_filtro=("estado", estado)
+        )
@@ -0,0 +1,22 @@
+"""
+Snapshot indexado de campañas para la paginación por cursor.
+"""
+
+from app.config.settings import settings
+from app.modules.campania.infrastructure.campania_respository import CampaniaRepository
+from app.shared.infrastructure.keyset import ColeccionIndexada
+
+# Campos por los que se puede paginar con cursor
+ORDENES_CAMPANIA = {
+    "fecha_inicio": lambda c: c.fecha_inicio,
+    "titulo": lambda c: c.titulo,
+}
+
+# Instancia compartida por todo el proceso
+campania_catalog = ColeccionIndexada(
+    cargar=lambda: CampaniaRepository().listar_campanias(limit=None),
+    id_de=lambda c: c.id_campania,
+    ordenes=ORDENES_CAMPANIA,
+    ttl=settings.KEYSET_SNAPSHOT_TTL,
+    nombre="campanias",
+)
@@ -2,23 +2,17 @@ import httpx
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.rest_query import capacidades_rest
 from app.modules.campania.domain.entitie import Campania, NewCampania, UpdateCampania
 
 class CampaniaRepository:
     """Repositorio para gestionar campañas a través del backend REST"""
     
-    def __init__(self):
-        self.base_url = settings.REST_API_URL  # Solo la URL base sin /campanias
-        self.timeout = 30
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
 
     def _parse_campania(self, data: dict) -> Campania:
         """Convierte la respuesta del API REST en una entidad Campania"""
@@ -33,29 +27,33 @@ class CampaniaRepository:
             organizador=data.get("organizador"),
             estado=data.get("estado")
         )
-    async def listar_campanias(self, limit: int = 50, offset: int = 0) -> list[Campania]:
-        """GET /campanias - Obtener todas las campañas (sin paginación por ahora)"""
-        async with await self._get_client() as client:
-            # TEMPORAL: Removemos parámetros de paginación porque el backend no los soporta aún
-            response = await client.get("/campanias")
-            response.raise_for_status()
-            campanias_data = response.json()
-            
-            # Aplicamos paginación manualmente en el lado del cliente
-            campanias = [self._parse_campania(data) for data in campanias_data]
-            start = offset
-            end = offset + limit
-            return campanias[start:end]
+    async def listar_campanias(self, limit: Optional[int] = 50, offset: int = 0) -> list[Campania]:
+        """
+        GET /campanias - Obtener campañas paginadas (en el backend si la ruta lo soporta).
+        Con limit=None devuelve todas.
+        """
+        client = self._get_client()
+        plan = capacidades_rest.planificar("/campanias", limit, offset)
+        response = await client.get("/campanias", params=plan.params)
+        response.raise_for_status()
+        campanias_data = response.json()
+        
+        campanias = [self._parse_campania(data) for data in campanias_data]
+        if plan.paginar_local:
+            # El backend no pagina esta ruta: aplicamos la paginación en el cliente
+            return campanias[offset:offset + limit]
+        return campanias
+    @recordar_no_encontrados("campanias")
     async def obtener_campania_por_id(self, id_campania: UUID) -> Optional[Campania]:
         """GET /campanias/{id} - Obtener una campaña por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/campanias/{str(id_campania)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_campania(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        client = self._get_client()
+        try:
+            response = await client.get(f"/campanias/{str(id_campania)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_campania(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
@@ -4,16 +4,17 @@ from uuid import UUID
 from app.modules.campania.interface.graphql_type import CampaniaType
 from app.modules.campania.application.campania_service import CampaniaApplicationService
 from app.modules.campania.infrastructure.campania_respository import CampaniaRepository
+from app.shared.interface.connection import Connection, crear_conexion, validar_argumentos
+from app.shared.interface.context import get_loaders
 
 @strawberry.type
 class CampaniaQuery:
     """Queries relacionadas con campañas"""
 
     @strawberry.field
-    async def obtener_campania_id(self, id_campania: strawberry.ID) -> Optional[CampaniaType]:
+    async def obtener_campania_id(self, info: strawberry.Info, id_campania: strawberry.ID) -> Optional[CampaniaType]:
         """Obtener una campaña por su ID"""
-        service = CampaniaApplicationService()
-        campania = await service.obtener_campania(UUID(id_campania))
+        campania = await get_loaders(info).campania.load(UUID(id_campania))
 
         if campania is None:
             return None
@@ -50,4 +51,45 @@ class CampaniaQuery:
             )
             for campania in campanias
         ]
-    
+
+    @strawberry.field
+    async def campanias_conexion(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        order_by: str = "fecha_inicio",
+        order: str = "desc",
+        estado: Optional[str] = None
+    ) -> Connection[CampaniaType]:
+        """
+        Paginación por cursor (estilo Relay) de campañas.
+        order_by: "fecha_inicio" o "titulo"; order: "asc" o "desc".
+        """
+        validar_argumentos(first, last)
+        if first is None and last is None:
+            first = 20
+
+        service = CampaniaApplicationService()
+        pagina, contar = await service.paginar_campanias(
+            orden=order_by,
+            descendente=order.lower() == "desc",
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+            estado=estado
+        )
+
+        return crear_conexion(pagina, lambda campania: CampaniaType(
+            id_campania=campania.id_campania,
+            id_tipo_campania=campania.id_tipo_campania,
+            titulo=campania.titulo,
+            descripcion=campania.descripcion,
+            fecha_inicio=campania.fecha_inicio,
+            fecha_fin=campania.fecha_fin,
+            lugar=campania.lugar,
+            organizador=campania.organizador,
+            estado=campania.estado
+        ), contar)
@@ -2,23 +2,16 @@ import httpx
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
 from app.modules.causa_urgente.domain.entities import CausaUrgente, NewCausaUrgente, UpdateCausaUrgente
 
 class CausaUrgenteRepository:
     """Repositorio para gestionar causas urgentes mediante REST API"""
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_causa_urgente(self, data: dict) -> CausaUrgente:
         """Convierte la respuesta del API REST en una entidad CausaUrgente"""
@@ -35,21 +28,22 @@ class CausaUrgenteRepository:
     
     async def obtener_causas_urgentes(self) -> list[CausaUrgente]:
         """GET /causas_urgentes - Obtener todas las causas urgentes"""
-        async with await self._get_client() as client:
-            response = await client.get("/causas_urgentes")
-            response.raise_for_status()
-            causas_urgentes_data = response.json()
-            return [self._parse_causa_urgente(data) for data in causas_urgentes_data]
-    
+        client = self._get_client()
+        response = await client.get("/causas_urgentes")
+        response.raise_for_status()
+        causas_urgentes_data = response.json()
+        return [self._parse_causa_urgente(data) for data in causas_urgentes_data]
+
+    @recordar_no_encontrados("causas_urgentes")
     async def obtener_causa_urgente_por_id(self, id_causa_urgente: UUID) -> Optional[CausaUrgente]:
         """GET /causas_urgentes/{id} - Obtener una causa urgente por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/causas_urgentes/{str(id_causa_urgente)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_causa_urgente(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
\ No newline at end of file
+        client = self._get_client()
+        try:
+            response = await client.get(f"/causas_urgentes/{str(id_causa_urgente)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_causa_urgente(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
\ No newline at end of file
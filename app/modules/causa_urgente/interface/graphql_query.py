@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.causa_urgente.interface.graphql_type import CausaUrgenteType
 from app.modules.causa_urgente.application.causa_urgente_service import CausaUrgenteService
 from app.modules.causa_urgente.infrastructure.causa_urgente_repository import CausaUrgenteRepository
+from app.shared.interface.context import get_loaders
 
 @strawberry.type
 class CausaUrgenteQuery:
@@ -22,9 +23,8 @@ class CausaUrgenteQuery:
             fotos=causa.fotos) for causa in causas_urgentes]
     
     @strawberry.field
-    async def causa_urgente_por_id(self, id_causa_urgente: strawberry.ID) -> CausaUrgenteType:
-        service = CausaUrgenteService(CausaUrgenteRepository())
-        causa_urgente = await service.obtener_causa_urgente_por_id(UUID(id_causa_urgente))
+    async def causa_urgente_por_id(self, info: strawberry.Info, id_causa_urgente: strawberry.ID) -> CausaUrgenteType:
+        causa_urgente = await get_loaders(info).causa_urgente.load(UUID(id_causa_urgente))
         if causa_urgente is None:
             return None
         return CausaUrgenteType(
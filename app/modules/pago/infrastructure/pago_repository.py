@@ -2,23 +2,16 @@ import httpx
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
 from app.modules.pago.domain.entitie import Pago, NewPago, UpdatePago
 
 class PagoRepository:
     """Repositorio para gestionar pagos mediante REST API con integración Stripe"""
     
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_pago(self, data: dict) -> Pago:
         """Convierte la respuesta del API REST en una entidad Pago"""
@@ -56,27 +49,28 @@ class PagoRepository:
         # Para desarrollo, retornamos una lista vacía por ahora
         # Una vez que se implemente la ruta en Rust, descomentar el código siguiente:
         
-        # async with await self._get_client() as client:
-        #     params = {"limit": limit, "offset": offset}
-        #     response = await client.get("/pagos", params=params)
-        #     response.raise_for_status()
-        #     pagos_data = response.json()
-        #     return [self._parse_pago(data) for data in pagos_data]
+        # client = self._get_client()
+        # params = {"limit": limit, "offset": offset}
+        # response = await client.get("/pagos", params=params)
+        # response.raise_for_status()
+        # pagos_data = response.json()
+        # return [self._parse_pago(data) for data in pagos_data]
         
         return []
 
+    @recordar_no_encontrados("pagos")
     async def obtener_pago_por_id(self, id_pago: UUID) -> Optional[Pago]:
         """GET /pagos/{id} - Obtener un pago por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/pagos/{str(id_pago)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_pago(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        client = self._get_client()
+        try:
+            response = await client.get(f"/pagos/{str(id_pago)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_pago(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
     async def obtener_pagos_por_donacion(self, id_donacion: UUID) -> List[Pago]:
         """Obtener todos los pagos de una donación - Fallback temporal"""
@@ -86,49 +80,49 @@ class PagoRepository:
         # Para desarrollo, retornamos una lista vacía por ahora
         # Una vez que se implemente la ruta en Rust, descomentar el código siguiente:
         
-        # async with await self._get_client() as client:
-        #     response = await client.get(f"/pagos/donacion/{str(id_donacion)}")
-        #     response.raise_for_status()
-        #     pagos_data = response.json()
-        #     return [self._parse_pago(data) for data in pagos_data]
+        # client = self._get_client()
+        # response = await client.get(f"/pagos/donacion/{str(id_donacion)}")
+        # response.raise_for_status()
+        # pagos_data = response.json()
+        # return [self._parse_pago(data) for data in pagos_data]
         
         return []
 
     async def obtener_estadisticas_pagos(self, fecha_inicio: datetime = None, fecha_fin: datetime = None) -> Dict[str, Any]:
         """GET /pagos/stats - Obtener estadísticas de pagos"""
-        async with await self._get_client() as client:
-            params = {}
-            if fecha_inicio:
-                params["fecha_inicio"] = fecha_inicio.isoformat()
-            if fecha_fin:
-                params["fecha_fin"] = fecha_fin.isoformat()
+        client = self._get_client()
+        params = {}
+        if fecha_inicio:
+            params["fecha_inicio"] = fecha_inicio.isoformat()
+        if fecha_fin:
+            params["fecha_fin"] = fecha_fin.isoformat()
 
-            response = await client.get("/pagos/stats", params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await client.get("/pagos/stats", params=params)
+        response.raise_for_status()
+        return response.json()
 
     async def obtener_pagos_por_estado(self, estado: str, limit: int = 50, offset: int = 0) -> List[Pago]:
         """GET /pagos?estado={estado} - Obtener pagos por estado"""
-        async with await self._get_client() as client:
-            params = {
-                "estado": estado,
-                "limit": limit,
-                "offset": offset
-            }
-            response = await client.get("/pagos", params=params)
-            response.raise_for_status()
-            pagos_data = response.json()
-            return [self._parse_pago(data) for data in pagos_data]
+        client = self._get_client()
+        params = {
+            "estado": estado,
+            "limit": limit,
+            "offset": offset
+        }
+        response = await client.get("/pagos", params=params)
+        response.raise_for_status()
+        pagos_data = response.json()
+        return [self._parse_pago(data) for data in pagos_data]
 
     async def obtener_pagos_por_metodo(self, metodo_pago: str, limit: int = 50, offset: int = 0) -> List[Pago]:
         """GET /pagos?metodo={metodo} - Obtener pagos por método de pago"""
-        async with await self._get_client() as client:
-            params = {
-                "metodo_pago": metodo_pago,
-                "limit": limit,
-                "offset": offset
-            }
-            response = await client.get("/pagos", params=params)
-            response.raise_for_status()
-            pagos_data = response.json()
-            return [self._parse_pago(data) for data in pagos_data]
\ No newline at end of file
+        client = self._get_client()
+        params = {
+            "metodo_pago": metodo_pago,
+            "limit": limit,
+            "offset": offset
+        }
+        response = await client.get("/pagos", params=params)
+        response.raise_for_status()
+        pagos_data = response.json()
+        return [self._parse_pago(data) for data in pagos_data]
\ No newline at end of file
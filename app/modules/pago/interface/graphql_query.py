@@ -3,16 +3,16 @@ from typing import List, Optional
 from uuid import UUID
 from app.modules.pago.interface.graphql_type import PagoType, InitPaymentInput, InitPaymentResponse
 from app.modules.pago.application.pago_service import PagoApplicationService
+from app.shared.interface.context import get_loaders
 
 @strawberry.type
 class PagoQuery:
     """Queries relacionadas con pagos"""
 
     @strawberry.field
-    async def obtener_pago(self, id_pago: strawberry.ID) -> Optional[PagoType]:
+    async def obtener_pago(self, info: strawberry.Info, id_pago: strawberry.ID) -> Optional[PagoType]:
         """Obtener un pago por su ID"""
-        service = PagoApplicationService()
-        pago = await service.obtener_pago(UUID(id_pago))
+        pago = await get_loaders(info).pago.load(UUID(id_pago))
 
         if pago is None:
             return None
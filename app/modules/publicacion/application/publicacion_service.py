@@ -1,14 +1,17 @@
-from typing import Optional
+from typing import Awaitable, Callable, Optional, Tuple
 from uuid import UUID
 from app.modules.publicacion.domain.entities import Publicacion
 from app.modules.publicacion.infrastructure.publicacion_repository import PublicacionRepository
+from app.modules.publicacion.infrastructure.publicacion_catalog import publicacion_catalog
+from app.shared.infrastructure.keyset import ColeccionIndexada, PaginaKeyset
 
 
 class PublicacionService:
     """Servicio de aplicación para la lógica de negocio de Publicaciones"""
 
-    def __init__(self, repository: PublicacionRepository):
+    def __init__(self, repository: PublicacionRepository, catalog: Optional[ColeccionIndexada] = None):
         self.repository = repository
+        self.catalog = catalog or publicacion_catalog
 
     async def obtener_todas(self) -> list[Publicacion]:
         """Obtener todas las publicaciones"""
@@ -17,3 +20,20 @@ class PublicacionService:
     async def obtener_publicacion_por_id(self, id_publicacion: UUID) -> Optional[Publicacion]:
         """Obtener una publicación por ID"""
         return await self.repository.obtener_publicacion_por_id(id_publicacion)
+
+    async def paginar_publicaciones(
+        self,
+        orden: str = "fecha_publicacion",
+        descendente: bool = False,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        estado: Optional[str] = None
+    ) -> Tuple[PaginaKeyset[Publicacion], Callable[[], Awaitable[int]]]:
+        """Página por cursor de publicaciones, opcionalmente filtradas por estado"""
+        incluir = (lambda p: p.estado == estado) if estado else None
+        return await self.catalog.pagina(
+            orden, descendente, first, after, last, before,
+            incluir=incluir, clave_filtro=("estado", estado)
+        )
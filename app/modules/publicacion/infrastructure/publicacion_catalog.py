@@ -0,0 +1,22 @@
+"""
+Snapshot indexado de publicaciones para la paginación por cursor.
+"""
+
+from app.config.settings import settings
+from app.modules.publicacion.infrastructure.publicacion_repository import PublicacionRepository
+from app.shared.infrastructure.keyset import ColeccionIndexada
+
+# Campos por los que se puede paginar con cursor
+ORDENES_PUBLICACION = {
+    "fecha_publicacion": lambda p: p.fecha_publicacion,
+    "titulo": lambda p: p.titulo,
+}
+
+# Instancia compartida por todo el proceso
+publicacion_catalog = ColeccionIndexada(
+    cargar=lambda: PublicacionRepository().listar_publicaciones(),
+    id_de=lambda p: p.id_publicacion,
+    ordenes=ORDENES_PUBLICACION,
+    ttl=settings.KEYSET_SNAPSHOT_TTL,
+    nombre="publicaciones",
+)
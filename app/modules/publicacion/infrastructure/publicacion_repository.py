@@ -2,7 +2,9 @@ import httpx
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_listados
 from app.modules.publicacion.domain.entities import Publicacion, NewPublicacion, UpdatePublicacion
 
 
@@ -15,17 +17,12 @@ class PublicacionRepository:
     - transforma las respuestas en entidades del dominio
     """
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self._cache = cache or cache_listados.para("publicaciones")
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono configurado"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
 
     def _parse_publicacion(self, data: dict) -> Publicacion:
         """Convierte la respuesta del API REST en una entidad Publicacion"""
@@ -42,21 +39,25 @@ class PublicacionRepository:
 
     async def listar_publicaciones(self) -> list[Publicacion]:
         """GET /publicaciones - Obtener todas las publicaciones"""
-        async with await self._get_client() as client:
-            response = await client.get("/publicaciones")
-            response.raise_for_status()
-            publicaciones_data = response.json()
-            return [self._parse_publicacion(data) for data in publicaciones_data]
+        return list(await self._cache.obtener_o_cargar("*", self._descargar_publicaciones))
 
+    async def _descargar_publicaciones(self) -> list[Publicacion]:
+        client = self._get_client()
+        response = await client.get("/publicaciones")
+        response.raise_for_status()
+        publicaciones_data = response.json()
+        return [self._parse_publicacion(data) for data in publicaciones_data]
+
+    @recordar_no_encontrados("publicaciones")
     async def obtener_publicacion_por_id(self, id_publicacion: UUID) -> Optional[Publicacion]:
         """GET /publicaciones/{id} - Obtener una publicación por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/publicaciones/{str(id_publicacion)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_publicacion(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        client = self._get_client()
+        try:
+            response = await client.get(f"/publicaciones/{str(id_publicacion)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_publicacion(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
@@ -4,6 +4,8 @@ from uuid import UUID
 from app.modules.publicacion.interface.graphql_type import PublicacionType
 from app.modules.publicacion.application.publicacion_service import PublicacionService
 from app.modules.publicacion.infrastructure.publicacion_repository import PublicacionRepository
+from app.shared.interface.connection import Connection, crear_conexion, validar_argumentos
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -31,11 +33,9 @@ class PublicacionQuery:
         ]
 
     @strawberry.field
-    async def publicacion(self, id_publicacion: strawberry.ID) -> Optional[PublicacionType]:
+    async def publicacion(self, info: strawberry.Info, id_publicacion: strawberry.ID) -> Optional[PublicacionType]:
         """Obtener una publicación por ID"""
-        adapter = PublicacionRepository()
-        service = PublicacionService(adapter)
-        publicacion = await service.obtener_publicacion_por_id(UUID(id_publicacion))
+        publicacion = await get_loaders(info).publicacion.load(UUID(id_publicacion))
 
         if publicacion is None:
             return None
@@ -49,3 +49,44 @@ class PublicacionQuery:
             id_usuario=strawberry.ID(str(publicacion.id_usuario)) if publicacion.id_usuario else None,
             id_animal=strawberry.ID(str(publicacion.id_animal)) if publicacion.id_animal else None,
         )
+
+    @strawberry.field
+    async def publicaciones_conexion(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        order_by: str = "fecha_publicacion",
+        order: str = "desc",
+        estado: Optional[str] = None
+    ) -> Connection[PublicacionType]:
+        """
+        Paginación por cursor (estilo Relay) de publicaciones.
+        order_by: "fecha_publicacion" o "titulo"; order: "asc" o "desc".
+        """
+        validar_argumentos(first, last)
+        if first is None and last is None:
+            first = 20
+
+        adapter = PublicacionRepository()
+        service = PublicacionService(adapter)
+        pagina, contar = await service.paginar_publicaciones(
+            orden=order_by,
+            descendente=order.lower() == "desc",
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+            estado=estado
+        )
+
+        return crear_conexion(pagina, lambda pub: PublicacionType(
+            id_publicacion=strawberry.ID(str(pub.id_publicacion)),
+            titulo=pub.titulo,
+            descripcion=pub.descripcion,
+            fecha_publicacion=pub.fecha_publicacion,
+            estado=pub.estado,
+            id_usuario=strawberry.ID(str(pub.id_usuario)) if pub.id_usuario else None,
+            id_animal=strawberry.ID(str(pub.id_animal)) if pub.id_animal else None,
+        ), contar)
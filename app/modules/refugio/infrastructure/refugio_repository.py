@@ -2,24 +2,22 @@ import httpx
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_referencias
 from app.modules.refugio.domain.entities import Refugio, NewRefugio, UpdateRefugio
 
 
 class RefugioRepository:
     """Repositorio para gestionar refugios mediante REST API"""
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
+    def __init__(self, cache: Optional[TTLCache] = None):
+        # Los refugios casi no cambian: la caché es compartida por todo el proceso
+        self._cache = cache or cache_referencias.para("refugio")
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
 
     def _parse_refugio(self, data: dict) -> Refugio:
         """Convierte la respuesta del API REST en una entidad Refugio"""
@@ -36,21 +34,30 @@ class RefugioRepository:
 
     async def listar_refugios(self) -> list[Refugio]:
         """GET /refugios - Obtener todos los refugios"""
-        async with await self._get_client() as client:
-            response = await client.get("/refugios")
-            response.raise_for_status()
-            refugios_data = response.json()
-            return [self._parse_refugio(data) for data in refugios_data]
+        return list(await self._cache.obtener_o_cargar("*", self._descargar_refugios))
+
+    async def _descargar_refugios(self) -> list[Refugio]:
+        client = self._get_client()
+        response = await client.get("/refugios")
+        response.raise_for_status()
+        refugios_data = response.json()
+        return [self._parse_refugio(data) for data in refugios_data]
 
+    @recordar_no_encontrados("refugios")
     async def obtener_refugio_por_id(self, id_refugio: UUID) -> Optional[Refugio]:
         """GET /refugios/{id} - Obtener un refugio por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/refugios/{str(id_refugio)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_refugio(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        return await self._cache.obtener_o_cargar(
+            str(id_refugio), lambda: self._descargar_refugio(id_refugio)
+        )
+
+    async def _descargar_refugio(self, id_refugio: UUID) -> Optional[Refugio]:
+        client = self._get_client()
+        try:
+            response = await client.get(f"/refugios/{str(id_refugio)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_refugio(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.refugio.interface.graphql_type import RefugioType
 from app.modules.refugio.application.refugio_service import RefugioService
 from app.modules.refugio.infrastructure.refugio_repository import RefugioRepository
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -31,11 +32,9 @@ class RefugioQuery:
         ]
 
     @strawberry.field
-    async def refugio(self, id_refugio: strawberry.ID) -> Optional[RefugioType]:
+    async def refugio(self, info: strawberry.Info, id_refugio: strawberry.ID) -> Optional[RefugioType]:
         """Obtener un refugio por ID"""
-        adapter = RefugioRepository()
-        service = RefugioService(adapter)
-        refugio = await service.obtener_refugio_por_id(UUID(id_refugio))
+        refugio = await get_loaders(info).refugio.load(UUID(id_refugio))
 
         if refugio is None:
             return None
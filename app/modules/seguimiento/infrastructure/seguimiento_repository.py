@@ -2,24 +2,17 @@ import httpx
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
 from app.modules.seguimiento.domain.entities import Seguimiento, NewSeguimiento, UpdateSeguimiento
 
 
 class SeguimientoRepository:
     """Repositorio para gestionar seguimientos mediante REST API"""
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asíncrono"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
 
     def _parse_seguimiento(self, data: dict) -> Seguimiento:
         """Convierte la respuesta del API REST en una entidad Seguimiento"""
@@ -34,21 +27,22 @@ class SeguimientoRepository:
 
     async def listar_seguimientos(self) -> list[Seguimiento]:
         """GET /seguimientos - Obtener todos los seguimientos"""
-        async with await self._get_client() as client:
-            response = await client.get("/seguimientos")
-            response.raise_for_status()
-            datos = response.json()
-            return [self._parse_seguimiento(d) for d in datos]
+        client = self._get_client()
+        response = await client.get("/seguimientos")
+        response.raise_for_status()
+        datos = response.json()
+        return [self._parse_seguimiento(d) for d in datos]
 
+    @recordar_no_encontrados("seguimientos")
     async def obtener_seguimiento_por_id(self, id_seguimiento: UUID) -> Optional[Seguimiento]:
         """GET /seguimientos/{id} - Obtener un seguimiento por ID"""
-        async with await self._get_client() as client:
-            try:
-                response = await client.get(f"/seguimientos/{str(id_seguimiento)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_seguimiento(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        client = self._get_client()
+        try:
+            response = await client.get(f"/seguimientos/{str(id_seguimiento)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_seguimiento(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
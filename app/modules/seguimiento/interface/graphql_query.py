@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.seguimiento.interface.graphql_type import SeguimientoType
 from app.modules.seguimiento.application.seguimiento_service import SeguimientoService
 from app.modules.seguimiento.infrastructure.seguimiento_repository import SeguimientoRepository
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -30,11 +31,9 @@ class SeguimientoQuery:
         ]
 
     @strawberry.field
-    async def seguimiento(self, id_seguimiento: strawberry.ID) -> Optional[SeguimientoType]:
+    async def seguimiento(self, info: strawberry.Info, id_seguimiento: strawberry.ID) -> Optional[SeguimientoType]:
         """Obtener un seguimiento por ID"""
-        adapter = SeguimientoRepository()
-        service = SeguimientoService(adapter)
-        seguimiento = await service.obtener_seguimiento_por_id(UUID(id_seguimiento))
+        seguimiento = await get_loaders(info).seguimiento.load(UUID(id_seguimiento))
 
         if seguimiento is None:
             return None
@@ -1,23 +1,16 @@
 import httpx
 from typing import Optional
 from uuid import UUID
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
 from app.modules.supervisor.domain.entities import Supervisor, NewSupervisor, UpdateSupervisor
 
 class SupervisorRepository:
     """Repositorio para gestionar supervisores mediante REST API"""
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asincrono"""
-        return httpx.AsyncClient(
-            base_url = self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_supervisor(self, data: dict) -> Supervisor:
         """Convierte la respuesta de la API REST en una entidad Supervisor"""
@@ -31,22 +24,23 @@ class SupervisorRepository:
     
     async def listar_supervisores(self) -> list[Supervisor]:
         """GET /supervisores - Obtener todos los supervisores"""
-        async with await self._get_client() as client:
-            response = await client.get("/supervisores")
-            response.raise_for_status()
-            supervisores_data = response.json()
-            return [self._parse_supervisor(data) for data in supervisores_data]
-        
+        client = self._get_client()
+        response = await client.get("/supervisores")
+        response.raise_for_status()
+        supervisores_data = response.json()
+        return [self._parse_supervisor(data) for data in supervisores_data]
+
+    @recordar_no_encontrados("supervisores")
     async def obtener_supervisor_por_id(self, id_supervisor: UUID) -> Optional[Supervisor]:
         """GET /supervisores/{id} - Obtener un supervisor por ID"""
-        async with await self._get_client() as client: 
-            try: 
-                response = await client.get(f"/supervisores/{str(id_supervisor)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_supervisor(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        client = self._get_client()
+        try: 
+            response = await client.get(f"/supervisores/{str(id_supervisor)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_supervisor(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
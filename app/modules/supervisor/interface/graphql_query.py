@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.supervisor.interface.graphql_type import SupervisorType
 from app.modules.supervisor.application.supervisor_service import SupervisorService
 from app.modules.supervisor.infrastructure.supervisor_repository import SupervisorRepository
+from app.shared.interface.context import get_loaders
 
 @strawberry.type
 class SupervisorQuery:
@@ -22,10 +23,9 @@ class SupervisorQuery:
             id_usuario=supervisor.id_usuario) for supervisor in supervisores]
 
     @strawberry.field
-    async def supervisor_por_id(self, id_supervisor: strawberry.ID) -> Optional[SupervisorType]:
+    async def supervisor_por_id(self, info: strawberry.Info, id_supervisor: strawberry.ID) -> Optional[SupervisorType]:
         """Obtener un supervisor por ID"""
-        service = SupervisorService()
-        supervisor = await service.obtener_supervisor_por_id(UUID(id_supervisor))
+        supervisor = await get_loaders(info).supervisor.load(UUID(id_supervisor))
         if supervisor is None:
             return None
         return SupervisorType(
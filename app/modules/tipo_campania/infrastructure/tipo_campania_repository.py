@@ -1,23 +1,21 @@
 import httpx
 from typing import Optional
 from uuid import UUID
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_referencias
 from app.modules.tipo_campania.domain.entities import TipoCampania, NewTipoCampania, UpdateTipoCampania
 
 class TipoCampaniaRepository:
     """Repositorio para gestionar tipos de campaña mediante Rest API"""
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asincrono"""
-        return httpx.AsyncClient(
-            base_url = self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def __init__(self, cache: Optional[TTLCache] = None):
+        # Los tipos de campaña casi no cambian: la caché es compartida por todo el proceso
+        self._cache = cache or cache_referencias.para("tipo_campania")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_tipo_campania(self, data: dict) -> TipoCampania:
         """Convierte la respuesta de la API REST en una entidad TipoCampania"""
@@ -29,21 +27,30 @@ class TipoCampaniaRepository:
     
     async def listar_tipos_campania(self) -> list[TipoCampania]:
         """GET /tipo_campanias - Obtener todos los tipos campania"""
-        async with await self._get_client() as client:
-            response = await client.get("/tipo_campanias")
-            response.raise_for_status()
-            tipos_campania_data = response.json()
-            return [self._parse_tipo_campania(data) for data in tipos_campania_data]
-        
+        return list(await self._cache.obtener_o_cargar("*", self._descargar_tipos_campania))
+
+    async def _descargar_tipos_campania(self) -> list[TipoCampania]:
+        client = self._get_client()
+        response = await client.get("/tipo_campanias")
+        response.raise_for_status()
+        tipos_campania_data = response.json()
+        return [self._parse_tipo_campania(data) for data in tipos_campania_data]
+
+    @recordar_no_encontrados("tipo_campanias")
     async def obtener_tipo_campania_por_id(self, id_tipo_campania: UUID) -> Optional[TipoCampania]:
         """GET /tipo_campanias/{id} - Obtener un tipo campania por ID"""
-        async with await self._get_client() as client: 
-            try: 
-                response = await client.get(f"/tipo_campanias/{str(id_tipo_campania)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_tipo_campania(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        return await self._cache.obtener_o_cargar(
+            str(id_tipo_campania), lambda: self._descargar_tipo_campania(id_tipo_campania)
+        )
+
+    async def _descargar_tipo_campania(self, id_tipo_campania: UUID) -> Optional[TipoCampania]:
+        client = self._get_client()
+        try: 
+            response = await client.get(f"/tipo_campanias/{str(id_tipo_campania)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_tipo_campania(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.tipo_campania.interface.graphql_type import TipoCampaniaType
 from app.modules.tipo_campania.application.tipo_campania_service import TipoCampaniaService
 from app.modules.tipo_campania.infrastructure.tipo_campania_repository import TipoCampaniaRepository
+from app.shared.interface.context import get_loaders
 
 @strawberry.type
 class TipoCampaniaQuery:
@@ -26,11 +27,9 @@ class TipoCampaniaQuery:
         ]
     
     @strawberry.field
-    async def tipo_campania(self, id_tipo_campania: strawberry.ID) -> Optional[TipoCampaniaType]:
+    async def tipo_campania(self, info: strawberry.Info, id_tipo_campania: strawberry.ID) -> Optional[TipoCampaniaType]:
         """Obtener un tipo de campaña por ID"""
-        adapter = TipoCampaniaRepository()
-        service = TipoCampaniaService(adapter)
-        tipo_campania = await service.obtener_por_id(UUID(id_tipo_campania))
+        tipo_campania = await get_loaders(info).tipo_campania.load(UUID(id_tipo_campania))
         
         if tipo_campania is None:
             return None
@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.usuario.interface.graphql_type import UsuarioType
 from app.modules.usuario.application.usuario_service import UsuarioService
 from app.modules.usuario.infrastructure.usuario_repository import UsuarioRepository
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -30,11 +31,9 @@ class UsuarioQuery:
         ]
     
     @strawberry.field
-    async def usuario(self, id_usuario: strawberry.ID) -> Optional[UsuarioType]:
+    async def usuario(self, info: strawberry.Info, id_usuario: strawberry.ID) -> Optional[UsuarioType]:
         """Obtener un usuario por ID"""
-        adapter = UsuarioRepository()
-        service = UsuarioService(adapter)
-        usuario = await service.obtener_usuario_por_id(UUID(id_usuario))
+        usuario = await get_loaders(info).usuario.load(UUID(id_usuario))
         
         if usuario is None:
             return None
@@ -3,20 +3,18 @@ Servicio de agregación para estadísticas de voluntarios.
 Implementa lógica de negocio para queries analíticas con agregaciones.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import Counter
 from app.modules.voluntario.infrastructure.voluntario_repository import VoluntarioRepository
-from app.modules.campania.infrastructure.campania_respository import CampaniaRepository
-from app.modules.tipo_campania.infrastructure.tipo_campania_repository import TipoCampaniaRepository
+from app.shared.infrastructure.dataloader import Loaders, cargar_por_ids
 
 
 class VoluntarioAggregationService:
     """Servicio para consultas de agregación y estadísticas de voluntarios"""
     
-    def __init__(self, repository: VoluntarioRepository):
+    def __init__(self, repository: VoluntarioRepository, loaders: Optional[Loaders] = None):
         self.repository = repository
-        self.campania_repo = CampaniaRepository()
-        self.tipo_campania_repo = TipoCampaniaRepository()
+        self.loaders = loaders or Loaders()
     
     async def obtener_participacion_por_tipo_campania(self) -> List[Dict[str, any]]:
         """
@@ -31,44 +29,51 @@ class VoluntarioAggregationService:
         if not voluntarios:
             return []
         
+        # Resolver campañas y tipos de campaña en lote (una petición por ID distinto)
+        campanias = await cargar_por_ids(
+            self.loaders.campania,
+            (v.id_campania for v in voluntarios if v.id_campania)
+        )
+        tipos_campania = await cargar_por_ids(
+            self.loaders.tipo_campania,
+            (c.id_tipo_campania for c in campanias.values() if c and c.id_tipo_campania)
+        )
+        
         # Agrupar voluntarios por tipo de campaña
         voluntarios_por_tipo = {}
         total_voluntarios = 0
         
         for voluntario in voluntarios:
-            if voluntario.id_campania:
-                try:
-                    # 1. Obtener la campaña
-                    campania = await self.campania_repo.obtener_campania_por_id(voluntario.id_campania)
-                    
-                    if campania and campania.id_tipo_campania:
-                        # 2. Obtener el tipo de campaña
-                        tipo_campania = await self.tipo_campania_repo.obtener_tipo_campania_por_id(campania.id_tipo_campania)
-                        
-                        if tipo_campania and tipo_campania.nombre:
-                            nombre_tipo = tipo_campania.nombre
-                            
-                            # Inicializar contadores si no existen
-                            if nombre_tipo not in voluntarios_por_tipo:
-                                voluntarios_por_tipo[nombre_tipo] = {
-                                    "total": 0,
-                                    "activos": 0,
-                                    "inactivos": 0
-                                }
-                            
-                            # Contar voluntario
-                            voluntarios_por_tipo[nombre_tipo]["total"] += 1
-                            total_voluntarios += 1
-                            
-                            # Contar por estado
-                            if voluntario.estado and voluntario.estado.lower() in ['activo', 'active']:
-                                voluntarios_por_tipo[nombre_tipo]["activos"] += 1
-                            else:
-                                voluntarios_por_tipo[nombre_tipo]["inactivos"] += 1
-                                
-                except Exception:
-                    # Si hay error, continuar con el siguiente
-                    continue
+            if not voluntario.id_campania:
+                continue
+            
+            campania = campanias.get(voluntario.id_campania)
+            if not campania or not campania.id_tipo_campania:
+                continue
+            
+            tipo_campania = tipos_campania.get(campania.id_tipo_campania)
+            if not tipo_campania or not tipo_campania.nombre:
+                continue
+            
+            nombre_tipo = tipo_campania.nombre
+            
+            # Inicializar contadores si no existen
+            if nombre_tipo not in voluntarios_por_tipo:
+                voluntarios_por_tipo[nombre_tipo] = {
+                    "total": 0,
+                    "activos": 0,
+                    "inactivos": 0
+                }
+            
+            # Contar voluntario
+            voluntarios_por_tipo[nombre_tipo]["total"] += 1
+            total_voluntarios += 1
+            
+            # Contar por estado
+            if voluntario.estado and voluntario.estado.lower() in ['activo', 'active']:
+                voluntarios_por_tipo[nombre_tipo]["activos"] += 1
+            else:
+                voluntarios_por_tipo[nombre_tipo]["inactivos"] += 1
         
         if total_voluntarios == 0:
             return []
@@ -1,23 +1,20 @@
 import httpx
 from typing import Optional
 from uuid import UUID
-from app.config.settings import settings
+from app.shared.infrastructure.http_client import get_http_client
+from app.shared.infrastructure.negative_cache import recordar_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_listados
 from app.modules.voluntario.domain.entities import Voluntario, NewVoluntario, UpdateVoluntario
 
 class VoluntarioRepository:
     """Repositorio para gestionar voluntarios mediante REST API"""
 
-    def __init__(self):
-        self.base_url = settings.REST_API_URL
-        self.timeout = 30
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Crea un cliente HTTP asincrono"""
-        return httpx.AsyncClient(
-            base_url = self.base_url,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
-        )
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self._cache = cache or cache_listados.para("voluntarios")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Devuelve el cliente HTTP compartido (pool keep-alive del proceso)"""
+        return get_http_client()
     
     def _parse_voluntario(self, data: dict) -> Voluntario:
         """Convierte la respuesta de la API REST en una entidad Voluntario"""
@@ -31,21 +28,25 @@ class VoluntarioRepository:
     
     async def listar_voluntarios(self) -> list[Voluntario]:
         """GET /voluntarios - Obtener todos los voluntarios"""
-        async with await self._get_client() as client:
-            response = await client.get("/voluntarios")
-            response.raise_for_status()
-            voluntarios_data = response.json()
-            return [self._parse_voluntario(data) for data in voluntarios_data]
-        
+        return list(await self._cache.obtener_o_cargar("*", self._descargar_voluntarios))
+
+    async def _descargar_voluntarios(self) -> list[Voluntario]:
+        client = self._get_client()
+        response = await client.get("/voluntarios")
+        response.raise_for_status()
+        voluntarios_data = response.json()
+        return [self._parse_voluntario(data) for data in voluntarios_data]
+
+    @recordar_no_encontrados("voluntarios")
     async def obtener_voluntario_por_id(self, id_voluntario: UUID) -> Optional[Voluntario]:
         """GET /voluntarios/{id} - Obtener un voluntario por ID"""
-        async with await self._get_client() as client: 
-            try: 
-                response = await client.get(f"/voluntarios/{str(id_voluntario)}")
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_voluntario(data)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
\ No newline at end of file
+        client = self._get_client()
+        try: 
+            response = await client.get(f"/voluntarios/{str(id_voluntario)}")
+            response.raise_for_status()
+            data = response.json()
+            return self._parse_voluntario(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
\ No newline at end of file
@@ -7,6 +7,7 @@ from typing import List
 from app.modules.voluntario.interface.graphql_aggregation_type import ParticipacionVoluntariosType
 from app.modules.voluntario.application.voluntario_aggregation_service import VoluntarioAggregationService
 from app.modules.voluntario.infrastructure.voluntario_repository import VoluntarioRepository
+from app.shared.interface.context import get_loaders
 
 
 @strawberry.type
@@ -14,7 +15,7 @@ class VoluntarioAggregationQuery:
     """Queries de estadísticas y agregaciones para voluntarios"""
     
     @strawberry.field(description="Participación de voluntarios agrupada por tipo de campaña")
-    async def participacion_voluntarios_por_tipo_campania(self) -> List[ParticipacionVoluntariosType]:
+    async def participacion_voluntarios_por_tipo_campania(self, info: strawberry.Info) -> List[ParticipacionVoluntariosType]:
         """
         Query 6: ¿Qué tipo de campañas atraen más voluntarios?
         
@@ -25,7 +26,7 @@ class VoluntarioAggregationQuery:
         - Voluntarios activos e inactivos
         """
         repository = VoluntarioRepository()
-        service = VoluntarioAggregationService(repository)
+        service = VoluntarioAggregationService(repository, get_loaders(info))
         
         stats = await service.obtener_participacion_por_tipo_campania()
         
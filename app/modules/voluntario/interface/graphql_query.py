@@ -4,6 +4,7 @@ from uuid import UUID
 from app.modules.voluntario.interface.graphql_type import VoluntarioType
 from app.modules.voluntario.application.voluntario_service import VoluntarioService
 from app.modules.voluntario.infrastructure.voluntario_repository import VoluntarioRepository
+from app.shared.interface.context import get_loaders
 
 @strawberry.type
 class VoluntarioQuery:
@@ -22,10 +23,9 @@ class VoluntarioQuery:
             id_campania=voluntario.id_campania) for voluntario in voluntarios]
     
     @strawberry.field
-    async def voluntario_por_id(self, id_voluntario: strawberry.ID) -> Optional[VoluntarioType]:
+    async def voluntario_por_id(self, info: strawberry.Info, id_voluntario: strawberry.ID) -> Optional[VoluntarioType]:
         """Obtener un voluntario por ID"""
-        service = VoluntarioService()
-        voluntario = await service.obtener_voluntario_por_id(UUID(id_voluntario))
+        voluntario = await get_loaders(info).voluntario.load(UUID(id_voluntario))
         if voluntario is None:
             return None
         return VoluntarioType(
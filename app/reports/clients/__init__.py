@@ -1,5 +1,6 @@
 """Exporta los clientes del módulo."""
 
 from .graphql_client import GraphQLClient
+from .local_executor import LocalGraphQLExecutor
 
-__all__ = ["GraphQLClient"]
+__all__ = ["GraphQLClient", "LocalGraphQLExecutor"]
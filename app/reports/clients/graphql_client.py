@@ -1,36 +1,103 @@
 """Cliente GraphQL para obtener datos de reportes."""
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from gql import gql, Client
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, List, Optional
+from gql import gql, Client, GraphQLRequest
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
-from gql.transport.exceptions import TransportQueryError
+from gql.transport.exceptions import TransportClosed, TransportQueryError
 
+from app.config.settings import settings as app_settings
+from app.reports.clients.local_executor import LocalGraphQLExecutor, es_url_local
 from app.reports.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _compilar(query: str) -> GraphQLRequest:
+    """Parsea cada string de consulta una sola vez"""
+    return gql(query)
+
+
 class GraphQLClient:
     """Cliente para realizar consultas GraphQL al servidor."""
     
-    def __init__(self, graphql_url: Optional[str] = None):
+    def __init__(self, graphql_url: Optional[str] = None, local: Optional[bool] = None):
         """
         Inicializa el cliente GraphQL.
         
         Args:
             graphql_url: URL del servidor GraphQL. Si es None, usa settings.
+            local: Ejecutar las consultas en proceso. Si es None se decide
+                según settings.graphql_execution y la URL.
         """
         self.graphql_url = graphql_url or settings.graphql_url
-        self.transport = AIOHTTPTransport(
-            url=self.graphql_url,
-            timeout=settings.graphql_timeout
-        )
-        self.client = Client(
-            transport=self.transport,
-            fetch_schema_from_transport=True
-        )
-        logger.info(f"GraphQL Client inicializado: {self.graphql_url}")
+        if local is None:
+            modo = settings.graphql_execution.lower()
+            local = modo == "local" or (modo == "auto" and es_url_local(self.graphql_url))
+        self.local = local
+        
+        if self.local:
+            # El servidor GraphQL es este mismo proceso: sin loopback HTTP
+            self.executor = LocalGraphQLExecutor()
+            self.transport = None
+            self.client = None
+            logger.info("GraphQL Client inicializado en modo local (en proceso)")
+        else:
+            self.executor = None
+            self.transport = AIOHTTPTransport(
+                url=self.graphql_url,
+                timeout=settings.graphql_timeout
+            )
+            # Con un SDL local no hace falta introspección; si no, se hace
+            # una vez al abrir la sesión y el schema queda en self.client.schema
+            sdl = Path(settings.graphql_schema_path).read_text(encoding="utf-8") if settings.graphql_schema_path else None
+            self.client = Client(
+                transport=self.transport,
+                schema=sdl,
+                fetch_schema_from_transport=sdl is None
+            )
+            logger.info(f"GraphQL Client inicializado: {self.graphql_url}")
+        
+        self._session: Optional[AsyncClientSession] = None
+        self._session_lock = asyncio.Lock()
+    
+    async def connect(self) -> None:
+        """Abre la sesión HTTP persistente (no-op en modo local)"""
+        if self.client is None or self._session is not None:
+            return
+        async with self._session_lock:
+            if self._session is None:
+                self._session = await self.client.connect_async()
+                logger.info("Sesión GraphQL abierta")
+    
+    async def close(self) -> None:
+        """Cierra la sesión HTTP persistente"""
+        if self._session is None:
+            return
+        async with self._session_lock:
+            if self._session is not None:
+                self._session = None
+                await self.client.close_async()
+                logger.info("Sesión GraphQL cerrada")
+    
+    async def _ejecutar_remoto(self, query: str, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Ejecuta sobre la sesión persistente; reabre una vez si se cerró"""
+        compilada = _compilar(query)
+        request = GraphQLRequest(compilada.document, variable_values=variables)
+        for intento in range(2):
+            await self.connect()
+            try:
+                return await self._session.execute(request)
+            except TransportClosed:
+                if intento:
+                    raise
+                logger.warning("Sesión GraphQL cerrada por el servidor, reconectando")
+                await self.close()
     
     async def execute_query(
         self,
@@ -51,13 +118,12 @@ class GraphQLClient:
             TransportQueryError: Si hay error en la consulta
         """
         try:
-            async with self.client as session:
-                result = await session.execute(
-                    gql(query),
-                    variable_values=variables
-                )
-                logger.debug(f"Query ejecutada exitosamente")
-                return result
+            if self.executor is not None:
+                result = await self.executor.execute(query, variables)
+            else:
+                result = await self._ejecutar_remoto(query, variables)
+            logger.debug(f"Query ejecutada exitosamente")
+            return result
         except TransportQueryError as e:
             logger.error(f"Error en query GraphQL: {e}")
             raise
@@ -215,13 +281,97 @@ class GraphQLClient:
         result = await self.execute_query(query, variables=variables)
         return result.get("animalesFiltrados", [])
     
+    async def iterar_animales(
+        self,
+        page_size: Optional[int] = None,
+        nombre: Optional[str] = None,
+        id_especie: Optional[str] = None,
+        id_refugio: Optional[str] = None,
+        estado_adopcion: Optional[str] = None,
+        edad_min: Optional[int] = None,
+        edad_max: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Recorre `animalesConexion` página por página (orden por nombre).
+        
+        Cada página se entrega en cuanto llega, para que las exportaciones
+        empiecen a enviar datos sin esperar el listado completo.
+        
+        Args:
+            page_size: Animales por página (por defecto settings.export_page_size),
+                limitado al máximo que acepta la conexión (CONNECTION_MAX_PAGE_SIZE)
+            Los demás: mismos filtros que obtener_animales_filtrados
+        """
+        query = """
+        query AnimalesConexion(
+            $first: Int
+            $after: String
+            $nombre: String
+            $idEspecie: ID
+            $idRefugio: ID
+            $estadoAdopcion: String
+            $edadMin: Int
+            $edadMax: Int
+        ) {
+            animalesConexion(
+                first: $first
+                after: $after
+                nombre: $nombre
+                idEspecie: $idEspecie
+                idRefugio: $idRefugio
+                estadoAdopcion: $estadoAdopcion
+                edadMin: $edadMin
+                edadMax: $edadMax
+            ) {
+                edges {
+                    node {
+                        idAnimal
+                        nombre
+                        idEspecie
+                        especie
+                        edad
+                        estadoAdopcion
+                        descripcion
+                        idRefugio
+                        fechaCreacion
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+        """
+        variables = {
+            "first": min(page_size or settings.export_page_size, app_settings.CONNECTION_MAX_PAGE_SIZE),
+            "nombre": nombre,
+            "idEspecie": id_especie,
+            "idRefugio": id_refugio,
+            "estadoAdopcion": estado_adopcion,
+            "edadMin": edad_min,
+            "edadMax": edad_max
+        }
+        variables = {k: v for k, v in variables.items() if v is not None}
+        
+        while True:
+            result = await self.execute_query(query, variables=variables)
+            conexion = result.get("animalesConexion", {})
+            pagina = [edge["node"] for edge in conexion.get("edges", [])]
+            if pagina:
+                yield pagina
+            page_info = conexion.get("pageInfo", {})
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                return
+            variables["after"] = page_info["endCursor"]
+    
     # ========== QUERIES PARA REFUGIOS ==========
     
     async def obtener_refugios(self) -> List[Dict[str, Any]]:
         """Obtiene todos los refugios."""
         query = """
         query {
-            listarRefugios {
+            refugios {
                 idRefugio
                 nombre
                 direccion
@@ -231,7 +381,7 @@ class GraphQLClient:
         }
         """
         result = await self.execute_query(query)
-        return result.get("listarRefugios", [])
+        return result.get("refugios", [])
     
     async def obtener_refugio_por_id(self, id_refugio: str) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,70 @@
+"""Ejecución en proceso de las consultas GraphQL de reportes."""
+
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from gql.transport.exceptions import TransportQueryError
+
+logger = logging.getLogger(__name__)
+
+HOSTS_LOCALES = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+
+# Ruta en la que app.main monta el GraphQLRouter
+RUTA_GRAPHQL = "/graphql"
+
+
+def es_url_local(url: str) -> bool:
+    """
+    True si la URL parece el endpoint GraphQL de este mismo proceso: host
+    local y la ruta /graphql. El puerto no se compara porque la app no sabe
+    en cuál la levantó uvicorn; otro servicio GraphQL local se consulta con
+    `REPORT_GRAPHQL_EXECUTION=http`.
+    """
+    partes = urlparse(url)
+    return (partes.hostname or "") in HOSTS_LOCALES and partes.path.rstrip("/") == RUTA_GRAPHQL
+
+
+class LocalGraphQLExecutor:
+    """
+    Ejecuta consultas directamente contra el schema de Strawberry del
+    proceso, sin pasar por HTTP ni por el middleware ASGI.
+    
+    El schema se importa en la primera consulta: `app.schema.schema`
+    importa las rutas de reportes, así que importarlo al cargar este
+    módulo provocaría un import circular.
+    """
+    
+    def __init__(self):
+        self._schema = None
+    
+    def _get_schema(self):
+        if self._schema is None:
+            from app.schema.schema import schema
+            self._schema = schema
+        return self._schema
+    
+    async def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta la consulta y devuelve `data` con la misma forma que la
+        respuesta HTTP (escalares ya serializados).
+        
+        Raises:
+            TransportQueryError: Si la ejecución devuelve errores, igual que
+                el transporte HTTP de gql
+        """
+        from app.shared.interface.context import crear_contexto
+        
+        result = await self._get_schema().execute(
+            query,
+            variable_values=variables,
+            context_value=crear_contexto()
+        )
+        if result.errors:
+            errores = [error.formatted for error in result.errors]
+            raise TransportQueryError(str(errores[0]), errors=errores, data=result.data)
+        return result.data
@@ -4,18 +4,65 @@ import os
 from typing import Optional
 from pydantic_settings import BaseSettings
 
+from app.config.settings import settings as app_settings
+
 
 class ReportSettings(BaseSettings):
     """Configuración para el módulo de reportes."""
     
     # GraphQL Configuration
-    graphql_url: str = os.getenv("GRAPHQL_URL", "http://localhost:8000/graphql")
+    # Por defecto, el /graphql de esta misma app
+    graphql_url: str = os.getenv("GRAPHQL_URL", f"http://localhost:{app_settings.GRAPHQL_PORT}/graphql")
     graphql_timeout: int = 30
+    # "auto": en proceso si graphql_url es un /graphql en un host local, HTTP
+    # si no; "local" o "http" fuerzan un modo (otro servicio GraphQL local: "http")
+    graphql_execution: str = "auto"
+    # SDL local del schema remoto; si no se indica se introspecciona una vez por sesión
+    graphql_schema_path: Optional[str] = None
+    
+    # Tiempo máximo (segundos) por fuente en las agregaciones generales
+    aggregation_source_timeout: float = 10.0
+    
+    # Renderizado de PDFs: procesos worker (0 = hilo del proceso actual),
+    # trabajos en espera permitidos y segundos de espera antes de rechazar
+    pdf_process_workers: int = 2
+    pdf_queue_size: int = 8
+    pdf_queue_timeout: float = 5.0
+    
+    # Trabajos de reportes en segundo plano: workers, tamaño de la cola,
+    # tiempo máximo por trabajo y vigencia (segundos) de los resultados
+    job_workers: int = 2
+    job_queue_size: int = 50
+    job_timeout: float = 300.0
+    job_ttl: int = 3600
+    job_cleanup_interval: float = 60.0
+    
+    # Caché de reportes: entradas del LRU en memoria, tamaño máximo (bytes)
+    # de un PDF para guardarlo en memoria y archivos en disco
+    cache_enabled: bool = True
+    cache_memory_items: int = 64
+    cache_memory_max_item_bytes: int = 1_048_576
+    cache_disk_max_files: int = 256
+    
+    # Pregeneración de los reportes general de animales y de campañas:
+    # cada cuántos segundos se revisan sus datos (y se renderizan si cambiaron)
+    # y cuántos segundos se conserva un archivo reemplazado antes de borrarlo
+    pregen_enabled: bool = True
+    pregen_interval: float = 60.0
+    pregen_grace_period: float = 300.0
+    
+    # Exportaciones tabulares (CSV, NDJSON, XLSX): filas por página pedida a GraphQL
+    # (se recorta a CONNECTION_MAX_PAGE_SIZE, el máximo que acepta la conexión)
+    export_page_size: int = 100
     
     # PDF Configuration
     pdf_page_size: str = "A4"  # A4 o letter
     pdf_author: str = "Sistema de Refugio Animal"
     pdf_title_prefix: str = "Reporte - "
+    # Filas por tabla en los listados (se parten en bloques de este tamaño)
+    pdf_table_chunk_rows: int = 500
+    # A partir de este número de filas el PDF se escribe a disco y no a memoria
+    pdf_spool_min_rows: int = 2000
     
     # Colors (HEX)
     pdf_primary_color: str = "#3498DB"
@@ -2,5 +2,17 @@
 
 from .base_generator import BaseReportGenerator
 from .pdf_generator import PDFGenerator
+from .render_pool import PDFRenderPool, ColaReportesLlena, pdf_render_pool
+from .tabular_generator import (
+    TabularGenerator,
+    CSVGenerator,
+    NDJSONGenerator,
+    XLSXGenerator,
+    crear_exportador
+)
+from .zip_stream import ZipStream
 
-__all__ = ["BaseReportGenerator", "PDFGenerator"]
+__all__ = ["BaseReportGenerator", "PDFGenerator", "PDFRenderPool", "ColaReportesLlena", "pdf_render_pool",
+    "TabularGenerator", "CSVGenerator", "NDJSONGenerator", "XLSXGenerator", "crear_exportador",
+    "ZipStream"
+]
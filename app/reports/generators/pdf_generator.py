@@ -2,7 +2,8 @@
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, BinaryIO, Iterable, Iterator, Optional
 from io import BytesIO
 
 from reportlab.lib import colors
@@ -25,6 +26,38 @@ from app.reports.config import settings
 logger = logging.getLogger(__name__)
 
 
+class _FlujoPerezoso(list):
+    """
+    Lista de flowables que se va llenando desde un iterador.
+
+    `doc.build()` consume la lista desde el frente (`flowables[0]`,
+    `del flowables[0]`), así que solo hace falta tener unos pocos elementos
+    materializados: las tablas de los bloques siguientes se crean cuando
+    reportlab llega a ellas y se liberan en cuanto se dibujan.
+    """
+
+    def __init__(self, elementos: Iterable, adelanto: int = 3):
+        super().__init__()
+        self._pendientes = iter(elementos)
+        self._adelanto = adelanto
+        self._rellenar()
+
+    def _rellenar(self):
+        while self._pendientes is not None and list.__len__(self) < self._adelanto:
+            try:
+                self.append(next(self._pendientes))
+            except StopIteration:
+                self._pendientes = None
+
+    def __len__(self):
+        self._rellenar()
+        return list.__len__(self)
+
+    def __getitem__(self, indice):
+        self._rellenar()
+        return list.__getitem__(self, indice)
+
+
 class PDFGenerator(BaseReportGenerator):
     """Generador de reportes PDF para el sistema de refugio."""
     
@@ -111,7 +144,8 @@ class PDFGenerator(BaseReportGenerator):
         data: List[List[Any]],
         col_widths: Optional[List[float]] = None,
         header_color: Optional[str] = None,
-        alt_row_color: Optional[str] = None
+        alt_row_color: Optional[str] = None,
+        first_row_index: int = 1
     ) -> Table:
         """
         Crea una tabla formateada.
@@ -121,11 +155,14 @@ class PDFGenerator(BaseReportGenerator):
             col_widths: Anchos de columnas personalizados
             header_color: Color del encabezado
             alt_row_color: Color de filas alternas
+            first_row_index: Número de la primera fila de datos en el
+                listado completo (mantiene las filas alternas entre bloques)
         """
         header_color = header_color or settings.pdf_primary_color
         alt_row_color = alt_row_color or settings.pdf_background_color
         
-        table = Table(data, colWidths=col_widths)
+        # El encabezado se repite en cada página en que se parta la tabla
+        table = Table(data, colWidths=col_widths, repeatRows=1)
         
         # Estilo de tabla
         style = TableStyle([
@@ -149,29 +186,63 @@ class PDFGenerator(BaseReportGenerator):
         
         # Filas alternas
         for i in range(1, len(data)):
-            if i % 2 == 0:
+            if (first_row_index + i - 1) % 2 == 0:
                 style.add('BACKGROUND', (0, i), (-1, i),
                          colors.HexColor(alt_row_color))
         
         table.setStyle(style)
         return table
     
+    def _create_table_chunks(
+        self,
+        header: List[str],
+        rows: Iterable[List[Any]],
+        col_widths: Optional[List[float]] = None
+    ) -> Iterator[Table]:
+        """
+        Parte un listado en tablas de `settings.pdf_table_chunk_rows` filas,
+        cada una con su encabezado.
+        
+        Una sola tabla con todas las filas obliga a reportlab a medir y
+        partir la tabla completa en cada página; por bloques, el costo y la
+        memoria por tabla no dependen del total de filas.
+        
+        Args:
+            header: Encabezados de columnas
+            rows: Filas de datos (puede ser un generador)
+            col_widths: Anchos de columnas personalizados
+        """
+        rows = iter(rows)
+        first_row_index = 1
+        while True:
+            chunk = list(islice(rows, settings.pdf_table_chunk_rows))
+            if not chunk:
+                return
+            yield self._create_table(
+                [header] + chunk,
+                col_widths=col_widths,
+                first_row_index=first_row_index
+            )
+            first_row_index += len(chunk)
+    
     def generate(
         self,
         data: List[Dict[str, Any]],
         report_type: str,
+        output: Optional[BinaryIO] = None,
         **kwargs
-    ) -> BytesIO:
+    ) -> BinaryIO:
         """
         Genera el reporte PDF según el tipo especificado.
         
         Args:
             data: Datos para el reporte
             report_type: Tipo de reporte (animales_especie, animales_refugio, etc.)
+            output: Archivo donde escribir el PDF; si es None se usa un BytesIO
             **kwargs: Parámetros adicionales según el tipo de reporte
             
         Returns:
-            BytesIO con el PDF generado
+            `output` (o el BytesIO) con el PDF generado, posicionado al inicio
         """
         generators = {
             "animales_especie": self._generate_animales_por_especie,
@@ -185,26 +256,26 @@ class PDFGenerator(BaseReportGenerator):
             raise ValueError(f"Tipo de reporte no soportado: {report_type}")
         
         logger.info(f"Generando reporte: {report_type}")
-        return generator_func(data, **kwargs)
+        buffer = output if output is not None else BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=self.page_size,
+            author=settings.pdf_author
+        )
+        doc.build(_FlujoPerezoso(generator_func(data, **kwargs)))
+        buffer.seek(0)
+        return buffer
     
     def _generate_animales_por_especie(
         self,
         animales: List[Dict[str, Any]],
         nombre_especie: str
-    ) -> BytesIO:
+    ) -> Iterator:
         """Genera PDF con animales filtrados por especie."""
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=self.page_size,
-            author=settings.pdf_author
-        )
-        elements = []
-        
         # Encabezado
-        elements.extend(self._create_header(
+        yield from self._create_header(
             f"Animales - {nombre_especie}"
-        ))
+        )
         
         # Estadísticas
         total_animales = len(animales)
@@ -218,13 +289,11 @@ class PDFGenerator(BaseReportGenerator):
         <b>Disponibles para adopción:</b> {disponibles}<br/>
         <b>Especie:</b> {nombre_especie}
         """
-        elements.append(Paragraph(stats, self.styles['CustomBody']))
-        elements.append(Spacer(1, 0.3 * inch))
+        yield Paragraph(stats, self.styles['CustomBody'])
+        yield Spacer(1, 0.3 * inch)
         
         # Tabla de animales
-        if animales:
-            table_data = [['Nombre', 'Edad', 'Estado', 'Descripción']]
-            
+        def filas():
             for animal in animales:
                 nombre = self._sanitize_text(animal.get('nombre'), 30)
                 edad_val = animal.get('edad')
@@ -238,43 +307,32 @@ class PDFGenerator(BaseReportGenerator):
                     50
                 )
                 
-                table_data.append([nombre, edad, estado, descripcion])
-            
-            table = self._create_table(
-                table_data,
+                yield [nombre, edad, estado, descripcion]
+        
+        if animales:
+            yield from self._create_table_chunks(
+                ['Nombre', 'Edad', 'Estado', 'Descripción'],
+                filas(),
                 col_widths=[1.5*inch, 1*inch, 1.2*inch, 3*inch]
             )
-            elements.append(table)
         else:
-            elements.append(Paragraph(
+            yield Paragraph(
                 "No se encontraron animales para esta especie.",
                 self.styles['CustomBody']
-            ))
+            )
         
-        # Construir PDF
-        doc.build(elements)
-        buffer.seek(0)
         logger.info(f"PDF generado: {total_animales} animales")
-        return buffer
     
     def _generate_animales_por_refugio(
         self,
         animales: List[Dict[str, Any]],
         nombre_refugio: str
-    ) -> BytesIO:
+    ) -> Iterator:
         """Genera PDF con animales de un refugio específico."""
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=self.page_size,
-            author=settings.pdf_author
-        )
-        elements = []
-        
         # Encabezado
-        elements.extend(self._create_header(
+        yield from self._create_header(
             f"Inventario - {nombre_refugio}"
-        ))
+        )
         
         # Estadísticas por especie
         especies_count = {}
@@ -286,15 +344,11 @@ class PDFGenerator(BaseReportGenerator):
         for especie, count in sorted(especies_count.items()):
             stats += f"<b>{especie}:</b> {count}<br/>"
         
-        elements.append(Paragraph(stats, self.styles['CustomBody']))
-        elements.append(Spacer(1, 0.3 * inch))
+        yield Paragraph(stats, self.styles['CustomBody'])
+        yield Spacer(1, 0.3 * inch)
         
         # Tabla de animales
-        if animales:
-            table_data = [
-                ['Nombre', 'Especie', 'Edad', 'Estado', 'Fecha Ingreso']
-            ]
-            
+        def filas():
             for animal in animales:
                 nombre = self._sanitize_text(animal.get('nombre'), 25)
                 especie = self._sanitize_text(animal.get('especie'), 15)
@@ -307,36 +361,25 @@ class PDFGenerator(BaseReportGenerator):
                 fecha_raw = animal.get('fechaCreacion', 'N/A')
                 fecha = fecha_raw[:10] if fecha_raw and fecha_raw != 'N/A' else 'N/A'
                 
-                table_data.append([nombre, especie, edad, estado, fecha])
-            
-            table = self._create_table(
-                table_data,
-                col_widths=[1.3*inch, 1.2*inch, 0.8*inch, 1.2*inch, 1.2*inch]
-            )
-            elements.append(table)
+                yield [nombre, especie, edad, estado, fecha]
+        
+        yield from self._create_table_chunks(
+            ['Nombre', 'Especie', 'Edad', 'Estado', 'Fecha Ingreso'],
+            filas(),
+            col_widths=[1.3*inch, 1.2*inch, 0.8*inch, 1.2*inch, 1.2*inch]
+        )
         
-        doc.build(elements)
-        buffer.seek(0)
         logger.info(f"PDF inventario generado: {len(animales)} animales")
-        return buffer
     
     def _generate_animales_general(
         self,
         animales: List[Dict[str, Any]]
-    ) -> BytesIO:
+    ) -> Iterator:
         """Genera PDF con reporte general de todos los animales."""
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=self.page_size,
-            author=settings.pdf_author
-        )
-        elements = []
-        
         # Encabezado
-        elements.extend(self._create_header(
+        yield from self._create_header(
             "Reporte General de Animales"
-        ))
+        )
         
         # Estadísticas generales
         total = len(animales)
@@ -362,19 +405,17 @@ class PDFGenerator(BaseReportGenerator):
             porcentaje = (count / total * 100) if total > 0 else 0
             stats += f"• {especie}: {count} ({porcentaje:.1f}%)<br/>"
         
-        elements.append(Paragraph(stats, self.styles['CustomBody']))
-        elements.append(Spacer(1, 0.3 * inch))
+        yield Paragraph(stats, self.styles['CustomBody'])
+        yield Spacer(1, 0.3 * inch)
         
         # Subtítulo
-        elements.append(Paragraph(
+        yield Paragraph(
             "Listado Completo de Animales",
             self.styles['CustomSubtitle']
-        ))
+        )
         
         # Tabla de animales
-        if animales:
-            table_data = [['#', 'Nombre', 'Especie', 'Edad', 'Estado']]
-            
+        def filas():
             for idx, animal in enumerate(animales, 1):
                 nombre = self._sanitize_text(animal.get('nombre'), 30)
                 especie = self._sanitize_text(animal.get('especie'), 15)
@@ -385,34 +426,23 @@ class PDFGenerator(BaseReportGenerator):
                     15
                 )
                 
-                table_data.append([str(idx), nombre, especie, edad, estado])
-            
-            table = self._create_table(
-                table_data,
-                col_widths=[0.5*inch, 1.5*inch, 1.2*inch, 0.8*inch, 1.5*inch]
-            )
-            elements.append(table)
+                yield [str(idx), nombre, especie, edad, estado]
+        
+        yield from self._create_table_chunks(
+            ['#', 'Nombre', 'Especie', 'Edad', 'Estado'],
+            filas(),
+            col_widths=[0.5*inch, 1.5*inch, 1.2*inch, 0.8*inch, 1.5*inch]
+        )
         
-        doc.build(elements)
-        buffer.seek(0)
         logger.info(f"PDF general generado: {total} animales")
-        return buffer
     
     def _generate_campanias(
         self,
         campanias: List[Dict[str, Any]]
-    ) -> BytesIO:
+    ) -> Iterator:
         """Genera PDF con reporte de campañas activas."""
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=self.page_size,
-            author=settings.pdf_author
-        )
-        elements = []
-        
         # Encabezado
-        elements.extend(self._create_header("Campañas Activas"))
+        yield from self._create_header("Campañas Activas")
         
         # Estadísticas
         total_recaudado = sum(c.get('montoRecaudado', 0) for c in campanias)
@@ -428,15 +458,11 @@ class PDFGenerator(BaseReportGenerator):
         <b>Progreso global:</b> {porcentaje_global:.1f}%
         """
         
-        elements.append(Paragraph(stats, self.styles['CustomBody']))
-        elements.append(Spacer(1, 0.3 * inch))
+        yield Paragraph(stats, self.styles['CustomBody'])
+        yield Spacer(1, 0.3 * inch)
         
         # Tabla de campañas
-        if campanias:
-            table_data = [
-                ['Campaña', 'Meta', 'Recaudado', 'Progreso', 'Fecha Fin']
-            ]
-            
+        def filas():
             for campania in campanias:
                 titulo = self._sanitize_text(campania.get('titulo'), 30)
                 meta = f"S/ {campania.get('meta', 0):,.0f}"
@@ -448,15 +474,12 @@ class PDFGenerator(BaseReportGenerator):
                 progreso = f"{progreso_pct:.1f}%"
                 fecha_fin = campania.get('fechaFin', 'N/A')[:10]
                 
-                table_data.append([titulo, meta, recaudado, progreso, fecha_fin])
-            
-            table = self._create_table(
-                table_data,
-                col_widths=[2*inch, 1*inch, 1*inch, 1*inch, 1*inch]
-            )
-            elements.append(table)
+                yield [titulo, meta, recaudado, progreso, fecha_fin]
+        
+        yield from self._create_table_chunks(
+            ['Campaña', 'Meta', 'Recaudado', 'Progreso', 'Fecha Fin'],
+            filas(),
+            col_widths=[2*inch, 1*inch, 1*inch, 1*inch, 1*inch]
+        )
         
-        doc.build(elements)
-        buffer.seek(0)
         logger.info(f"PDF campañas generado: {len(campanias)} campañas")
-        return buffer
@@ -0,0 +1,145 @@
+"""Renderizado de PDFs fuera del event loop, en un pool de procesos."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+from app.reports.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Generador propio de cada proceso worker (se crea en su primer trabajo)
+_generador = None
+
+
+def _obtener_generador():
+    global _generador
+    if _generador is None:
+        from app.reports.generators.pdf_generator import PDFGenerator
+        _generador = PDFGenerator()
+    return _generador
+
+
+def _renderizar(data: List[Dict[str, Any]], report_type: str, kwargs: Dict[str, Any]) -> bytes:
+    """
+    Punto de entrada en el proceso worker. Solo recibe y devuelve datos
+    planos (listas de dicts y bytes), que son baratos de serializar.
+    """
+    return _obtener_generador().generate(data, report_type, **kwargs).getvalue()
+
+
+def _renderizar_archivo(data: List[Dict[str, Any]], report_type: str, ruta: str, kwargs: Dict[str, Any]) -> None:
+    """Como `_renderizar`, pero escribe el PDF en `ruta` y no devuelve el contenido"""
+    with open(ruta, "wb") as archivo:
+        _obtener_generador().generate(data, report_type, output=archivo, **kwargs)
+
+
+class ColaReportesLlena(Exception):
+    """No hay lugar en la cola de renderizado dentro del tiempo de espera"""
+
+
+class PDFRenderPool:
+    """
+    Pool de procesos para `doc.build()` de reportlab con cola acotada.
+
+    Como mucho `workers + queue_size` trabajos están en curso o esperando;
+    el resto espera hasta `queue_timeout` segundos y luego recibe
+    `ColaReportesLlena` (backpressure hacia el cliente, que verá un 503).
+    Con `workers = 0` se renderiza en un hilo del proceso actual.
+
+    Los workers se crean con `forkserver` (o `spawn` donde no existe) y no
+    con `fork`: el proceso ya tiene hilos y un `fork` podría heredar locks
+    tomados, además de copiar toda la app en cada worker. Si un worker
+    muere (OOM, segfault) el pool se reconstruye y el trabajo se reintenta
+    una vez.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        queue_timeout: Optional[float] = None
+    ):
+        self.workers = settings.pdf_process_workers if workers is None else workers
+        self.queue_size = settings.pdf_queue_size if queue_size is None else queue_size
+        self.queue_timeout = settings.pdf_queue_timeout if queue_timeout is None else queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cupos = asyncio.Semaphore(max(self.workers, 1) + self.queue_size)
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers > 0 and self._executor is None:
+            metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(metodo)
+            )
+            logger.info(f"Pool de renderizado PDF iniciado con {self.workers} procesos ({metodo})")
+        return self._executor
+
+    def _descartar(self, executor: ProcessPoolExecutor) -> None:
+        """Descarta un pool roto; el próximo trabajo crea uno nuevo"""
+        if self._executor is executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.warning("Un proceso de renderizado PDF terminó inesperadamente; se reinicia el pool")
+
+    async def _ejecutar(self, funcion, *args):
+        try:
+            await asyncio.wait_for(self._cupos.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ColaReportesLlena(
+                "Hay demasiados reportes en proceso, intente nuevamente en unos segundos"
+            )
+
+        try:
+            for intento in range(2):
+                executor = self._get_executor()
+                if executor is None:
+                    return await asyncio.to_thread(funcion, *args)
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(executor, funcion, *args)
+                except BrokenProcessPool as e:
+                    self._descartar(executor)
+                    if intento == 1:
+                        raise ColaReportesLlena(
+                            "El renderizado de reportes no está disponible, intente nuevamente en unos segundos"
+                        ) from e
+        finally:
+            self._cupos.release()
+
+    async def render(self, data: List[Dict[str, Any]], report_type: str, **kwargs) -> BytesIO:
+        """
+        Genera el PDF sin bloquear el event loop.
+
+        Raises:
+            ColaReportesLlena: Si la cola sigue llena tras `queue_timeout` o
+                el worker muere también en el reintento
+            ValueError: Si el tipo de reporte no existe
+        """
+        return BytesIO(await self._ejecutar(_renderizar, data, report_type, kwargs))
+
+    async def render_to_file(self, data: List[Dict[str, Any]], report_type: str, ruta: str, **kwargs) -> None:
+        """
+        Genera el PDF directamente en `ruta`, sin pasar el contenido entre
+        procesos ni tenerlo completo en memoria.
+
+        Raises:
+            ColaReportesLlena: Si la cola sigue llena tras `queue_timeout` o
+                el worker muere también en el reintento
+            ValueError: Si el tipo de reporte no existe
+        """
+        await self._ejecutar(_renderizar_archivo, data, report_type, ruta, kwargs)
+
+    def shutdown(self) -> None:
+        """Detiene los procesos worker"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Instancia compartida por el proceso
+pdf_render_pool = PDFRenderPool()
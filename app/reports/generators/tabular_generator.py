@@ -0,0 +1,258 @@
+"""Generadores de exportaciones tabulares (CSV, NDJSON y XLSX) por streaming."""
+
+import csv
+import io
+import json
+import math
+import re
+import zipfile
+from abc import abstractmethod
+from io import BytesIO
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Tuple
+from xml.sax.saxutils import escape
+
+from app.reports.generators.base_generator import BaseReportGenerator
+from app.reports.generators.zip_stream import SalidaNoBuscable
+
+# (clave en los datos, encabezado de la columna)
+Columnas = List[Tuple[str, str]]
+
+# Inicios con los que una hoja de cálculo interpreta el texto como fórmula
+_INICIOS_FORMULA = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _neutralizar_formula(valor: Any) -> Any:
+    """
+    Antepone `'` al texto que empieza como una fórmula, para que un nombre
+    o descripción cargado por usuarios (`=cmd|' /C calc'!A0`) se abra
+    como texto y no se ejecute (inyección de fórmulas en CSV).
+    """
+    if isinstance(valor, str) and valor.startswith(_INICIOS_FORMULA):
+        return "'" + valor
+    return valor
+
+
+class TabularGenerator(BaseReportGenerator):
+    """
+    Base de las exportaciones tabulares.
+
+    Las subclases convierten filas en bytes con `_inicio`, `_filas`
+    (obligatorio) y `_fin`; `stream` emite un bloque por cada página de datos recibida, así
+    que el cliente recibe los primeros bytes con la primera página y la
+    memoria usada no depende del total de filas.
+
+    Cada instancia escribe un solo archivo.
+    """
+
+    media_type = "application/octet-stream"
+    extension = ""
+
+    def __init__(self, columnas: Columnas):
+        super().__init__()
+        self.columnas = columnas
+
+    def _inicio(self) -> bytes:
+        return b""
+
+    @abstractmethod
+    def _filas(self, filas: List[Dict[str, Any]]) -> bytes:
+        """Bytes de un bloque de filas; cada subclase define el formato"""
+
+    def _fin(self) -> bytes:
+        return b""
+
+    async def stream(self, paginas: AsyncIterable[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+        """
+        Genera el archivo a partir de páginas de filas que van llegando.
+
+        Args:
+            paginas: Iterador asíncrono de listas de filas
+        """
+        inicio = self._inicio()
+        if inicio:
+            yield inicio
+        async for pagina in paginas:
+            bloque = self._filas(pagina)
+            if bloque:
+                yield bloque
+        fin = self._fin()
+        if fin:
+            yield fin
+
+    def generate(self, data: List[Dict[str, Any]], **kwargs) -> BytesIO:
+        """Genera el archivo completo en memoria (para listados chicos)"""
+        buffer = BytesIO()
+        buffer.write(self._inicio())
+        buffer.write(self._filas(data))
+        buffer.write(self._fin())
+        buffer.seek(0)
+        return buffer
+
+
+class CSVGenerator(TabularGenerator):
+    """
+    CSV en UTF-8 con BOM (para que Excel detecte la codificación). El texto
+    que empieza con `= + - @`, tabulación o retorno se escribe precedido de
+    `'` para que no se evalúe como fórmula.
+    """
+
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def _inicio(self) -> bytes:
+        salida = io.StringIO()
+        csv.writer(salida).writerow([t for _, t in self.columnas])
+        return ("\ufeff" + salida.getvalue()).encode()
+
+    def _filas(self, filas: List[Dict[str, Any]]) -> bytes:
+        salida = io.StringIO()
+        escritor = csv.writer(salida)
+        claves = [c for c, _ in self.columnas]
+        for fila in filas:
+            escritor.writerow(["" if fila.get(c) is None else _neutralizar_formula(fila.get(c)) for c in claves])
+        return salida.getvalue().encode()
+
+
+class NDJSONGenerator(TabularGenerator):
+    """Un objeto JSON por línea, con las columnas como claves"""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def _filas(self, filas: List[Dict[str, Any]]) -> bytes:
+        claves = [c for c, _ in self.columnas]
+        return "".join(
+            json.dumps({c: fila.get(c) for c in claves}, ensure_ascii=False, default=str) + "\n"
+            for fila in filas
+        ).encode()
+
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_PARTES_FIJAS = {
+    "[Content_Types].xml": (
+        f'{_XML}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        f'{_XML}<Relationships xmlns="{_NS_PKG_REL}">'
+        f'<Relationship Id="rId1" Type="{_NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        f'{_XML}<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}">'
+        '<sheets><sheet name="Reporte" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        f'{_XML}<Relationships xmlns="{_NS_PKG_REL}">'
+        f'<Relationship Id="rId1" Type="{_NS_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+# Caracteres de control que XML 1.0 no admite
+_INVALIDOS_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _letra_columna(indice: int) -> str:
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    letras = ""
+    indice += 1
+    while indice:
+        indice, resto = divmod(indice - 1, 26)
+        letras = chr(65 + resto) + letras
+    return letras
+
+
+class XLSXGenerator(TabularGenerator):
+    """
+    Libro XLSX de una hoja escrito con memoria constante.
+
+    Se arma el paquete OOXML mínimo con `zipfile` (sin dependencias
+    externas): las partes fijas primero y luego la hoja, fila por fila,
+    con cadenas en línea en lugar de una tabla de cadenas compartidas.
+
+    El texto se escribe siempre como celda `inlineStr` y nunca como `<f>`,
+    así que un valor que empieza con `=` se muestra tal cual y no se evalúa.
+    """
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+
+    def __init__(self, columnas: Columnas):
+        super().__init__(columnas)
+        self._letras = [_letra_columna(i) for i in range(len(columnas))]
+        self._salida = SalidaNoBuscable()
+        self._zip = None
+        self._hoja = None
+        self._numero_fila = 0
+
+    def _celda(self, referencia: str, valor: Any) -> str:
+        # Solo números como valor; todo lo demás, texto (nunca fórmulas)
+        if valor is None:
+            return ""
+        if isinstance(valor, (int, float)) and not isinstance(valor, bool) and math.isfinite(valor):
+            return f'<c r="{referencia}"><v>{valor}</v></c>'
+        texto = escape(_INVALIDOS_XML.sub("", str(valor)))
+        return f'<c r="{referencia}" t="inlineStr"><is><t xml:space="preserve">{texto}</t></is></c>'
+
+    def _xml_filas(self, filas: Iterable[List[Any]]) -> str:
+        partes = []
+        for valores in filas:
+            self._numero_fila += 1
+            n = self._numero_fila
+            celdas = "".join(
+                self._celda(f"{letra}{n}", valor) for letra, valor in zip(self._letras, valores)
+            )
+            partes.append(f'<row r="{n}">{celdas}</row>')
+        return "".join(partes)
+
+    def _inicio(self) -> bytes:
+        self._zip = zipfile.ZipFile(self._salida, "w", compression=zipfile.ZIP_DEFLATED)
+        for nombre, contenido in _PARTES_FIJAS.items():
+            self._zip.writestr(nombre, contenido)
+        self._hoja = self._zip.open("xl/worksheets/sheet1.xml", "w")
+        encabezados = self._xml_filas([[t for _, t in self.columnas]])
+        self._hoja.write(f"{_XML}<worksheet xmlns=\"{_NS_MAIN}\"><sheetData>{encabezados}".encode())
+        return self._salida.vaciar()
+
+    def _filas(self, filas: List[Dict[str, Any]]) -> bytes:
+        claves = [c for c, _ in self.columnas]
+        self._hoja.write(self._xml_filas([fila.get(c) for c in claves] for fila in filas).encode())
+        return self._salida.vaciar()
+
+    def _fin(self) -> bytes:
+        self._hoja.write(b"</sheetData></worksheet>")
+        self._hoja.close()
+        self._zip.close()
+        return self._salida.vaciar()
+
+
+EXPORTADORES = {
+    "csv": CSVGenerator,
+    "ndjson": NDJSONGenerator,
+    "xlsx": XLSXGenerator,
+}
+
+
+def crear_exportador(formato: str, columnas: Columnas) -> TabularGenerator:
+    """
+    Crea el generador tabular para `formato`.
+
+    Raises:
+        ValueError: Si el formato no está soportado
+    """
+    clase = EXPORTADORES.get(formato)
+    if clase is None:
+        raise ValueError(f"Formato no soportado: {formato}. Opciones: pdf, {', '.join(EXPORTADORES)}")
+    return clase(columnas)
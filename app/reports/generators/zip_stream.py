@@ -0,0 +1,77 @@
+"""Escritura de archivos ZIP por streaming."""
+
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterator, Set
+
+
+class SalidaNoBuscable:
+    """
+    Destino de escritura sin `seek`/`tell`: `zipfile` lo detecta y escribe
+    los tamaños de cada miembro al final (data descriptor), así el ZIP se
+    puede enviar a medida que se genera.
+    """
+
+    def __init__(self):
+        self._datos = bytearray()
+
+    def write(self, datos: bytes) -> int:
+        self._datos += datos
+        return len(datos)
+
+    def flush(self) -> None:
+        pass
+
+    def vaciar(self) -> bytes:
+        datos = bytes(self._datos)
+        self._datos.clear()
+        return datos
+
+
+class ZipStream:
+    """
+    ZIP que se entrega por partes: cada método devuelve los bytes listos
+    para enviar. Los PDF ya vienen comprimidos, así que por defecto los
+    miembros se guardan sin comprimir.
+    """
+
+    def __init__(self, compression: int = zipfile.ZIP_STORED):
+        self._salida = SalidaNoBuscable()
+        self._zip = zipfile.ZipFile(self._salida, "w", compression=compression)
+        self._nombres: Set[str] = set()
+
+    def _nombre_unico(self, nombre: str) -> str:
+        """Agrega un sufijo si ya hay un miembro con ese nombre"""
+        base, punto, extension = nombre.rpartition(".")
+        if not punto:
+            base, extension = nombre, ""
+        candidato, n = nombre, 1
+        while candidato in self._nombres:
+            n += 1
+            candidato = f"{base}_{n}{punto}{extension}"
+        self._nombres.add(candidato)
+        return candidato
+
+    def _info(self, nombre: str) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(self._nombre_unico(nombre), date_time=time.localtime()[:6])
+        info.compress_type = self._zip.compression
+        return info
+
+    def agregar(self, nombre: str, contenido: bytes) -> bytes:
+        """Agrega un miembro con el contenido en memoria"""
+        self._zip.writestr(self._info(nombre), contenido)
+        return self._salida.vaciar()
+
+    def agregar_archivo(self, nombre: str, ruta: Path, bloque: int = 1 << 20) -> Iterator[bytes]:
+        """Agrega un miembro leyendo `ruta` por bloques"""
+        with open(ruta, "rb") as origen, self._zip.open(self._info(nombre), "w") as destino:
+            for parte in iter(lambda: origen.read(bloque), b""):
+                destino.write(parte)
+                yield self._salida.vaciar()
+        yield self._salida.vaciar()
+
+    def cerrar(self) -> bytes:
+        """Escribe el directorio central del ZIP"""
+        self._zip.close()
+        return self._salida.vaciar()
@@ -4,8 +4,13 @@ Queries de agregación generales del sistema.
 
 import strawberry
 from typing import List
-from app.reports.schemas.aggregation_schemas import ActividadMensualType
+from app.reports.schemas.aggregation_schemas import (
+    ActividadMensualType,
+    ActividadMensualResultadoType,
+    FuenteAgregacionType,
+)
 from app.reports.services.aggregation_service import GeneralAggregationService
+from app.shared.interface.partial_results_extension import registrar_fuentes_fallidas
 
 
 @strawberry.type
@@ -13,7 +18,7 @@ class GeneralAggregationQuery:
     """Queries de estadísticas generales que combinan múltiples módulos"""
     
     @strawberry.field(description="Actividad mensual del sistema (adopciones, publicaciones, donaciones)")
-    async def actividad_mensual(self, meses: int = 12) -> List[ActividadMensualType]:
+    async def actividad_mensual(self, info: strawberry.Info, meses: int = 12) -> List[ActividadMensualType]:
         """
         Query 7: Actividad mensual del sistema
         
@@ -23,12 +28,19 @@ class GeneralAggregationQuery:
         - Total de donaciones
         - Monto total donado
         
+        Si una fuente falla, sus contadores quedan en cero y la respuesta lo
+        indica en `extensions.datos_parciales.actividadMensual`.
+        
         Args:
             meses: Número de meses hacia atrás (default: 12)
         """
         service = GeneralAggregationService()
         
-        stats = await service.obtener_actividad_mensual(meses)
+        resultado = await service.obtener_actividad_mensual_detallada(meses)
+        registrar_fuentes_fallidas(info, [
+            {"fuente": estado.fuente, "error": estado.error}
+            for estado in resultado["fuentes"] if not estado.ok
+        ])
         
         return [
             ActividadMensualType(
@@ -38,5 +50,42 @@ class GeneralAggregationQuery:
                 total_donaciones=item["total_donaciones"],
                 monto_total_donado=item["monto_total_donado"]
             )
-            for item in stats
+            for item in resultado["periodos"]
         ]
+    
+    @strawberry.field(description="Actividad mensual indicando qué fuentes respondieron (resultados parciales)")
+    async def actividad_mensual_detallada(self, meses: int = 12) -> ActividadMensualResultadoType:
+        """
+        Igual que actividad_mensual, pero si una fuente (adopciones,
+        publicaciones o pagos) falla o excede su timeout se devuelven los
+        datos del resto junto con el motivo del fallo, en lugar de ceros.
+        
+        Args:
+            meses: Número de meses hacia atrás (default: 12)
+        """
+        service = GeneralAggregationService()
+        
+        resultado = await service.obtener_actividad_mensual_detallada(meses)
+        
+        return ActividadMensualResultadoType(
+            periodos=[
+                ActividadMensualType(
+                    periodo=item["periodo"],
+                    total_adopciones=item["total_adopciones"],
+                    total_publicaciones=item["total_publicaciones"],
+                    total_donaciones=item["total_donaciones"],
+                    monto_total_donado=item["monto_total_donado"]
+                )
+                for item in resultado["periodos"]
+            ],
+            fuentes=[
+                FuenteAgregacionType(
+                    fuente=estado.fuente,
+                    ok=estado.ok,
+                    duracion_ms=estado.duracion_ms,
+                    error=estado.error
+                )
+                for estado in resultado["fuentes"]
+            ],
+            completo=resultado["completo"]
+        )
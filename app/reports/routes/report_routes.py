@@ -1,12 +1,16 @@
 """Rutas FastAPI para generación de reportes PDF."""
 
 import logging
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from typing import Optional
 
-from app.reports.services import ReportService
-from app.reports.schemas import ReportFilterDTO
+from app.reports.generators import ColaReportesLlena
+from app.reports.services import GestorNoIniciado, ReportService, ReportJobManager, ReportePDF, ReportScheduler
+from app.reports.services.report_service import normalizar_solicitud
+from app.reports.schemas import BulkReportRequest, ReportFilterDTO, ReportJobRequest, ReportJobStatus
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,66 @@ router = APIRouter(
 # Instancia del servicio (singleton)
 report_service = ReportService()
 
+# Trabajos en segundo plano (se inician en el lifespan de la app)
+report_jobs = ReportJobManager(report_service)
+
+# Reportes pregenerados en segundo plano (se inician en el lifespan de la app)
+report_scheduler = ReportScheduler(report_service)
+
+
+def _respuesta_pdf(request: Request, reporte: ReportePDF, filename: str) -> Response:
+    """
+    Respuesta HTTP para un PDF: 304 si el cliente ya tiene esta versión
+    (If-None-Match), el archivo en disco si está en la caché de disco, o el
+    contenido en memoria.
+    """
+    headers = {
+        "ETag": reporte.etag,
+        "Cache-Control": "no-cache"
+    }
+    if reporte.coincide(request.headers.get("if-none-match")):
+        if reporte.temporal:
+            reporte.ruta.unlink(missing_ok=True)
+        return Response(status_code=304, headers=headers)
+    
+    if reporte.ruta is not None:
+        # Se envía desde disco por bloques, sin cargarlo en memoria
+        return FileResponse(
+            reporte.ruta,
+            media_type="application/pdf",
+            filename=filename,
+            headers=headers,
+            background=BackgroundTask(reporte.ruta.unlink, missing_ok=True) if reporte.temporal else None
+        )
+    
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return StreamingResponse(
+        reporte.buffer(),
+        media_type="application/pdf",
+        headers=headers
+    )
+
+
+def _formato_query():
+    return Query(
+        "pdf",
+        alias="format",
+        pattern="^(pdf|csv|ndjson|xlsx)$",
+        description="Formato de salida: pdf, csv, ndjson o xlsx (los tabulares se envían por streaming)"
+    )
+
+
+async def _respuesta_tabular(exportacion) -> StreamingResponse:
+    """Respuesta por streaming para una exportación CSV/NDJSON/XLSX"""
+    stream, filename, media_type = await exportacion
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
+        }
+    )
+
 
 # ========== ENDPOINT DE PRUEBA ==========
 
@@ -31,7 +95,7 @@ report_service = ReportService()
     summary="Genera PDF de prueba",
     description="Genera un PDF de prueba con datos ficticios. No requiere datos reales."
 )
-async def test_generar_pdf():
+async def test_generar_pdf(request: Request):
     """
     Endpoint de prueba para verificar que el generador de PDF funciona.
     
@@ -42,15 +106,9 @@ async def test_generar_pdf():
     try:
         logger.info("Solicitud de reporte de prueba recibida")
         
-        pdf_buffer, filename = report_service.generar_reporte_prueba()
+        reporte, filename = await report_service.generar_reporte_prueba()
         
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        return _respuesta_pdf(request, reporte, filename)
     
     except Exception as e:
         logger.error(f"Error generando PDF de prueba: {e}")
@@ -68,34 +126,40 @@ async def test_generar_pdf():
     description="Genera PDF con todos los animales de una especie específica"
 )
 async def generar_pdf_animales_por_especie(
+    request: Request,
     id_especie: str = Query(
         ...,
         description="UUID de la especie",
         example="uuid-de-especie-aqui"
-    )
+    ),
+    formato: str = _formato_query()
 ):
     """
     Genera PDF con animales filtrados por especie.
     
     **Parámetros:**
     - `id_especie`: UUID de la especie (requerido)
+    - `format`: pdf (por defecto), csv, ndjson o xlsx
     
     **Ejemplo:** `GET /api/reports/animales/por-especie/pdf?id_especie=uuid-aqui`
     """
     try:
         logger.info(f"Solicitud de reporte por especie: {id_especie}")
         
-        pdf_buffer, filename = await report_service.generar_reporte_animales_por_especie(
+        if formato != "pdf":
+            return await _respuesta_tabular(
+                report_service.exportar_animales(formato, "animales_por_especie", id_especie=id_especie)
+            )
+        
+        reporte, filename = await report_service.generar_reporte_animales_por_especie(
             id_especie
         )
         
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        return _respuesta_pdf(request, reporte, filename)
+    
+    except ColaReportesLlena as e:
+        logger.warning(f"Cola de reportes llena: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     
     except ValueError as e:
         logger.warning(f"No se encontraron datos: {e}")
@@ -112,34 +176,40 @@ async def generar_pdf_animales_por_especie(
     description="Genera PDF con inventario de animales de un refugio específico"
 )
 async def generar_pdf_animales_por_refugio(
+    request: Request,
     id_refugio: str = Query(
         ...,
         description="UUID del refugio",
         example="uuid-de-refugio-aqui"
-    )
+    ),
+    formato: str = _formato_query()
 ):
     """
     Genera PDF con animales de un refugio específico.
     
     **Parámetros:**
     - `id_refugio`: UUID del refugio (requerido)
+    - `format`: pdf (por defecto), csv, ndjson o xlsx
     
     **Ejemplo:** `GET /api/reports/animales/por-refugio/pdf?id_refugio=uuid-aqui`
     """
     try:
         logger.info(f"Solicitud de reporte por refugio: {id_refugio}")
         
-        pdf_buffer, filename = await report_service.generar_reporte_animales_por_refugio(
+        if formato != "pdf":
+            return await _respuesta_tabular(
+                report_service.exportar_animales(formato, "animales_por_refugio", id_refugio=id_refugio)
+            )
+        
+        reporte, filename = await report_service.generar_reporte_animales_por_refugio(
             id_refugio
         )
         
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        return _respuesta_pdf(request, reporte, filename)
+    
+    except ColaReportesLlena as e:
+        logger.warning(f"Cola de reportes llena: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     
     except ValueError as e:
         logger.warning(f"No se encontraron datos: {e}")
@@ -155,26 +225,34 @@ async def generar_pdf_animales_por_refugio(
     summary="Reporte general de animales",
     description="Genera PDF con reporte general de todos los animales disponibles"
 )
-async def generar_pdf_general_animales():
+async def generar_pdf_general_animales(request: Request, formato: str = _formato_query()):
     """
     Genera PDF con reporte general de todos los animales disponibles.
     
-    **No requiere parámetros.**
+    **Parámetros:**
+    - `format`: pdf (por defecto), csv, ndjson o xlsx
     
     **Ejemplo:** `GET /api/reports/animales/general/pdf`
     """
     try:
         logger.info("Solicitud de reporte general de animales")
         
-        pdf_buffer, filename = await report_service.generar_reporte_animales_general()
+        if formato != "pdf":
+            return await _respuesta_tabular(
+                report_service.exportar_animales(formato, "reporte_general_animales", estado_adopcion="disponible")
+            )
         
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        # Último archivo pregenerado; si todavía no existe, se genera ahora
+        pregenerado = report_scheduler.obtener("animales_general")
+        if pregenerado is None:
+            pregenerado = await report_service.generar_reporte_animales_general()
+        reporte, filename = pregenerado
+        
+        return _respuesta_pdf(request, reporte, filename)
+    
+    except ColaReportesLlena as e:
+        logger.warning(f"Cola de reportes llena: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     
     except ValueError as e:
         logger.warning(f"No se encontraron datos: {e}")
@@ -191,6 +269,7 @@ async def generar_pdf_general_animales():
     description="Genera PDF con animales usando filtros combinados"
 )
 async def generar_pdf_animales_filtrados(
+    request: Request,
     nombre: Optional[str] = Query(
         None,
         description="Búsqueda parcial por nombre",
@@ -222,7 +301,8 @@ async def generar_pdf_animales_filtrados(
         description="Edad máxima",
         example=5,
         ge=0
-    )
+    ),
+    formato: str = _formato_query()
 ):
     """
     Genera PDF con animales usando filtros combinados.
@@ -234,6 +314,7 @@ async def generar_pdf_animales_filtrados(
     - `estado_adopcion`: Estado de adopción (disponible, adoptado, etc.)
     - `edad_min`: Edad mínima
     - `edad_max`: Edad máxima
+    - `format`: pdf (por defecto), csv, ndjson o xlsx
     
     **Ejemplo:** `GET /api/reports/animales/filtrados/pdf?id_especie=uuid&edad_min=1&edad_max=3`
     """
@@ -250,17 +331,22 @@ async def generar_pdf_animales_filtrados(
             edad_max=edad_max
         )
         
-        pdf_buffer, filename = await report_service.generar_reporte_animales_filtrados(
+        if formato != "pdf":
+            return await _respuesta_tabular(
+                report_service.exportar_animales(
+                    formato, "animales_filtrados", **filtros.model_dump(exclude_none=True)
+                )
+            )
+        
+        reporte, filename = await report_service.generar_reporte_animales_filtrados(
             filtros
         )
         
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        return _respuesta_pdf(request, reporte, filename)
+    
+    except ColaReportesLlena as e:
+        logger.warning(f"Cola de reportes llena: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     
     except ValueError as e:
         logger.warning(f"No se encontraron datos: {e}")
@@ -278,26 +364,34 @@ async def generar_pdf_animales_filtrados(
     summary="Reporte de campañas activas",
     description="Genera PDF con reporte de todas las campañas activas"
 )
-async def generar_pdf_campanias():
+async def generar_pdf_campanias(request: Request, formato: str = _formato_query()):
     """
     Genera PDF con reporte de campañas activas.
     
-    **No requiere parámetros.**
+    **Parámetros:**
+    - `format`: pdf (por defecto), csv, ndjson o xlsx
     
     **Ejemplo:** `GET /api/reports/campanias/pdf`
     """
     try:
         logger.info("Solicitud de reporte de campañas")
         
-        pdf_buffer, filename = await report_service.generar_reporte_campanias()
+        if formato != "pdf":
+            return await _respuesta_tabular(
+                report_service.exportar_campanias(formato)
+            )
         
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        # Último archivo pregenerado; si todavía no existe, se genera ahora
+        pregenerado = report_scheduler.obtener("campanias")
+        if pregenerado is None:
+            pregenerado = await report_service.generar_reporte_campanias()
+        reporte, filename = pregenerado
+        
+        return _respuesta_pdf(request, reporte, filename)
+    
+    except ColaReportesLlena as e:
+        logger.warning(f"Cola de reportes llena: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     
     except ValueError as e:
         logger.warning(f"No se encontraron datos: {e}")
@@ -308,6 +402,142 @@ async def generar_pdf_campanias():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ========== LOTES DE REPORTES ==========
+
+@router.post(
+    "/bulk",
+    summary="Varios reportes en un ZIP",
+    description="Genera varios reportes PDF con una sola consulta por fuente de datos y los devuelve en un ZIP"
+)
+async def generar_lote_reportes(solicitud: BulkReportRequest):
+    """
+    Genera un ZIP con varios reportes.
+    
+    Los datos comunes (especies, animales, refugios, campañas) se consultan
+    una sola vez para todo el lote y los PDF se renderizan en paralelo; el
+    ZIP se envía a medida que cada uno termina. Los reportes que fallan se
+    listan en `errores.txt` dentro del ZIP.
+    
+    **Ejemplo:** `POST /api/reports/bulk` con
+    `{"todos_los_refugios": true, "reportes": [{"tipo": "animales_general"}]}`
+    """
+    try:
+        solicitudes = [
+            (reporte.tipo, normalizar_solicitud(reporte.tipo, reporte.parametros))
+            for reporte in solicitud.reportes
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    if not solicitudes and not solicitud.todos_los_refugios:
+        raise HTTPException(status_code=422, detail="El lote no tiene reportes")
+    
+    logger.info(f"Solicitud de lote: {len(solicitudes)} reportes, todos_los_refugios={solicitud.todos_los_refugios}")
+    try:
+        lote = await report_service.preparar_lote(solicitudes, solicitud.todos_los_refugios)
+    
+    except ValueError as e:
+        logger.warning(f"No se encontraron datos: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    except Exception as e:
+        logger.error(f"Error preparando el lote de reportes: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    filename = f"reportes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return StreamingResponse(
+        report_service.generar_zip_lote(lote),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
+        }
+    )
+
+
+# ========== TRABAJOS EN SEGUNDO PLANO ==========
+
+@router.post(
+    "/jobs",
+    status_code=202,
+    response_model=ReportJobStatus,
+    summary="Encola un reporte",
+    description="Encola la generación de un reporte y devuelve el id del trabajo sin esperar el PDF"
+)
+async def crear_trabajo_reporte(solicitud: ReportJobRequest):
+    """
+    Encola un reporte para generarlo en segundo plano.
+    
+    Si ya hay un trabajo idéntico (mismo tipo y parámetros) sin terminar,
+    se devuelve ese mismo trabajo.
+    
+    **Ejemplo:** `POST /api/reports/jobs` con
+    `{"tipo": "animales_especie", "parametros": {"id_especie": "uuid-aqui"}}`
+    """
+    try:
+        trabajo = report_jobs.encolar(solicitud.tipo, solicitud.parametros)
+        return trabajo.a_dict()
+    
+    except ColaReportesLlena as e:
+        logger.warning(f"Cola de trabajos llena: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    
+    except GestorNoIniciado as e:
+        logger.warning(f"Trabajo rechazado: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get(
+    "/jobs/{id_trabajo}",
+    response_model=ReportJobStatus,
+    summary="Estado de un trabajo de reporte",
+    description="Devuelve el estado, los tiempos y la URL de descarga cuando el reporte está listo"
+)
+async def obtener_trabajo_reporte(id_trabajo: str):
+    """
+    Consulta el estado de un trabajo.
+    
+    **Ejemplo:** `GET /api/reports/jobs/{id}`
+    """
+    trabajo = report_jobs.obtener(id_trabajo)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail=f"Trabajo no encontrado: {id_trabajo}")
+    return trabajo.a_dict()
+
+
+@router.get(
+    "/jobs/{id_trabajo}/download",
+    summary="Descarga el PDF de un trabajo",
+    description="Descarga el reporte de un trabajo completado"
+)
+async def descargar_trabajo_reporte(id_trabajo: str):
+    """
+    Descarga el PDF generado por un trabajo.
+    
+    Responde 409 si el trabajo todavía no terminó o terminó con error.
+    
+    **Ejemplo:** `GET /api/reports/jobs/{id}/download`
+    """
+    trabajo = report_jobs.obtener(id_trabajo)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail=f"Trabajo no encontrado: {id_trabajo}")
+    if trabajo.estado != "completado":
+        raise HTTPException(
+            status_code=409,
+            detail=trabajo.error or f"El trabajo está {trabajo.estado}"
+        )
+    if not trabajo.ruta.exists():
+        raise HTTPException(status_code=404, detail="El reporte ya no está disponible")
+    
+    return FileResponse(
+        trabajo.ruta,
+        media_type="application/pdf",
+        filename=trabajo.archivo
+    )
+
+
 # ========== HEALTH CHECK ==========
 
 @router.get(
@@ -331,6 +561,8 @@ async def health_check():
             "animales_refugio": "/api/reports/animales/por-refugio/pdf",
             "animales_general": "/api/reports/animales/general/pdf",
             "animales_filtrados": "/api/reports/animales/filtrados/pdf",
-            "campanias": "/api/reports/campanias/pdf"
+            "campanias": "/api/reports/campanias/pdf",
+            "bulk": "/api/reports/bulk",
+            "jobs": "/api/reports/jobs"
         }
     }
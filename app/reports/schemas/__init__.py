@@ -5,7 +5,10 @@ from .report_schemas import (
     RefugioReportDTO,
     CampaniaReportDTO,
     ReportFilterDTO,
-    ReportMetadata
+    ReportMetadata,
+    ReportJobRequest,
+    ReportJobStatus,
+    BulkReportRequest
 )
 
 __all__ = [
@@ -13,5 +16,8 @@ __all__ = [
     "RefugioReportDTO", 
     "CampaniaReportDTO",
     "ReportFilterDTO",
-    "ReportMetadata"
+    "ReportMetadata",
+    "ReportJobRequest",
+    "ReportJobStatus",
+    "BulkReportRequest"
 ]
@@ -3,7 +3,7 @@ Tipos de agregación para estadísticas generales del sistema.
 """
 
 import strawberry
-from typing import List
+from typing import List, Optional
 
 
 @strawberry.type(description="Actividad mensual del sistema")
@@ -15,3 +15,22 @@ class ActividadMensualType:
     total_publicaciones: int = strawberry.field(description="Total de publicaciones en el mes")
     total_donaciones: int = strawberry.field(description="Total de donaciones en el mes")
     monto_total_donado: float = strawberry.field(description="Monto total donado en el mes (S/)")
+
+
+@strawberry.type(description="Estado de una fuente de datos consultada por una agregación")
+class FuenteAgregacionType:
+    """Indica si una fuente respondió y, si no, por qué."""
+    
+    fuente: str = strawberry.field(description="Nombre de la fuente (adopciones, publicaciones, pagos)")
+    ok: bool = strawberry.field(description="True si la fuente respondió correctamente")
+    duracion_ms: float = strawberry.field(description="Tiempo que tardó la consulta (ms)")
+    error: Optional[str] = strawberry.field(default=None, description="Motivo del fallo, si lo hubo")
+
+
+@strawberry.type(description="Actividad mensual con el estado de cada fuente")
+class ActividadMensualResultadoType:
+    """Actividad mensual que indica si el resultado es parcial."""
+    
+    periodos: List[ActividadMensualType] = strawberry.field(description="Actividad por mes")
+    fuentes: List[FuenteAgregacionType] = strawberry.field(description="Estado de cada fuente consultada")
+    completo: bool = strawberry.field(description="False si alguna fuente falló y los totales son parciales")
@@ -1,6 +1,6 @@
 """Schemas para validación de datos de reportes."""
 
-from typing import Optional, List
+from typing import Any, Dict, Literal, Optional, List
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -70,3 +70,46 @@ class ReportMetadata(BaseModel):
     total_registros: int
     autor: str = "Sistema de Refugio Animal"
     version: str = "1.0.0"
+
+
+TipoReporte = Literal[
+    "prueba",
+    "animales_especie",
+    "animales_refugio",
+    "animales_general",
+    "animales_filtrados",
+    "campanias",
+]
+
+
+class ReportJobRequest(BaseModel):
+    """Solicitud de un reporte en segundo plano."""
+    
+    tipo: TipoReporte
+    # id_especie, id_refugio o los campos de ReportFilterDTO según el tipo
+    parametros: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BulkReportRequest(BaseModel):
+    """Solicitud de varios reportes en un solo ZIP."""
+    
+    reportes: List[ReportJobRequest] = Field(default_factory=list)
+    # Agrega un reporte de inventario por cada refugio registrado
+    todos_los_refugios: bool = False
+
+
+class ReportJobStatus(BaseModel):
+    """Estado de un trabajo de reporte."""
+    
+    id: str
+    tipo: TipoReporte
+    estado: Literal["pendiente", "en_proceso", "completado", "error"]
+    parametros: Dict[str, Any] = Field(default_factory=dict)
+    creado_en: datetime
+    iniciado_en: Optional[datetime] = None
+    finalizado_en: Optional[datetime] = None
+    segundos_en_cola: Optional[float] = None
+    segundos_ejecucion: Optional[float] = None
+    archivo: Optional[str] = None
+    error: Optional[str] = None
+    url_descarga: Optional[str] = None
@@ -1,5 +1,8 @@
 """Exporta los servicios del módulo."""
 
+from .report_cache import ReportCache, ReportePDF
 from .report_service import ReportService
+from .report_jobs import GestorNoIniciado, ReportJob, ReportJobManager
+from .report_scheduler import ReportScheduler
 
-__all__ = ["ReportService"]
+__all__ = ["ReportCache", "ReportePDF", "ReportService", "GestorNoIniciado", "ReportJob", "ReportJobManager", "ReportScheduler"]
@@ -3,21 +3,67 @@ Servicio de agregación para estadísticas generales del sistema.
 Implementa lógica de negocio para queries analíticas que combinan múltiples módulos.
 """
 
-from typing import List, Dict
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+import httpx
 from app.modules.adopcion.infrastructure.adopcion_repository import AdopcionRepository
 from app.modules.publicacion.infrastructure.publicacion_repository import PublicacionRepository
 from app.modules.pago.infrastructure.pago_repository import PagoRepository
+from app.reports.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EstadoFuente:
+    """Resultado de consultar una fuente de datos de la agregación"""
+    fuente: str
+    ok: bool
+    duracion_ms: float
+    error: Optional[str] = None
 
 
 class GeneralAggregationService:
     """Servicio para consultas de agregación general del sistema"""
     
-    def __init__(self):
+    def __init__(self, timeout: Optional[float] = None):
         self.adopcion_repo = AdopcionRepository()
         self.publicacion_repo = PublicacionRepository()
         self.pago_repo = PagoRepository()
+        self.timeout = settings.aggregation_source_timeout if timeout is None else timeout
+    
+    async def _consultar_fuente(
+        self,
+        fuente: str,
+        cargar: Callable[[], Awaitable[List[Any]]]
+    ) -> Tuple[EstadoFuente, Optional[List[Any]]]:
+        """
+        Ejecuta una fuente con su propio timeout. Nunca lanza: los fallos
+        quedan registrados en el EstadoFuente devuelto.
+        """
+        inicio = time.perf_counter()
+        error = None
+        datos = None
+        try:
+            datos = await asyncio.wait_for(cargar(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            error = f"Tiempo de espera agotado ({self.timeout}s)"
+        except httpx.HTTPStatusError as e:
+            error = f"El backend respondió HTTP {e.response.status_code}"
+        except httpx.HTTPError as e:
+            error = f"Error de conexión: {e.__class__.__name__}"
+        except Exception as e:
+            error = f"{e.__class__.__name__}: {e}"
+        
+        duracion_ms = round((time.perf_counter() - inicio) * 1000, 1)
+        if error:
+            logger.warning(f"Fuente '{fuente}' no disponible para actividad mensual: {error}")
+        return EstadoFuente(fuente=fuente, ok=error is None, duracion_ms=duracion_ms, error=error), datos
     
     async def obtener_actividad_mensual(self, meses: int = 12) -> List[Dict[str, any]]:
         """
@@ -27,8 +73,29 @@ class GeneralAggregationService:
             meses: Número de meses hacia atrás a consultar (default: 12)
         
         Returns:
-            Lista de diccionarios con actividad por mes
+            Lista de diccionarios con actividad por mes; las fuentes que
+            fallen cuentan como cero (ver `obtener_actividad_mensual_detallada`)
         """
+        resultado = await self.obtener_actividad_mensual_detallada(meses)
+        return resultado["periodos"]
+    
+    async def obtener_actividad_mensual_detallada(self, meses: int = 12) -> Dict[str, any]:
+        """
+        Igual que `obtener_actividad_mensual`, pero indica además qué fuentes
+        respondieron. Las tres fuentes se consultan en paralelo, cada una con
+        su propio timeout: la latencia es la de la más lenta, y si una falla
+        el resto de la actividad se devuelve igual.
+        
+        Returns:
+            Diccionario con: periodos (actividad por mes), fuentes (EstadoFuente
+            por fuente) y completo (True si todas respondieron)
+        """
+        (estado_adopciones, adopciones), (estado_publicaciones, publicaciones), (estado_pagos, pagos) = await asyncio.gather(
+            self._consultar_fuente("adopciones", self.adopcion_repo.listar_adopciones),
+            self._consultar_fuente("publicaciones", self.publicacion_repo.listar_publicaciones),
+            self._consultar_fuente("pagos", self.pago_repo.listar_pagos)
+        )
+        
         # Fecha límite
         fecha_limite = datetime.now(timezone.utc) - timedelta(days=30 * meses)
         
@@ -41,60 +108,45 @@ class GeneralAggregationService:
         })
         
         # 1. Contar adopciones por mes
-        try:
-            adopciones = await self.adopcion_repo.listar_adopciones()
-            estados_excluidos = ['rechazada', 'rechazado', 'cancelada', 'cancelado']
-            
-            for adopcion in adopciones:
-                if adopcion.fecha_adopcion and (adopcion.estado and adopcion.estado.lower() not in estados_excluidos):
-                    # Normalizar timezone
-                    fecha = adopcion.fecha_adopcion
-                    if fecha.tzinfo is None:
-                        fecha = fecha.replace(tzinfo=timezone.utc)
-                    
-                    if fecha >= fecha_limite:
-                        periodo = fecha.strftime("%Y-%m")
-                        actividad_por_mes[periodo]["total_adopciones"] += 1
-        except Exception:
-            pass
+        estados_excluidos = ['rechazada', 'rechazado', 'cancelada', 'cancelado']
+        for adopcion in adopciones or []:
+            if adopcion.fecha_adopcion and (adopcion.estado and adopcion.estado.lower() not in estados_excluidos):
+                # Normalizar timezone
+                fecha = adopcion.fecha_adopcion
+                if fecha.tzinfo is None:
+                    fecha = fecha.replace(tzinfo=timezone.utc)
+                
+                if fecha >= fecha_limite:
+                    periodo = fecha.strftime("%Y-%m")
+                    actividad_por_mes[periodo]["total_adopciones"] += 1
         
         # 2. Contar publicaciones por mes
-        try:
-            publicaciones = await self.publicacion_repo.listar_publicaciones()
-            
-            for publicacion in publicaciones:
-                if publicacion.fecha_publicacion:
-                    # Normalizar timezone
-                    fecha = publicacion.fecha_publicacion
-                    if fecha.tzinfo is None:
-                        fecha = fecha.replace(tzinfo=timezone.utc)
-                    
-                    if fecha >= fecha_limite:
-                        periodo = fecha.strftime("%Y-%m")
-                        actividad_por_mes[periodo]["total_publicaciones"] += 1
-        except Exception:
-            pass
+        for publicacion in publicaciones or []:
+            if publicacion.fecha_publicacion:
+                # Normalizar timezone
+                fecha = publicacion.fecha_publicacion
+                if fecha.tzinfo is None:
+                    fecha = fecha.replace(tzinfo=timezone.utc)
+                
+                if fecha >= fecha_limite:
+                    periodo = fecha.strftime("%Y-%m")
+                    actividad_por_mes[periodo]["total_publicaciones"] += 1
         
         # 3. Contar donaciones (pagos) por mes
-        try:
-            pagos = await self.pago_repo.listar_pagos()
+        for pago in pagos or []:
+            # Usar fecha_pago_completado si existe, sino create_at
+            fecha_pago = pago.fecha_pago_completado if pago.fecha_pago_completado else pago.create_at
             
-            for pago in pagos:
-                # Usar fecha_pago_completado si existe, sino create_at
-                fecha_pago = pago.fecha_pago_completado if pago.fecha_pago_completado else pago.create_at
+            if fecha_pago and pago.estado_pago and pago.estado_pago.lower() in ['completado', 'succeeded', 'success']:
+                # Normalizar timezone
+                fecha = fecha_pago
+                if fecha.tzinfo is None:
+                    fecha = fecha.replace(tzinfo=timezone.utc)
                 
-                if fecha_pago and pago.estado_pago and pago.estado_pago.lower() in ['completado', 'succeeded', 'success']:
-                    # Normalizar timezone
-                    fecha = fecha_pago
-                    if fecha.tzinfo is None:
-                        fecha = fecha.replace(tzinfo=timezone.utc)
-                    
-                    if fecha >= fecha_limite:
-                        periodo = fecha.strftime("%Y-%m")
-                        actividad_por_mes[periodo]["total_donaciones"] += 1
-                        actividad_por_mes[periodo]["monto_total_donado"] += float(pago.monto) if pago.monto else 0.0
-        except Exception:
-            pass
+                if fecha >= fecha_limite:
+                    periodo = fecha.strftime("%Y-%m")
+                    actividad_por_mes[periodo]["total_donaciones"] += 1
+                    actividad_por_mes[periodo]["monto_total_donado"] += float(pago.monto) if pago.monto else 0.0
         
         # Convertir a lista ordenada por fecha
         resultado = []
@@ -108,4 +160,9 @@ class GeneralAggregationService:
                 "monto_total_donado": round(stats["monto_total_donado"], 2)
             })
         
-        return resultado
+        fuentes = [estado_adopciones, estado_publicaciones, estado_pagos]
+        return {
+            "periodos": resultado,
+            "fuentes": fuentes,
+            "completo": all(f.ok for f in fuentes)
+        }
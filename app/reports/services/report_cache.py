@@ -0,0 +1,253 @@
+"""
+Caché de reportes direccionada por contenido.
+
+La clave es el hash del tipo de reporte, sus parámetros y los datos ya
+obtenidos de GraphQL: si los datos no cambiaron, el PDF no se vuelve a
+renderizar. Los PDF chicos quedan en un LRU en memoria y los grandes en
+`settings.temp_dir/cache`, desde donde se sirven con `FileResponse`.
+
+El ETag es el hash de los bytes del PDF, así que es un validador fuerte:
+si una entrada se descarta y se vuelve a renderizar, el ETag cambia.
+
+Cada lectura del nivel en disco recibe su propio enlace duro al archivo
+(`ReportePDF.temporal`): aunque otra solicitud desaloje la entrada, el
+archivo que se está enviando sigue existiendo hasta que se borra el enlace.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from app.reports import __version__
+from app.reports.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def calcular_etag(contenido: bytes) -> str:
+    return f'"{hashlib.sha256(contenido).hexdigest()[:32]}"'
+
+
+def calcular_etag_archivo(ruta: Path, bloque: int = 1 << 20) -> str:
+    """ETag de un archivo, leyéndolo por bloques"""
+    digest = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        for parte in iter(lambda: archivo.read(bloque), b""):
+            digest.update(parte)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+@dataclass
+class ReportePDF:
+    """PDF generado o recuperado de la caché"""
+    etag: str
+    contenido: Optional[bytes] = None
+    ruta: Optional[Path] = None
+    # El archivo no pertenece a la caché: se borra después de enviarlo
+    temporal: bool = False
+
+    def leer(self) -> bytes:
+        if self.contenido is not None:
+            return self.contenido
+        return self.ruta.read_bytes()
+
+    def buffer(self) -> BytesIO:
+        return BytesIO(self.leer())
+
+    def coincide(self, if_none_match: Optional[str]) -> bool:
+        """True si el encabezado If-None-Match incluye este ETag"""
+        if not if_none_match:
+            return False
+        etiquetas = [e.strip() for e in if_none_match.split(",")]
+        # If-None-Match usa comparación débil: se ignora el prefijo W/
+        return "*" in etiquetas or self.etag in (e[2:] if e.startswith("W/") else e for e in etiquetas)
+
+
+def reporte_sin_cache(resultado: Union[bytes, Path]) -> ReportePDF:
+    """ReportePDF de un render que no pasa por la caché (contenido o archivo temporal)"""
+    if isinstance(resultado, Path):
+        return ReportePDF(etag=calcular_etag_archivo(resultado), ruta=resultado, temporal=True)
+    return ReportePDF(etag=calcular_etag(resultado), contenido=resultado)
+
+
+def _mtime(ruta: Path) -> Optional[float]:
+    """Fecha de modificación, o None si otro hilo ya borró el archivo"""
+    try:
+        return ruta.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+class ReportCache:
+    """LRU en memoria para PDF chicos y directorio en disco para el resto"""
+
+    def __init__(
+        self,
+        directorio: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_bytes_memoria: Optional[int] = None,
+        max_archivos: Optional[int] = None
+    ):
+        self.directorio = Path(directorio or settings.temp_dir) / "cache"
+        self.max_items = settings.cache_memory_items if max_items is None else max_items
+        self.max_bytes_memoria = (
+            settings.cache_memory_max_item_bytes if max_bytes_memoria is None else max_bytes_memoria
+        )
+        self.max_archivos = settings.cache_disk_max_files if max_archivos is None else max_archivos
+        self._memoria: "OrderedDict[str, ReportePDF]" = OrderedDict()
+        # ETag de los archivos en disco, para no volver a leerlos
+        self._etags_disco: Dict[str, str] = {}
+        # Renders en curso por clave: las solicitudes idénticas esperan el mismo
+        self._en_curso: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def clave(report_type: str, data: List[Dict[str, Any]], kwargs: Dict[str, Any]) -> str:
+        """Hash del tipo de reporte, sus parámetros y el conjunto de datos"""
+        contenido = json.dumps(
+            [__version__, report_type, kwargs, data], sort_keys=True, default=str, separators=(",", ":")
+        )
+        return hashlib.sha256(contenido.encode()).hexdigest()
+
+    def _ruta(self, clave: str) -> Path:
+        return self.directorio / f"{clave}.pdf"
+
+    async def obtener(self, clave: str) -> Optional[ReportePDF]:
+        """
+        PDF de `clave`, o None si no está. Los del nivel en disco se
+        devuelven como un enlace propio (`temporal`) que quien lo envía borra.
+        """
+        reporte = self._memoria.get(clave)
+        if reporte is not None:
+            self._memoria.move_to_end(clave)
+            return reporte
+
+        enlace = await asyncio.to_thread(self._reservar, clave)
+        if enlace is None:
+            self._etags_disco.pop(clave, None)
+            return None
+        etag = self._etags_disco.get(clave)
+        if etag is None:
+            # Archivo de una ejecución anterior
+            etag = await asyncio.to_thread(calcular_etag_archivo, enlace)
+            self._etags_disco[clave] = etag
+        return ReportePDF(etag=etag, ruta=enlace, temporal=enlace != self._ruta(clave))
+
+    async def obtener_o_generar(
+        self,
+        clave: str,
+        renderizar: Callable[[], Awaitable[Union[bytes, Path]]]
+    ) -> ReportePDF:
+        """
+        PDF de `clave` desde la caché o, si no está, desde `renderizar()`
+        (contenido o archivo ya escrito), que se guarda.
+
+        Las solicitudes simultáneas de una misma clave esperan un único
+        render; cancelar a una de ellas no lo cancela.
+        """
+        reporte = await self.obtener(clave)
+        if reporte is not None:
+            logger.info(f"Reporte {clave[:12]} servido desde caché")
+            return reporte
+
+        carga = self._en_curso.get(clave)
+        if carga is None:
+            carga = asyncio.ensure_future(self._generar(clave, renderizar))
+            # Evita el aviso de excepción no recuperada si todos cancelan
+            carga.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._en_curso[clave] = carga
+        await asyncio.shield(carga)
+
+        reporte = await self.obtener(clave)
+        if reporte is None:
+            # Desalojado antes de leerlo (cachés muy chicas): render propio
+            resultado = await renderizar()
+            reporte = await asyncio.to_thread(reporte_sin_cache, resultado)
+        return reporte
+
+    async def _generar(self, clave: str, renderizar: Callable[[], Awaitable[Union[bytes, Path]]]) -> None:
+        try:
+            resultado = await renderizar()
+        finally:
+            self._en_curso.pop(clave, None)
+        if isinstance(resultado, Path):
+            await self.guardar_archivo(clave, resultado)
+        else:
+            await self.guardar(clave, resultado)
+
+    async def guardar(self, clave: str, contenido: bytes) -> None:
+        etag = calcular_etag(contenido)
+        if len(contenido) <= self.max_bytes_memoria:
+            self._memoria[clave] = ReportePDF(etag=etag, contenido=contenido)
+            self._memoria.move_to_end(clave)
+            while len(self._memoria) > self.max_items:
+                self._memoria.popitem(last=False)
+            return
+
+        await asyncio.to_thread(self._escribir, clave, contenido)
+        self._etags_disco[clave] = etag
+
+    async def guardar_archivo(self, clave: str, origen: Path) -> None:
+        """
+        Incorpora al nivel en disco un PDF ya escrito en `origen` (que se
+        mueve), sin cargarlo en memoria.
+        """
+        etag = await asyncio.to_thread(calcular_etag_archivo, origen)
+        await asyncio.to_thread(self._mover, clave, origen)
+        self._etags_disco[clave] = etag
+
+    def _reservar(self, clave: str) -> Optional[Path]:
+        """
+        Enlace duro propio al archivo de `clave`, o None si no existe. Si el
+        sistema de archivos no admite enlaces se devuelve el archivo mismo.
+        """
+        ruta = self._ruta(clave)
+        enlace = self.directorio / f"{uuid.uuid4().hex}.envio"
+        try:
+            # La fecha de modificación hace de marca LRU en disco
+            os.utime(ruta)
+            os.link(ruta, enlace)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            return ruta
+        return enlace
+
+    def _escribir(self, clave: str, contenido: bytes) -> None:
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as archivo:
+                archivo.write(contenido)
+        except BaseException:
+            Path(temporal).unlink(missing_ok=True)
+            raise
+        self._mover(clave, Path(temporal))
+
+    def _mover(self, clave: str, origen: Path) -> None:
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        os.replace(origen, self._ruta(clave))
+
+        # Otro hilo puede borrar archivos mientras se recorren
+        archivos = [(mtime, ruta) for ruta in self.directorio.glob("*.pdf") if (mtime := _mtime(ruta)) is not None]
+        archivos.sort(key=lambda par: par[0])
+        for _, viejo in archivos[:max(len(archivos) - self.max_archivos, 0)]:
+            viejo.unlink(missing_ok=True)
+            self._etags_disco.pop(viejo.stem, None)
+
+    def limpiar(self) -> None:
+        """Vacía la memoria y elimina los archivos en disco"""
+        self._memoria.clear()
+        self._etags_disco.clear()
+        if self.directorio.is_dir():
+            for patron in ("*.pdf", "*.tmp", "*.envio"):
+                for ruta in self.directorio.glob(patron):
+                    ruta.unlink(missing_ok=True)
@@ -0,0 +1,265 @@
+"""
+Trabajos de reportes en segundo plano.
+
+`POST /api/reports/jobs` encola el reporte y responde de inmediato con el id
+del trabajo; un número fijo de workers lo genera con el mismo `ReportService`
+que usan los endpoints síncronos y deja el PDF en `settings.temp_dir`, de
+donde se descarga hasta que vence su TTL.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from app.reports.config import settings
+from app.reports.generators import ColaReportesLlena
+from app.reports.schemas import ReportFilterDTO
+from app.reports.services.report_cache import ReportePDF
+from app.reports.services.report_service import ReportService, normalizar_solicitud
+
+logger = logging.getLogger(__name__)
+
+
+class GestorNoIniciado(Exception):
+    """El gestor de trabajos todavía no arrancó (o ya se detuvo)"""
+
+
+@dataclass
+class ReportJob:
+    """Trabajo de reporte con sus tiempos de cola y ejecución"""
+    id: str
+    tipo: str
+    parametros: Dict[str, Any]
+    clave: str
+    estado: str = "pendiente"
+    creado_en: datetime = field(default_factory=datetime.now)
+    iniciado_en: Optional[datetime] = None
+    finalizado_en: Optional[datetime] = None
+    segundos_en_cola: Optional[float] = None
+    segundos_ejecucion: Optional[float] = None
+    archivo: Optional[str] = None
+    ruta: Optional[Path] = None
+    error: Optional[str] = None
+    _encolado: float = field(default_factory=time.monotonic)
+    _finalizado: Optional[float] = None
+
+    @property
+    def terminado(self) -> bool:
+        return self.estado in ("completado", "error")
+
+    def a_dict(self) -> Dict[str, Any]:
+        """Estado público del trabajo (ver ReportJobStatus)"""
+        return {
+            "id": self.id,
+            "tipo": self.tipo,
+            "estado": self.estado,
+            "parametros": self.parametros,
+            "creado_en": self.creado_en,
+            "iniciado_en": self.iniciado_en,
+            "finalizado_en": self.finalizado_en,
+            "segundos_en_cola": self.segundos_en_cola,
+            "segundos_ejecucion": self.segundos_ejecucion,
+            "archivo": self.archivo,
+            "error": self.error,
+            "url_descarga": f"/api/reports/jobs/{self.id}/download" if self.estado == "completado" else None,
+        }
+
+
+class ReportJobManager:
+    """
+    Cola acotada de trabajos de reportes atendida por `workers` tareas.
+
+    Un trabajo idéntico (mismo tipo y parámetros) a otro que aún no terminó
+    no se vuelve a encolar: se devuelve el existente.
+    """
+
+    def __init__(
+        self,
+        report_service: ReportService,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        ttl: Optional[float] = None,
+        directorio: Optional[str] = None
+    ):
+        self.report_service = report_service
+        self.workers = settings.job_workers if workers is None else workers
+        self.queue_size = settings.job_queue_size if queue_size is None else queue_size
+        self.timeout = settings.job_timeout if timeout is None else timeout
+        self.ttl = settings.job_ttl if ttl is None else ttl
+        self.directorio = Path(directorio or settings.temp_dir) / "jobs"
+
+        self._trabajos: Dict[str, ReportJob] = {}
+        self._en_curso: Dict[str, ReportJob] = {}
+        self._cola: Optional[asyncio.Queue] = None
+        self._tareas: List[asyncio.Task] = []
+
+        self._ejecutores: Dict[str, Callable[[Dict[str, Any]], Awaitable[tuple]]] = {
+            "prueba": lambda p: report_service.generar_reporte_prueba(),
+            "animales_especie": lambda p: report_service.generar_reporte_animales_por_especie(p["id_especie"]),
+            "animales_refugio": lambda p: report_service.generar_reporte_animales_por_refugio(p["id_refugio"]),
+            "animales_general": lambda p: report_service.generar_reporte_animales_general(),
+            "animales_filtrados": lambda p: report_service.generar_reporte_animales_filtrados(ReportFilterDTO(**p)),
+            "campanias": lambda p: report_service.generar_reporte_campanias(),
+        }
+
+    async def iniciar(self) -> None:
+        """Crea el directorio de resultados y arranca los workers y la limpieza"""
+        if self._tareas:
+            return
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self._cola = asyncio.Queue(maxsize=self.queue_size)
+        self._tareas = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tareas.append(asyncio.create_task(self._limpieza_periodica()))
+        logger.info(f"Trabajos de reportes: {self.workers} workers, cola de {self.queue_size}")
+
+    async def detener(self) -> None:
+        """Cancela los workers; los trabajos pendientes se pierden"""
+        for tarea in self._tareas:
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._tareas = []
+
+    def encolar(self, tipo: str, parametros: Optional[Dict[str, Any]] = None) -> ReportJob:
+        """
+        Encola un reporte y devuelve su trabajo (o el idéntico que ya está en curso).
+
+        Raises:
+            ValueError: Si el tipo o los parámetros no son válidos
+            ColaReportesLlena: Si la cola está llena
+            GestorNoIniciado: Si todavía no se llamó a `iniciar`
+        """
+        if self._cola is None:
+            raise GestorNoIniciado("El servicio de trabajos de reportes no está disponible")
+
+        parametros = normalizar_solicitud(tipo, parametros or {})
+        clave = json.dumps([tipo, parametros], sort_keys=True, default=str)
+        existente = self._en_curso.get(clave)
+        if existente is not None:
+            logger.info(f"Trabajo {existente.id} reutilizado para {tipo}")
+            return existente
+
+        trabajo = ReportJob(id=uuid.uuid4().hex, tipo=tipo, parametros=parametros, clave=clave)
+        try:
+            self._cola.put_nowait(trabajo)
+        except asyncio.QueueFull:
+            raise ColaReportesLlena(
+                "Hay demasiados reportes en cola, intente nuevamente en unos segundos"
+            )
+        self._trabajos[trabajo.id] = trabajo
+        self._en_curso[clave] = trabajo
+        logger.info(f"Trabajo {trabajo.id} encolado: {tipo} {parametros}")
+        return trabajo
+
+    def obtener(self, id_trabajo: str) -> Optional[ReportJob]:
+        return self._trabajos.get(id_trabajo)
+
+    async def _worker(self, numero: int) -> None:
+        while True:
+            trabajo = await self._cola.get()
+            try:
+                await self._ejecutar(trabajo)
+            finally:
+                self._en_curso.pop(trabajo.clave, None)
+                self._cola.task_done()
+
+    async def _ejecutar(self, trabajo: ReportJob) -> None:
+        trabajo.estado = "en_proceso"
+        trabajo.iniciado_en = datetime.now()
+        inicio = time.monotonic()
+        trabajo.segundos_en_cola = round(inicio - trabajo._encolado, 3)
+
+        try:
+            reporte, filename = await asyncio.wait_for(
+                self._ejecutores[trabajo.tipo](trabajo.parametros), timeout=self.timeout
+            )
+            ruta = self.directorio / f"{trabajo.id}.pdf"
+            await asyncio.to_thread(self._guardar_resultado, reporte, ruta)
+            trabajo.ruta = ruta
+            trabajo.archivo = filename
+            trabajo.estado = "completado"
+        except asyncio.TimeoutError:
+            trabajo.estado = "error"
+            trabajo.error = f"El reporte superó el tiempo máximo de {self.timeout:g} s"
+        except Exception as e:
+            trabajo.estado = "error"
+            trabajo.error = str(e)
+        finally:
+            trabajo._finalizado = time.monotonic()
+            trabajo.finalizado_en = datetime.now()
+            trabajo.segundos_ejecucion = round(trabajo._finalizado - inicio, 3)
+
+        logger.info(
+            f"Trabajo {trabajo.id} ({trabajo.tipo}) {trabajo.estado}: "
+            f"{trabajo.segundos_en_cola}s en cola, {trabajo.segundos_ejecucion}s de ejecución"
+            + (f" - {trabajo.error}" if trabajo.error else "")
+        )
+
+    @staticmethod
+    def _guardar_resultado(reporte: ReportePDF, ruta: Path) -> None:
+        if reporte.ruta is None:
+            ruta.write_bytes(reporte.contenido)
+        elif reporte.temporal:
+            os.replace(reporte.ruta, ruta)
+        else:
+            # Copia del archivo de la caché, que puede descartarse antes
+            shutil.copyfile(reporte.ruta, ruta)
+
+    async def limpiar(self) -> int:
+        """
+        Elimina los trabajos terminados hace más de `ttl` segundos y sus
+        archivos, además de los PDF huérfanos de ejecuciones anteriores.
+        Los archivos se borran en un hilo para no bloquear el event loop.
+
+        Returns:
+            Cantidad de trabajos eliminados
+        """
+        ahora = time.monotonic()
+        vencidos = [
+            t for t in self._trabajos.values()
+            if t.terminado and ahora - t._finalizado >= self.ttl
+        ]
+        for trabajo in vencidos:
+            del self._trabajos[trabajo.id]
+
+        await asyncio.to_thread(
+            self._borrar_archivos,
+            [t.ruta for t in vencidos if t.ruta is not None],
+            set(self._trabajos)
+        )
+        return len(vencidos)
+
+    def _borrar_archivos(self, rutas: Iterable[Path], vigentes: Set[str]) -> None:
+        """Borra `rutas` y los PDF viejos que no pertenecen a ningún trabajo de `vigentes`"""
+        for ruta in rutas:
+            ruta.unlink(missing_ok=True)
+
+        limite = time.time() - self.ttl
+        if not self.directorio.is_dir():
+            return
+        for ruta in self.directorio.glob("*.pdf"):
+            if ruta.stem in vigentes:
+                continue
+            try:
+                if ruta.stat().st_mtime < limite:
+                    ruta.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+    async def _limpieza_periodica(self) -> None:
+        while True:
+            try:
+                eliminados = await self.limpiar()
+                if eliminados:
+                    logger.info(f"Trabajos de reportes vencidos eliminados: {eliminados}")
+            except Exception as e:
+                logger.warning(f"Error limpiando trabajos de reportes: {e}")
+            await asyncio.sleep(settings.job_cleanup_interval)
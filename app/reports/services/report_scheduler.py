@@ -0,0 +1,171 @@
+"""
+Pregeneración programada de los reportes más pedidos.
+
+El reporte general de animales y el de campañas se piden constantemente y
+sus datos cambian poco. Cada `settings.pregen_interval` segundos se
+consultan sus datos y, si el hash cambió, se renderizan de nuevo en
+`settings.temp_dir/pregenerados`. Los endpoints sirven el último archivo
+con `FileResponse` (sendfile), sin consultar GraphQL ni renderizar.
+
+Un archivo reemplazado se borra recién `settings.pregen_grace_period`
+segundos después, para no cortar las descargas que obtuvieron su ruta justo
+antes de la rotación.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.reports.config import settings
+from app.reports.services.report_cache import ReportCache, ReportePDF, calcular_etag_archivo
+from app.reports.services.report_service import ReportService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Pregenerado:
+    """Archivo vigente de un reporte pregenerado"""
+    clave: str
+    reporte: ReportePDF
+
+
+class ReportScheduler:
+    """
+    Mantiene actualizados en disco los reportes de `REPORTES`.
+
+    Cada archivo se escribe con un nombre que incluye el hash de sus datos
+    y se publica con `os.replace`, así que nunca se sirve un PDF a medio
+    escribir; los archivos anteriores se conservan durante el período de
+    gracia para las descargas que todavía los estén enviando.
+    """
+
+    # tipo -> (report_type del generador, nombre del archivo)
+    REPORTES = {
+        "animales_general": ("animales_general", "reporte_general_animales.pdf"),
+        "campanias": ("campanias", "campanias_activas.pdf"),
+    }
+
+    def __init__(
+        self,
+        report_service: ReportService,
+        interval: Optional[float] = None,
+        directorio: Optional[str] = None,
+        gracia: Optional[float] = None
+    ):
+        self.report_service = report_service
+        self.interval = settings.pregen_interval if interval is None else interval
+        self.gracia = settings.pregen_grace_period if gracia is None else gracia
+        self.directorio = Path(directorio or settings.temp_dir) / "pregenerados"
+
+        self._datos: Dict[str, Callable[[], Awaitable[List[Dict[str, Any]]]]] = {
+            "animales_general": report_service.datos_animales_general,
+            "campanias": report_service.datos_campanias,
+        }
+        self._vigentes: Dict[str, _Pregenerado] = {}
+        # Archivo reemplazado -> momento (time.time) en que dejó de servirse
+        self._retirados: Dict[Path, float] = {}
+        self._tarea: Optional[asyncio.Task] = None
+
+    async def iniciar(self) -> None:
+        """Arranca la regeneración periódica (la primera, de inmediato)"""
+        if self._tarea is not None or not settings.pregen_enabled:
+            return
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self._tarea = asyncio.create_task(self._ciclo())
+        logger.info(f"Pregeneración de reportes cada {self.interval:g} s: {', '.join(self.REPORTES)}")
+
+    async def detener(self) -> None:
+        if self._tarea is None:
+            return
+        self._tarea.cancel()
+        await asyncio.gather(self._tarea, return_exceptions=True)
+        self._tarea = None
+
+    def obtener(self, tipo: str) -> Optional[tuple[ReportePDF, str]]:
+        """
+        Último PDF pregenerado de `tipo`.
+
+        Returns:
+            Tuple con (ReportePDF, nombre del archivo), o None si todavía no
+            se generó y hay que generarlo en la solicitud
+        """
+        vigente = self._vigentes.get(tipo)
+        if vigente is None:
+            return None
+        return vigente.reporte, self.REPORTES[tipo][1]
+
+    async def regenerar(self, tipo: str) -> bool:
+        """
+        Consulta los datos de `tipo` y lo renderiza si cambiaron.
+
+        Returns:
+            True si se publicó un archivo nuevo
+        """
+        report_type, _ = self.REPORTES[tipo]
+        data = await self._datos[tipo]()
+        clave = await asyncio.to_thread(ReportCache.clave, report_type, data, {})
+
+        vigente = self._vigentes.get(tipo)
+        if vigente is not None and vigente.clave == clave:
+            return False
+
+        ruta = self.directorio / f"{tipo}_{clave[:32]}.pdf"
+        if not ruta.exists():
+            await self.report_service.pregenerar_pdf(data, report_type, ruta)
+        etag = await asyncio.to_thread(calcular_etag_archivo, ruta)
+
+        self._vigentes[tipo] = _Pregenerado(clave=clave, reporte=ReportePDF(etag=etag, ruta=ruta))
+        self._retirados.pop(ruta, None)
+        if vigente is not None:
+            self._retirar(vigente.reporte.ruta)
+        logger.info(f"Reporte pregenerado actualizado: {ruta.name}")
+        return True
+
+    def _retirar(self, ruta: Path) -> None:
+        """Registra que `ruta` dejó de servirse; se borra pasado el período de gracia"""
+        self._retirados.setdefault(ruta, time.time())
+
+    def _limpiar(self, tipo: str) -> None:
+        """
+        Borra los archivos de `tipo` que dejaron de servirse hace más de
+        `self.gracia` segundos. Los que no se retiraron en este proceso (de
+        una ejecución anterior) se miden desde su fecha de modificación.
+        """
+        vigente = self._vigentes.get(tipo)
+        ahora = time.time()
+        for ruta in self.directorio.glob(f"{tipo}_*.pdf"):
+            if vigente is not None and ruta == vigente.reporte.ruta:
+                continue
+            try:
+                retirado = self._retirados.get(ruta) or ruta.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if ahora - retirado >= self.gracia:
+                ruta.unlink(missing_ok=True)
+                self._retirados.pop(ruta, None)
+
+    async def _ciclo(self) -> None:
+        while True:
+            for tipo in self.REPORTES:
+                try:
+                    await self.regenerar(tipo)
+                except asyncio.CancelledError:
+                    raise
+                except ValueError as e:
+                    # Sin datos: se deja de servir el archivo anterior
+                    anterior = self._vigentes.pop(tipo, None)
+                    if anterior is not None:
+                        self._retirar(anterior.reporte.ruta)
+                    logger.info(f"Reporte {tipo} sin pregenerar: {e}")
+                except Exception as e:
+                    logger.warning(f"Error pregenerando el reporte {tipo}: {e}")
+                try:
+                    # También sin cambios, para borrar los archivos cuya gracia venció
+                    await asyncio.to_thread(self._limpiar, tipo)
+                except OSError as e:
+                    logger.warning(f"Error limpiando los reportes pregenerados {tipo}: {e}")
+            await asyncio.sleep(self.interval)
@@ -1,15 +1,135 @@
 """Servicio de reportes que coordina cliente GraphQL y generador PDF."""
 
+import asyncio
+import json
 import logging
-from io import BytesIO
-from typing import Optional
+import os
+import uuid
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from app.reports.clients import GraphQLClient
-from app.reports.generators import PDFGenerator
+from app.reports.generators import PDFGenerator, PDFRenderPool, ZipStream, pdf_render_pool, crear_exportador
 from app.reports.schemas import ReportFilterDTO
+from app.reports.config import settings
+from app.reports.services.report_cache import ReportCache, ReportePDF, reporte_sin_cache
+from app.shared.infrastructure.ttl_cache import cache_referencias
 
 logger = logging.getLogger(__name__)
 
+# Parámetros obligatorios de cada tipo de reporte (trabajos y lotes)
+PARAMETROS_REQUERIDOS: Dict[str, Tuple[str, ...]] = {
+    "prueba": (),
+    "animales_especie": ("id_especie",),
+    "animales_refugio": ("id_refugio",),
+    "animales_general": (),
+    "animales_filtrados": (),
+    "campanias": (),
+}
+
+
+def normalizar_solicitud(tipo: str, parametros: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Valida los parámetros de un tipo de reporte y descarta los vacíos.
+    
+    Raises:
+        ValueError: Si el tipo no existe o faltan parámetros
+    """
+    if tipo not in PARAMETROS_REQUERIDOS:
+        raise ValueError(f"Tipo de reporte no soportado: {tipo}")
+    faltantes = [p for p in PARAMETROS_REQUERIDOS[tipo] if not parametros.get(p)]
+    if faltantes:
+        raise ValueError(f"Faltan parámetros para '{tipo}': {', '.join(faltantes)}")
+    if tipo == "animales_filtrados":
+        # Valida los filtros ahora y no al generar
+        return ReportFilterDTO(**parametros).model_dump(exclude_none=True)
+    return {k: v for k, v in parametros.items() if v is not None}
+
+
+# Columnas de las exportaciones tabulares: (campo GraphQL, encabezado)
+COLUMNAS_ANIMALES = [
+    ("idAnimal", "ID"),
+    ("nombre", "Nombre"),
+    ("especie", "Especie"),
+    ("edad", "Edad"),
+    ("estadoAdopcion", "Estado"),
+    ("descripcion", "Descripción"),
+    ("idRefugio", "Refugio"),
+    ("fechaCreacion", "Fecha Ingreso"),
+]
+
+COLUMNAS_CAMPANIAS = [
+    ("idCampania", "ID"),
+    ("titulo", "Campaña"),
+    ("descripcion", "Descripción"),
+    ("fechaInicio", "Fecha Inicio"),
+    ("fechaFin", "Fecha Fin"),
+    ("lugar", "Lugar"),
+    ("organizador", "Organizador"),
+    ("estado", "Estado"),
+]
+
+
+def _mapear_especies(animales: List[Dict[str, Any]], especies_dict: Dict[str, str]) -> None:
+    """Completa el nombre de la especie en los animales que no lo traen"""
+    for animal in animales:
+        if not animal.get('especie') and animal.get('idEspecie'):
+            animal['especie'] = especies_dict.get(str(animal['idEspecie']), 'Desconocida')
+
+
+class _FuentesLote:
+    """
+    Datos compartidos por los reportes de un lote.
+    
+    Cada fuente se pide una sola vez, la primera vez que algún reporte la
+    necesita; los demás esperan la misma tarea.
+    """
+    
+    def __init__(self, graphql_client: GraphQLClient, especies: Callable[[], Awaitable[Dict[str, str]]]):
+        self._client = graphql_client
+        self._cargar_especies = especies
+        self._tareas: Dict[str, asyncio.Task] = {}
+    
+    def _una_vez(self, nombre: str, cargar) -> asyncio.Task:
+        if nombre not in self._tareas:
+            self._tareas[nombre] = asyncio.ensure_future(cargar())
+        return self._tareas[nombre]
+    
+    async def especies(self) -> Dict[str, str]:
+        return await self._una_vez("especies", self._cargar_especies)
+    
+    async def animales(self) -> List[Dict[str, Any]]:
+        """Todos los animales, con el nombre de la especie resuelto"""
+        async def cargar():
+            especies_dict, animales = await asyncio.gather(
+                self.especies(),
+                self._client.obtener_animales_filtrados()
+            )
+            _mapear_especies(animales, especies_dict)
+            return animales
+        return await self._una_vez("animales", cargar)
+    
+    async def refugios(self) -> Dict[str, Dict[str, Any]]:
+        async def cargar():
+            return {str(r['idRefugio']): r for r in await self._client.obtener_refugios()}
+        return await self._una_vez("refugios", cargar)
+    
+    async def campanias(self) -> List[Dict[str, Any]]:
+        return await self._una_vez("campanias", self._client.obtener_campanias)
+    
+    def cancelar(self) -> None:
+        for tarea in self._tareas.values():
+            tarea.cancel()
+
+
+@dataclass
+class LoteReportes:
+    """Lote validado por `preparar_lote`, listo para generarse"""
+    fuentes: _FuentesLote
+    solicitudes: List[Tuple[str, Dict[str, Any]]]
+
 
 class ReportService:
     """
@@ -21,25 +141,110 @@ class ReportService:
     def __init__(
         self,
         graphql_client: Optional[GraphQLClient] = None,
-        pdf_generator: Optional[PDFGenerator] = None
+        pdf_generator: Optional[PDFGenerator] = None,
+        render_pool: Optional[PDFRenderPool] = None,
+        cache: Optional[ReportCache] = None
     ):
         """
         Inicializa el servicio de reportes.
         
         Args:
             graphql_client: Cliente GraphQL (se crea uno si es None)
-            pdf_generator: Generador PDF (se crea uno si es None)
+            pdf_generator: Generador PDF propio; si se indica, se usa en un
+                hilo en lugar del pool de procesos
+            render_pool: Pool de renderizado (por defecto el compartido)
+            cache: Caché de PDFs por contenido (se crea una si es None y
+                está habilitada en la configuración)
         """
         self.graphql_client = graphql_client or GraphQLClient()
-        self.pdf_generator = pdf_generator or PDFGenerator()
+        self.pdf_generator = pdf_generator
+        self.render_pool = render_pool or pdf_render_pool
+        self.cache = cache or (ReportCache() if settings.cache_enabled else None)
+        self.directorio_spool = Path(settings.temp_dir) / "spool"
+        # Mapa id -> nombre de especie compartido por todos los reportes
+        self._cache_especies = cache_referencias.para("especie")
         logger.info("ReportService inicializado")
     
+    async def _mapa_especies(self) -> Dict[str, str]:
+        """
+        Mapa id -> nombre de las especies, desde la caché de datos de
+        referencia (si varios reportes lo piden a la vez, se consulta una vez).
+        """
+        async def cargar():
+            especies = await self.graphql_client.obtener_especies()
+            return {str(e['id']): e['nombre'] for e in especies}
+        return await self._cache_especies.obtener_o_cargar("mapa_reportes", cargar)
+    
+    async def _renderizar(self, data: List[Dict[str, Any]], report_type: str, **kwargs) -> bytes:
+        """Renderiza el PDF fuera del event loop"""
+        if self.pdf_generator is not None:
+            buffer = await asyncio.to_thread(self.pdf_generator.generate, data, report_type, **kwargs)
+        else:
+            buffer = await self.render_pool.render(data, report_type, **kwargs)
+        return buffer.getvalue()
+    
+    async def _renderizar_a_disco(self, data: List[Dict[str, Any]], report_type: str, **kwargs) -> Path:
+        """Renderiza el PDF directamente a un archivo temporal en `temp_dir`"""
+        self.directorio_spool.mkdir(parents=True, exist_ok=True)
+        ruta = self.directorio_spool / f"{uuid.uuid4().hex}.pdf"
+        try:
+            if self.pdf_generator is not None:
+                def escribir():
+                    with open(ruta, "wb") as archivo:
+                        self.pdf_generator.generate(data, report_type, output=archivo, **kwargs)
+                await asyncio.to_thread(escribir)
+            else:
+                await self.render_pool.render_to_file(data, report_type, str(ruta), **kwargs)
+        except BaseException:
+            ruta.unlink(missing_ok=True)
+            raise
+        return ruta
+    
+    async def pregenerar_pdf(
+        self,
+        data: List[Dict[str, Any]],
+        report_type: str,
+        destino: Path,
+        **kwargs
+    ) -> Path:
+        """
+        Renderiza el PDF a disco y lo publica en `destino`.
+        
+        Se escribe primero en el directorio de spool y se mueve con
+        `os.replace`, así que nunca queda un PDF a medio escribir en `destino`.
+        """
+        temporal = await self._renderizar_a_disco(data, report_type, **kwargs)
+        try:
+            await asyncio.to_thread(os.replace, temporal, destino)
+        except BaseException:
+            temporal.unlink(missing_ok=True)
+            raise
+        return destino
+    
+    async def _generar_pdf(self, data: List[Dict[str, Any]], report_type: str, **kwargs) -> ReportePDF:
+        """
+        Devuelve el PDF de la caché si ya se generó con los mismos datos;
+        si no, lo renderiza y lo guarda.
+        
+        Los listados de `settings.pdf_spool_min_rows` filas o más se
+        escriben a disco y se sirven desde ahí, sin pasar el PDF por memoria.
+        """
+        async def renderizar() -> Union[bytes, Path]:
+            if len(data) >= settings.pdf_spool_min_rows:
+                return await self._renderizar_a_disco(data, report_type, **kwargs)
+            return await self._renderizar(data, report_type, **kwargs)
+        
+        if self.cache is None:
+            return await asyncio.to_thread(reporte_sin_cache, await renderizar())
+        clave = await asyncio.to_thread(self.cache.clave, report_type, data, kwargs)
+        return await self.cache.obtener_o_generar(clave, renderizar)
+    
     # ========== REPORTES DE ANIMALES ==========
     
     async def generar_reporte_animales_por_especie(
         self,
         id_especie: str
-    ) -> tuple[BytesIO, str]:
+    ) -> tuple[ReportePDF, str]:
         """
         Genera PDF con animales filtrados por especie.
         
@@ -47,20 +252,17 @@ class ReportService:
             id_especie: UUID de la especie
             
         Returns:
-            Tuple con (BytesIO del PDF, nombre del archivo)
+            Tuple con (ReportePDF, nombre del archivo)
             
         Raises:
             ValueError: Si no se encuentran animales
         """
         logger.info(f"Generando reporte de animales por especie: {id_especie}")
         
-        # Obtener especies primero para hacer el mapeo
-        especies = await self.graphql_client.obtener_especies()
-        especies_dict = {str(e['id']): e['nombre'] for e in especies}
-        
-        # Obtener datos
-        animales = await self.graphql_client.obtener_animales_por_especie(
-            id_especie
+        # Especies y animales se piden a la vez
+        especies_dict, animales = await asyncio.gather(
+            self._mapa_especies(),
+            self.graphql_client.obtener_animales_por_especie(id_especie)
         )
         
         if not animales:
@@ -68,17 +270,13 @@ class ReportService:
                 f"No se encontraron animales para la especie {id_especie}"
             )
         
-        # Mapear nombres de especies a los animales si no vienen
-        for animal in animales:
-            if not animal.get('especie') and animal.get('idEspecie'):
-                id_esp = str(animal['idEspecie'])
-                animal['especie'] = especies_dict.get(id_esp, 'Desconocida')
+        _mapear_especies(animales, especies_dict)
         
         # Extraer nombre de especie
         nombre_especie = animales[0].get('especie', especies_dict.get(id_especie, 'Desconocida'))
         
         # Generar PDF
-        pdf_buffer = self.pdf_generator.generate(
+        reporte = await self._generar_pdf(
             data=animales,
             report_type="animales_especie",
             nombre_especie=nombre_especie
@@ -87,12 +285,12 @@ class ReportService:
         filename = f"animales_{nombre_especie.lower().replace(' ', '_')}.pdf"
         logger.info(f"Reporte generado exitosamente: {filename}")
         
-        return pdf_buffer, filename
+        return reporte, filename
     
     async def generar_reporte_animales_por_refugio(
         self,
         id_refugio: str
-    ) -> tuple[BytesIO, str]:
+    ) -> tuple[ReportePDF, str]:
         """
         Genera PDF con animales de un refugio específico.
         
@@ -100,20 +298,18 @@ class ReportService:
             id_refugio: UUID del refugio
             
         Returns:
-            Tuple con (BytesIO del PDF, nombre del archivo)
+            Tuple con (ReportePDF, nombre del archivo)
             
         Raises:
             ValueError: Si no se encuentran animales
         """
         logger.info(f"Generando reporte de animales por refugio: {id_refugio}")
         
-        # Obtener especies primero para hacer el mapeo
-        especies = await self.graphql_client.obtener_especies()
-        especies_dict = {str(e['id']): e['nombre'] for e in especies}
-        
-        # Obtener animales
-        animales = await self.graphql_client.obtener_animales_por_refugio(
-            id_refugio
+        # Especies, animales y refugio se piden a la vez
+        especies_dict, animales, refugio = await asyncio.gather(
+            self._mapa_especies(),
+            self.graphql_client.obtener_animales_por_refugio(id_refugio),
+            self.graphql_client.obtener_refugio_por_id(id_refugio)
         )
         
         if not animales:
@@ -121,18 +317,12 @@ class ReportService:
                 f"No se encontraron animales para el refugio {id_refugio}"
             )
         
-        # Mapear nombres de especies a los animales si no vienen
-        for animal in animales:
-            if not animal.get('especie') and animal.get('idEspecie'):
-                id_esp = str(animal['idEspecie'])
-                animal['especie'] = especies_dict.get(id_esp, 'Desconocida')
+        _mapear_especies(animales, especies_dict)
         
-        # Obtener nombre del refugio
-        refugio = await self.graphql_client.obtener_refugio_por_id(id_refugio)
         nombre_refugio = refugio.get('nombre', 'Refugio Desconocido') if refugio else 'Refugio Desconocido'
         
         # Generar PDF
-        pdf_buffer = self.pdf_generator.generate(
+        reporte = await self._generar_pdf(
             data=animales,
             report_type="animales_refugio",
             nombre_refugio=nombre_refugio
@@ -141,38 +331,43 @@ class ReportService:
         filename = f"refugio_{nombre_refugio.lower().replace(' ', '_')}.pdf"
         logger.info(f"Reporte generado exitosamente: {filename}")
         
-        return pdf_buffer, filename
+        return reporte, filename
     
-    async def generar_reporte_animales_general(self) -> tuple[BytesIO, str]:
+    async def datos_animales_general(self) -> List[Dict[str, Any]]:
+        """
+        Animales disponibles con el nombre de la especie resuelto.
+        
+        Raises:
+            ValueError: Si no hay animales registrados
+        """
+        # Especies y animales se piden a la vez
+        especies_dict, animales = await asyncio.gather(
+            self._mapa_especies(),
+            self.graphql_client.obtener_todos_animales()
+        )
+        
+        if not animales:
+            raise ValueError("No hay animales registrados en el sistema")
+        
+        _mapear_especies(animales, especies_dict)
+        return animales
+    
+    async def generar_reporte_animales_general(self) -> tuple[ReportePDF, str]:
         """
         Genera PDF con reporte general de todos los animales disponibles.
         
         Returns:
-            Tuple con (BytesIO del PDF, nombre del archivo)
+            Tuple con (ReportePDF, nombre del archivo)
             
         Raises:
             ValueError: Si no hay animales registrados
         """
         logger.info("Generando reporte general de animales")
         
-        # Obtener especies primero para hacer el mapeo
-        especies = await self.graphql_client.obtener_especies()
-        especies_dict = {str(e['id']): e['nombre'] for e in especies}
-        
-        # Obtener datos
-        animales = await self.graphql_client.obtener_todos_animales()
-        
-        if not animales:
-            raise ValueError("No hay animales registrados en el sistema")
-        
-        # Mapear nombres de especies a los animales si no vienen
-        for animal in animales:
-            if not animal.get('especie') and animal.get('idEspecie'):
-                id_esp = str(animal['idEspecie'])
-                animal['especie'] = especies_dict.get(id_esp, 'Desconocida')
+        animales = await self.datos_animales_general()
         
         # Generar PDF
-        pdf_buffer = self.pdf_generator.generate(
+        reporte = await self._generar_pdf(
             data=animales,
             report_type="animales_general"
         )
@@ -180,12 +375,12 @@ class ReportService:
         filename = "reporte_general_animales.pdf"
         logger.info(f"Reporte generado exitosamente: {filename}")
         
-        return pdf_buffer, filename
+        return reporte, filename
     
     async def generar_reporte_animales_filtrados(
         self,
         filtros: ReportFilterDTO
-    ) -> tuple[BytesIO, str]:
+    ) -> tuple[ReportePDF, str]:
         """
         Genera PDF con animales usando filtros combinados.
         
@@ -193,25 +388,24 @@ class ReportService:
             filtros: DTO con los filtros a aplicar
             
         Returns:
-            Tuple con (BytesIO del PDF, nombre del archivo)
+            Tuple con (ReportePDF, nombre del archivo)
             
         Raises:
             ValueError: Si no se encuentran animales con los filtros
         """
         logger.info(f"Generando reporte de animales filtrados: {filtros}")
         
-        # Obtener especies primero para hacer el mapeo
-        especies = await self.graphql_client.obtener_especies()
-        especies_dict = {str(e['id']): e['nombre'] for e in especies}
-        
-        # Obtener datos
-        animales = await self.graphql_client.obtener_animales_filtrados(
-            nombre=filtros.nombre,
-            id_especie=filtros.id_especie,
-            id_refugio=filtros.id_refugio,
-            estado_adopcion=filtros.estado_adopcion,
-            edad_min=filtros.edad_min,
-            edad_max=filtros.edad_max
+        # Especies y animales se piden a la vez
+        especies_dict, animales = await asyncio.gather(
+            self._mapa_especies(),
+            self.graphql_client.obtener_animales_filtrados(
+                nombre=filtros.nombre,
+                id_especie=filtros.id_especie,
+                id_refugio=filtros.id_refugio,
+                estado_adopcion=filtros.estado_adopcion,
+                edad_min=filtros.edad_min,
+                edad_max=filtros.edad_max
+            )
         )
         
         if not animales:
@@ -219,14 +413,10 @@ class ReportService:
                 "No se encontraron animales con los filtros especificados"
             )
         
-        # Mapear nombres de especies a los animales si no vienen
-        for animal in animales:
-            if not animal.get('especie') and animal.get('idEspecie'):
-                id_esp = str(animal['idEspecie'])
-                animal['especie'] = especies_dict.get(id_esp, 'Desconocida')
+        _mapear_especies(animales, especies_dict)
         
         # Generar PDF
-        pdf_buffer = self.pdf_generator.generate(
+        reporte = await self._generar_pdf(
             data=animales,
             report_type="animales_general"
         )
@@ -234,30 +424,39 @@ class ReportService:
         filename = "animales_filtrados.pdf"
         logger.info(f"Reporte generado exitosamente: {filename}")
         
-        return pdf_buffer, filename
+        return reporte, filename
     
     # ========== REPORTES DE CAMPAÑAS ==========
     
-    async def generar_reporte_campanias(self) -> tuple[BytesIO, str]:
+    async def datos_campanias(self) -> List[Dict[str, Any]]:
+        """
+        Campañas activas.
+        
+        Raises:
+            ValueError: Si no hay campañas activas
+        """
+        campanias = await self.graphql_client.obtener_campanias()
+        
+        if not campanias:
+            raise ValueError("No hay campañas activas en el sistema")
+        return campanias
+    
+    async def generar_reporte_campanias(self) -> tuple[ReportePDF, str]:
         """
         Genera PDF con reporte de campañas activas.
         
         Returns:
-            Tuple con (BytesIO del PDF, nombre del archivo)
+            Tuple con (ReportePDF, nombre del archivo)
             
         Raises:
             ValueError: Si no hay campañas activas
         """
         logger.info("Generando reporte de campañas activas")
         
-        # Obtener datos
-        campanias = await self.graphql_client.obtener_campanias()
-        
-        if not campanias:
-            raise ValueError("No hay campañas activas en el sistema")
+        campanias = await self.datos_campanias()
         
         # Generar PDF
-        pdf_buffer = self.pdf_generator.generate(
+        reporte = await self._generar_pdf(
             data=campanias,
             report_type="campanias"
         )
@@ -265,17 +464,282 @@ class ReportService:
         filename = "campanias_activas.pdf"
         logger.info(f"Reporte generado exitosamente: {filename}")
         
-        return pdf_buffer, filename
+        return reporte, filename
+    
+    # ========== EXPORTACIONES TABULARES ==========
+    
+    async def _exportar(
+        self,
+        paginas: AsyncIterator[List[Dict[str, Any]]],
+        columnas: List[tuple],
+        formato: str,
+        nombre: str,
+        mensaje_vacio: str
+    ) -> tuple[AsyncIterator[bytes], str, str]:
+        """
+        Prepara una exportación por streaming.
+        
+        Se espera la primera página antes de responder para poder devolver
+        404 si no hay datos; el resto se escribe a medida que llega.
+        
+        Returns:
+            Tuple con (iterador de bytes, nombre del archivo, media type)
+        """
+        exportador = crear_exportador(formato, columnas)
+        primera = await anext(paginas, None)
+        if not primera:
+            await paginas.aclose()
+            raise ValueError(mensaje_vacio)
+        
+        async def todas():
+            yield primera
+            async for pagina in paginas:
+                yield pagina
+        
+        filename = f"{nombre}.{exportador.extension}"
+        logger.info(f"Exportación iniciada: {filename}")
+        return exportador.stream(todas()), filename, exportador.media_type
+    
+    async def exportar_animales(
+        self,
+        formato: str,
+        nombre: str,
+        **filtros
+    ) -> tuple[AsyncIterator[bytes], str, str]:
+        """
+        Exporta animales en CSV, NDJSON o XLSX sin generar el PDF.
+        
+        Args:
+            formato: "csv", "ndjson" o "xlsx"
+            nombre: Nombre base del archivo
+            **filtros: Filtros de GraphQLClient.iterar_animales
+            
+        Returns:
+            Tuple con (iterador de bytes, nombre del archivo, media type)
+            
+        Raises:
+            ValueError: Si el formato no existe o no hay animales
+        """
+        # Las especies se cargan mientras se pide la primera página
+        especies = asyncio.ensure_future(self._mapa_especies())
+        
+        async def paginas():
+            async for pagina in self.graphql_client.iterar_animales(**filtros):
+                _mapear_especies(pagina, await especies)
+                yield pagina
+        
+        return await self._exportar(
+            paginas(),
+            COLUMNAS_ANIMALES,
+            formato,
+            nombre,
+            "No se encontraron animales con los filtros especificados"
+        )
+    
+    async def exportar_campanias(self, formato: str) -> tuple[AsyncIterator[bytes], str, str]:
+        """
+        Exporta las campañas en CSV, NDJSON o XLSX.
+        
+        Raises:
+            ValueError: Si el formato no existe o no hay campañas
+        """
+        async def paginas():
+            campanias = await self.graphql_client.obtener_campanias()
+            if campanias:
+                yield campanias
+        
+        return await self._exportar(
+            paginas(),
+            COLUMNAS_CAMPANIAS,
+            formato,
+            "campanias_activas",
+            "No hay campañas activas en el sistema"
+        )
+    
+    # ========== LOTES DE REPORTES ==========
+    
+    async def _preparar_lote(
+        self,
+        fuentes: _FuentesLote,
+        tipo: str,
+        parametros: Dict[str, Any]
+    ) -> Optional[tuple]:
+        """
+        Datos de un reporte del lote a partir de las fuentes compartidas.
+        
+        Returns:
+            Tuple con (datos, report_type, kwargs, nombre del archivo), o None
+            si el tipo no comparte datos y se genera con su método individual
+            
+        Raises:
+            ValueError: Si no hay datos para el reporte
+        """
+        if tipo == "animales_especie":
+            id_especie = parametros["id_especie"]
+            animales, especies_dict = await asyncio.gather(fuentes.animales(), fuentes.especies())
+            animales = [a for a in animales if str(a.get('idEspecie')) == id_especie]
+            if not animales:
+                raise ValueError(f"No se encontraron animales para la especie {id_especie}")
+            nombre_especie = animales[0].get('especie', especies_dict.get(id_especie, 'Desconocida'))
+            filename = f"animales_{nombre_especie.lower().replace(' ', '_')}.pdf"
+            return animales, "animales_especie", {"nombre_especie": nombre_especie}, filename
+        
+        if tipo == "animales_refugio":
+            id_refugio = parametros["id_refugio"]
+            animales, refugios = await asyncio.gather(fuentes.animales(), fuentes.refugios())
+            animales = [a for a in animales if str(a.get('idRefugio')) == id_refugio]
+            if not animales:
+                raise ValueError(f"No se encontraron animales para el refugio {id_refugio}")
+            refugio = refugios.get(id_refugio)
+            nombre_refugio = refugio.get('nombre', 'Refugio Desconocido') if refugio else 'Refugio Desconocido'
+            filename = f"refugio_{nombre_refugio.lower().replace(' ', '_')}.pdf"
+            return animales, "animales_refugio", {"nombre_refugio": nombre_refugio}, filename
+        
+        if tipo == "animales_general":
+            animales = [a for a in await fuentes.animales() if a.get('estadoAdopcion') == 'disponible']
+            if not animales:
+                raise ValueError("No hay animales registrados en el sistema")
+            return animales, "animales_general", {}, "reporte_general_animales.pdf"
+        
+        if tipo == "campanias":
+            campanias = await fuentes.campanias()
+            if not campanias:
+                raise ValueError("No hay campañas activas en el sistema")
+            return campanias, "campanias", {}, "campanias_activas.pdf"
+        
+        return None
+    
+    async def preparar_lote(
+        self,
+        solicitudes: List[Tuple[str, Dict[str, Any]]],
+        todos_los_refugios: bool = False
+    ) -> LoteReportes:
+        """
+        Resuelve antes de empezar a responder lo que puede hacer fallar al
+        lote entero (la lista de refugios), para que el error llegue como
+        código HTTP y no como un ZIP truncado con status 200.
+        
+        Args:
+            solicitudes: Pares (tipo, parámetros) ya normalizados
+            todos_los_refugios: Agrega un reporte por cada refugio
+            
+        Raises:
+            ValueError: Si el lote queda sin reportes
+        """
+        fuentes = _FuentesLote(self.graphql_client, self._mapa_especies)
+        if todos_los_refugios:
+            try:
+                refugios = await fuentes.refugios()
+            except BaseException:
+                fuentes.cancelar()
+                raise
+            solicitudes = list(solicitudes) + [
+                ("animales_refugio", {"id_refugio": id_refugio})
+                for id_refugio in refugios
+            ]
+        # Sin repetidos, conservando el orden
+        unicas = {
+            json.dumps([tipo, parametros], sort_keys=True, default=str): (tipo, parametros)
+            for tipo, parametros in solicitudes
+        }
+        if not unicas:
+            raise ValueError("No hay refugios registrados en el sistema")
+        return LoteReportes(fuentes=fuentes, solicitudes=list(unicas.values()))
+    
+    async def generar_lote(
+        self,
+        lote: LoteReportes
+    ) -> AsyncIterator[Tuple[str, Optional[ReportePDF], Optional[str]]]:
+        """
+        Genera varios reportes compartiendo las consultas a GraphQL.
+        
+        Las especies, los animales, los refugios y las campañas se piden una
+        sola vez para todo el lote y cada reporte filtra en memoria lo que
+        necesita; los PDF se renderizan en paralelo (tantos como procesos
+        tenga el pool) y se entregan en el orden en que terminan.
+        
+        Si se deja de iterar antes de terminar, se cancelan los pendientes
+        y se borran los archivos temporales de los que no se entregaron.
+        
+        Yields:
+            Tuple con (nombre del archivo o descripción, ReportePDF o None, error o None)
+        """
+        fuentes = lote.fuentes
+        cupos = asyncio.Semaphore(max(self.render_pool.workers, 1))
+        
+        individuales = {
+            "prueba": lambda p: self.generar_reporte_prueba(),
+            "animales_filtrados": lambda p: self.generar_reporte_animales_filtrados(ReportFilterDTO(**p)),
+        }
+        
+        async def generar(tipo: str, parametros: Dict[str, Any]):
+            try:
+                preparado = await self._preparar_lote(fuentes, tipo, parametros)
+                async with cupos:
+                    if preparado is None:
+                        reporte, filename = await individuales[tipo](parametros)
+                    else:
+                        data, report_type, kwargs, filename = preparado
+                        reporte = await self._generar_pdf(data, report_type, **kwargs)
+                return filename, reporte, None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Reporte del lote fallido ({tipo} {parametros}): {e}")
+                return f"{tipo} {json.dumps(parametros, ensure_ascii=False)}", None, str(e)
+        
+        tareas = [asyncio.ensure_future(generar(tipo, parametros)) for tipo, parametros in lote.solicitudes]
+        logger.info(f"Lote de {len(tareas)} reportes iniciado")
+        try:
+            for siguiente in asyncio.as_completed(tareas):
+                yield await siguiente
+        finally:
+            for tarea in tareas:
+                if not tarea.done():
+                    tarea.cancel()
+                elif not tarea.cancelled():
+                    # Terminados sin entregar (o entregados a medio enviar)
+                    _, reporte, _ = tarea.result()
+                    if reporte is not None and reporte.temporal:
+                        reporte.ruta.unlink(missing_ok=True)
+            fuentes.cancelar()
+    
+    async def generar_zip_lote(self, lote: LoteReportes) -> AsyncIterator[bytes]:
+        """
+        ZIP con los reportes de `generar_lote`, enviado a medida que cada
+        PDF termina. Los reportes fallidos se listan en `errores.txt`.
+        """
+        zip_stream = ZipStream()
+        errores = []
+        # Si el cliente se desconecta, generar_lote limpia de inmediato
+        async with aclosing(self.generar_lote(lote)) as reportes:
+            async for filename, reporte, error in reportes:
+                if error is not None:
+                    errores.append(f"{filename}: {error}")
+                    continue
+                if reporte.ruta is None:
+                    yield zip_stream.agregar(filename, reporte.contenido)
+                    continue
+                try:
+                    for parte in zip_stream.agregar_archivo(filename, reporte.ruta):
+                        yield parte
+                finally:
+                    if reporte.temporal:
+                        reporte.ruta.unlink(missing_ok=True)
+        
+        if errores:
+            yield zip_stream.agregar("errores.txt", "\n".join(errores).encode())
+        yield zip_stream.cerrar()
     
     # ========== REPORTE DE PRUEBA ==========
     
-    def generar_reporte_prueba(self) -> tuple[BytesIO, str]:
+    async def generar_reporte_prueba(self) -> tuple[ReportePDF, str]:
         """
         Genera un PDF de prueba con datos ficticios.
         No requiere conexión a GraphQL.
         
         Returns:
-            Tuple con (BytesIO del PDF, nombre del archivo)
+            Tuple con (ReportePDF, nombre del archivo)
         """
         logger.info("Generando reporte de prueba")
         
@@ -320,7 +784,7 @@ class ReportService:
         ]
         
         # Generar PDF
-        pdf_buffer = self.pdf_generator.generate(
+        reporte = await self._generar_pdf(
             data=animales_prueba,
             report_type="animales_especie",
             nombre_especie="Datos de Prueba"
@@ -329,4 +793,4 @@ class ReportService:
         filename = "test_reporte.pdf"
         logger.info(f"Reporte de prueba generado: {filename}")
         
-        return pdf_buffer, filename
+        return reporte, filename
@@ -1,4 +1,6 @@
 import strawberry
+from app.shared.interface.cache_extension import CacheAgeExtension
+from app.shared.interface.partial_results_extension import PartialResultsExtension
 from app.modules.animal.interface.graphql_query import AnimalQuery
 from app.modules.tipo_campania.interface.graphql_query import TipoCampaniaQuery
 from app.modules.usuario.interface.graphql_query import UsuarioQuery
@@ -38,4 +40,4 @@ class Query(
     """Root Query - Combina todas las queries de los módulos"""
     pass
 
-schema = strawberry.Schema(query=Query)
\ No newline at end of file
+schema = strawberry.Schema(query=Query, extensions=[CacheAgeExtension, PartialResultsExtension])
\ No newline at end of file
@@ -0,0 +1 @@
+"""Componentes compartidos entre los módulos de Love4Pets GraphQL."""
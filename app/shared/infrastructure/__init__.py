@@ -0,0 +1 @@
+# Infrastructure layer compartida (clientes HTTP, cachés, etc.)
@@ -0,0 +1,160 @@
+"""
+Invalidación de las cachés del gateway a partir de avisos del backend.
+
+El backend avisa qué entidades cambió (tipo según su ruta REST, ver
+`ENDPOINTS_REST.md`, y opcionalmente los IDs) y aquí se descartan las
+entradas de caché y los catálogos indexados que las contienen, para que la
+próxima lectura vaya al backend. Así las cachés pueden usar TTL largos sin
+servir estados viejos.
+
+Cada aviso queda en un registro acotado con número de secuencia, que se
+puede consultar para reenviarlo a otras instancias; un aviso con un
+`id_evento` ya procesado no se vuelve a aplicar.
+"""
+
+import json
+import logging
+from collections import OrderedDict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.config.settings import settings
+from app.modules.animal.infraestructure.animal_catalog import animal_catalog
+from app.modules.campania.infrastructure.campania_catalog import campania_catalog
+from app.modules.publicacion.infrastructure.publicacion_catalog import publicacion_catalog
+from app.shared.infrastructure.negative_cache import cache_no_encontrados
+from app.shared.infrastructure.ttl_cache import TTLCache, cache_listados, cache_referencias
+
+logger = logging.getLogger(__name__)
+
+# Tipos de entidad: las rutas REST del backend que admiten POST/PUT/DELETE
+ENTIDADES = (
+    "animals", "especies", "supervisores", "campanias", "causas_urgentes", "usuarios",
+    "tipo_campanias", "voluntarios", "publicaciones", "adopciones", "refugios",
+    "seguimientos", "donaciones", "pagos",
+)
+
+
+def _por_id(cache: TTLCache) -> Callable[[Optional[List[str]]], int]:
+    """Descarta los IDs indicados y el listado completo ("*") de una caché por ID"""
+    def invalidar(ids: Optional[List[str]]) -> int:
+        if not ids:
+            return cache.invalidar()
+        return sum(cache.invalidar(clave) for clave in [*ids, "*"])
+    return invalidar
+
+
+def _completa(cache: TTLCache) -> Callable[[Optional[List[str]]], int]:
+    """Descarta toda la caché (listados: cualquier cambio los afecta)"""
+    return lambda ids: cache.invalidar()
+
+
+def _no_encontrados(entidad: str, ids: Optional[List[str]]) -> int:
+    """Olvida los 404 recordados de la entidad, para que se vean las altas"""
+    if not ids:
+        return cache_no_encontrados.invalidar_donde(lambda clave: clave[0] == entidad)
+    return sum(cache_no_encontrados.invalidar((entidad, i)) for i in ids)
+
+
+def _catalogo(catalogo) -> Callable[[Optional[List[str]]], int]:
+    """
+    Marca el catálogo como vencido: sus índices se reconstruyen en el
+    próximo acceso con los datos nuevos.
+    """
+    def invalidar(ids: Optional[List[str]]) -> int:
+        catalogo.invalidar()
+        return 1
+    return invalidar
+
+
+class CacheInvalidator:
+    """Aplica los avisos de cambios y lleva el registro para reenviarlos"""
+
+    def __init__(self, max_registro: Optional[int] = None, archivo: Optional[str] = None):
+        self.max_registro = settings.CACHE_INVALIDATION_LOG_SIZE if max_registro is None else max_registro
+        archivo = settings.CACHE_INVALIDATION_LOG_FILE if archivo is None else archivo
+        self.archivo = Path(archivo) if archivo else None
+        self._registro: Deque[Dict[str, Any]] = deque(maxlen=self.max_registro)
+        self._eventos: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._secuencia = 0
+
+        # El listado en caché se descarta antes que el catálogo que se recarga desde él
+        self._manejadores: Dict[str, List[Callable[[Optional[List[str]]], int]]] = {
+            "animals": [_completa(cache_listados.para("animales")), _catalogo(animal_catalog)],
+            "publicaciones": [_completa(cache_listados.para("publicaciones")), _catalogo(publicacion_catalog)],
+            "adopciones": [_completa(cache_listados.para("adopciones"))],
+            "voluntarios": [_completa(cache_listados.para("voluntarios"))],
+            "campanias": [_catalogo(campania_catalog)],
+            "refugios": [_por_id(cache_referencias.para("refugio"))],
+            "tipo_campanias": [_por_id(cache_referencias.para("tipo_campania"))],
+            "especies": [_completa(cache_referencias.para("especie"))],
+        }
+
+    def aplicar(self, cambios: List[Dict[str, Any]], id_evento: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Descarta lo que dependa de cada cambio.
+
+        Args:
+            cambios: Lista de `{"entidad": ..., "ids": [...]}`; sin IDs se
+                descarta todo lo de la entidad
+            id_evento: Identificador del aviso; si ya se procesó se devuelve
+                el resultado anterior sin aplicarlo otra vez
+
+        Returns:
+            Entrada del registro (con `duplicado` si ya se había procesado)
+
+        Raises:
+            ValueError: Si una entidad no es una ruta conocida del backend
+        """
+        if id_evento and id_evento in self._eventos:
+            return {**self._eventos[id_evento], "duplicado": True}
+
+        desconocidas = [c["entidad"] for c in cambios if c["entidad"] not in ENTIDADES]
+        if desconocidas:
+            raise ValueError(
+                f"Entidades desconocidas: {', '.join(desconocidas)}. Opciones: {', '.join(ENTIDADES)}"
+            )
+
+        eliminadas: Dict[str, int] = {}
+        for cambio in cambios:
+            ids = [str(i) for i in cambio.get("ids") or []] or None
+            total = sum(manejador(ids) for manejador in self._manejadores.get(cambio["entidad"], []))
+            total += _no_encontrados(cambio["entidad"], ids)
+            eliminadas[cambio["entidad"]] = eliminadas.get(cambio["entidad"], 0) + total
+
+        self._secuencia += 1
+        entrada = {
+            "secuencia": self._secuencia,
+            "id_evento": id_evento,
+            "recibido_en": datetime.now().isoformat(),
+            "cambios": cambios,
+            "eliminadas": eliminadas,
+        }
+        self._registro.append(entrada)
+        if id_evento:
+            self._eventos[id_evento] = entrada
+            while len(self._eventos) > self.max_registro:
+                self._eventos.popitem(last=False)
+        self._escribir(entrada)
+        logger.info(f"Invalidación {self._secuencia} ({id_evento or 'sin id'}): {eliminadas}")
+        return {**entrada, "duplicado": False}
+
+    def _escribir(self, entrada: Dict[str, Any]) -> None:
+        """Agrega la entrada al archivo del registro (JSON por línea), si está configurado"""
+        if self.archivo is None:
+            return
+        try:
+            self.archivo.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.archivo, "a", encoding="utf-8") as archivo:
+                archivo.write(json.dumps(entrada, ensure_ascii=False, default=str) + "\n")
+        except OSError as e:
+            logger.warning(f"No se pudo escribir el registro de invalidaciones: {e}")
+
+    def registro(self, desde: int = 0, limite: int = 100) -> List[Dict[str, Any]]:
+        """Entradas con secuencia mayor que `desde`, en orden"""
+        return [e for e in self._registro if e["secuencia"] > desde][:limite]
+
+
+# Instancia compartida por todo el proceso
+cache_invalidator = CacheInvalidator()
@@ -0,0 +1,104 @@
+"""
+DataLoaders para las búsquedas por ID contra el backend REST.
+
+Un DataLoader agrupa todos los `load(id)` emitidos en el mismo tick del
+event loop, elimina duplicados y resuelve cada ID una sola vez. Como el
+backend no expone endpoints de lote, los IDs únicos se piden en paralelo
+con un límite de concurrencia para no saturar el pool HTTP.
+
+Los loaders son por request: `Loaders` se crea en el contexto de
+Strawberry (ver `app/shared/interface/context.py`) y su caché muere con
+la operación GraphQL.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar, Union
+
+from strawberry.dataloader import DataLoader
+
+from app.config.settings import settings
+from app.modules.adopcion.infrastructure.adopcion_repository import AdopcionRepository
+from app.modules.animal.aplication.animal_service import AnimalService
+from app.modules.animal.infraestructure.animal_repository import AnimalRepository
+from app.modules.campania.infrastructure.campania_respository import CampaniaRepository
+from app.modules.causa_urgente.infrastructure.causa_urgente_repository import CausaUrgenteRepository
+from app.modules.pago.infrastructure.pago_repository import PagoRepository
+from app.modules.publicacion.infrastructure.publicacion_repository import PublicacionRepository
+from app.modules.refugio.infrastructure.refugio_repository import RefugioRepository
+from app.modules.seguimiento.infrastructure.seguimiento_repository import SeguimientoRepository
+from app.modules.supervisor.infrastructure.supervisor_repository import SupervisorRepository
+from app.modules.tipo_campania.infrastructure.tipo_campania_repository import TipoCampaniaRepository
+from app.modules.usuario.infrastructure.usuario_repository import UsuarioRepository
+from app.modules.voluntario.infrastructure.voluntario_repository import VoluntarioRepository
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+def crear_loader(
+    obtener_por_id: Callable[[K], Awaitable[Optional[T]]],
+    max_concurrencia: Optional[int] = None
+) -> DataLoader:
+    """
+    Construye un DataLoader a partir de un método `obtener_*_por_id`.
+
+    Args:
+        obtener_por_id: Corrutina que resuelve un único ID
+        max_concurrencia: Máximo de peticiones simultáneas por lote
+    """
+    limite = max_concurrencia or settings.DATALOADER_MAX_CONCURRENCY
+
+    async def cargar_lote(ids: List[K]) -> List[Union[Optional[T], BaseException]]:
+        unicos = list(dict.fromkeys(ids))
+        semaforo = asyncio.Semaphore(limite)
+
+        async def cargar_uno(id_: K) -> Optional[T]:
+            async with semaforo:
+                return await obtener_por_id(id_)
+
+        # Un fallo en un ID no debe tumbar el lote: se entrega como
+        # excepción solo a quien pidió ese ID
+        resultados = await asyncio.gather(
+            *(cargar_uno(id_) for id_ in unicos),
+            return_exceptions=True
+        )
+        por_id = dict(zip(unicos, resultados))
+        return [por_id[id_] for id_ in ids]
+
+    return DataLoader(load_fn=cargar_lote)
+
+
+async def cargar_por_ids(loader: DataLoader, ids: Iterable[K]) -> Dict[K, Optional[T]]:
+    """
+    Carga varios IDs con un loader y devuelve un mapa id -> entidad.
+
+    Los IDs que fallan o no existen quedan mapeados a None.
+    """
+    unicos = list(dict.fromkeys(ids))
+    resultados = await asyncio.gather(
+        *(loader.load(id_) for id_ in unicos),
+        return_exceptions=True
+    )
+    return {
+        id_: (None if isinstance(resultado, BaseException) else resultado)
+        for id_, resultado in zip(unicos, resultados)
+    }
+
+
+class Loaders:
+    """Conjunto de DataLoaders por módulo, con alcance de una operación GraphQL"""
+
+    def __init__(self):
+        self.adopcion = crear_loader(AdopcionRepository().obtener_adopcion_por_id)
+        # Los animales se resuelven primero contra el catálogo indexado
+        self.animal = crear_loader(AnimalService(AnimalRepository()).obtener_animal_por_id)
+        self.campania = crear_loader(CampaniaRepository().obtener_campania_por_id)
+        self.causa_urgente = crear_loader(CausaUrgenteRepository().obtener_causa_urgente_por_id)
+        self.pago = crear_loader(PagoRepository().obtener_pago_por_id)
+        self.publicacion = crear_loader(PublicacionRepository().obtener_publicacion_por_id)
+        self.refugio = crear_loader(RefugioRepository().obtener_refugio_por_id)
+        self.seguimiento = crear_loader(SeguimientoRepository().obtener_seguimiento_por_id)
+        self.supervisor = crear_loader(SupervisorRepository().obtener_supervisor_por_id)
+        self.tipo_campania = crear_loader(TipoCampaniaRepository().obtener_tipo_campania_por_id)
+        self.usuario = crear_loader(UsuarioRepository().obtener_usuario_por_id)
+        self.voluntario = crear_loader(VoluntarioRepository().obtener_voluntario_por_id)
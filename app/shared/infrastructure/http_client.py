@@ -0,0 +1,63 @@
+"""
+Cliente HTTP compartido para el acceso al backend REST.
+
+Todos los repositorios usan el mismo `httpx.AsyncClient`, de modo que las
+conexiones TCP se reutilizan (keep-alive) en lugar de abrir un pool nuevo
+en cada llamada. El ciclo de vida lo controla el `lifespan` de FastAPI en
+`app/main.py`; fuera de la app (scripts, consola) el cliente se crea de
+forma perezosa en el primer uso.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.config.settings import settings
+from app.shared.infrastructure.single_flight import SingleFlightTransport
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _crear_cliente() -> httpx.AsyncClient:
+    """Construye el cliente con los límites definidos en settings"""
+    # Con un transporte propio httpx ignora `limits` del cliente: van en el transporte
+    transporte = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+    if settings.HTTP_SINGLE_FLIGHT:
+        transporte = SingleFlightTransport(transporte)
+    return httpx.AsyncClient(
+        base_url=settings.REST_API_URL,
+        timeout=httpx.Timeout(
+            settings.HTTP_TIMEOUT,
+            connect=settings.HTTP_CONNECT_TIMEOUT,
+            pool=settings.HTTP_POOL_TIMEOUT,
+        ),
+        transport=transporte,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Devuelve el cliente HTTP del proceso, creándolo si aún no existe"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _crear_cliente()
+    return _client
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """Abre el pool de conexiones al arrancar la aplicación"""
+    return get_http_client()
+
+
+async def close_http_client() -> None:
+    """Cierra el pool de conexiones al detener la aplicación"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -0,0 +1,290 @@
+"""
+Paginación por cursor (keyset) sobre índices ordenados en memoria.
+
+Cada elemento se ordena por una clave `(nulo, valor, id)`: el id desempata,
+así que el orden es total y estable entre recargas. Los nulos quedan al
+final en ambos sentidos. El cursor es esa misma
+clave serializada, de modo que una página se localiza con `bisect` en
+O(log n) y se recorre solo lo que se devuelve, aunque el elemento del cursor
+haya desaparecido del snapshot.
+
+`ColeccionIndexada` mantiene un snapshot con TTL de un listado completo del
+backend y construye, bajo demanda, un `IndiceKeyset` por campo de orden.
+Cada lectura del snapshot informa su antigüedad a `extensions.cache`.
+"""
+
+import asyncio
+import base64
+import json
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from app.shared.infrastructure.ttl_cache import cargar_con_edad, registrar_edad
+
+T = TypeVar("T")
+
+Clave = Tuple[int, Any, str]
+
+
+def clave_orden(valor: Any, id_elemento: Any) -> Clave:
+    """Clave de orden comparable y serializable; los nulos van al final"""
+    if valor is None:
+        return (1, "", str(id_elemento))
+    if isinstance(valor, datetime):
+        valor = valor.timestamp()
+    elif isinstance(valor, date):
+        valor = valor.toordinal()
+    elif isinstance(valor, str):
+        valor = valor.casefold()
+    return (0, valor, str(id_elemento))
+
+
+def codificar_cursor(clave: Clave) -> str:
+    """Cursor opaco a partir de la clave de orden"""
+    return base64.urlsafe_b64encode(json.dumps(clave).encode()).decode()
+
+
+def decodificar_cursor(cursor: str) -> Clave:
+    """Inversa de `codificar_cursor`; ValueError si el cursor no es válido"""
+    try:
+        nulo, valor, id_elemento = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Cursor inválido: {cursor}") from e
+    return (nulo, valor, id_elemento)
+
+
+@dataclass
+class PaginaKeyset(Generic[T]):
+    """Resultado de pedir una página a un índice"""
+    elementos: List[T] = field(default_factory=list)
+    cursores: List[str] = field(default_factory=list)
+    has_next_page: bool = False
+    has_previous_page: bool = False
+
+
+class IndiceKeyset(Generic[T]):
+    """Elementos ordenados por clave para paginar con cursores"""
+
+    def __init__(self, elementos: List[T], clave: Callable[[T], Clave]):
+        pares = sorted(((clave(e), e) for e in elementos), key=lambda par: par[0])
+        self.claves: List[Clave] = [c for c, _ in pares]
+        self.elementos: List[T] = [e for _, e in pares]
+        # Posición del primer nulo
+        self._corte = bisect_left(self.claves, (1,))
+
+    def __len__(self) -> int:
+        return len(self.elementos)
+
+    def _fisica(self, logica: int, descendente: bool) -> int:
+        """
+        Posición en `claves` de la posición `logica` del orden pedido. En
+        descendente se invierten por separado los valores y los nulos, que
+        siguen al final; los empates siguen el sentido del orden (por id).
+        """
+        if not descendente:
+            return logica
+        if logica < self._corte:
+            return self._corte - 1 - logica
+        return len(self.claves) - 1 - (logica - self._corte)
+
+    def _logica_desc(self, limite: int, clave: Clave) -> int:
+        """
+        En orden descendente, cantidad de elementos que van antes de los que
+        ocupan las posiciones físicas [limite, n) del tramo de `clave`
+        (valores o nulos).
+        """
+        if clave[0] == 0:
+            return self._corte - limite
+        return self._corte + len(self.claves) - limite
+
+    def rebanada(self, inicio: int = 0, fin: Optional[int] = None, descendente: bool = False) -> List[T]:
+        """Elementos entre las posiciones [inicio, fin) del orden, en O(fin - inicio)"""
+        n = len(self.elementos)
+        fin = n if fin is None else min(fin, n)
+        if not descendente:
+            return self.elementos[inicio:fin]
+        return [self.elementos[self._fisica(logica, True)] for logica in range(inicio, fin)]
+
+    def pagina(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        descendente: bool = False,
+        incluir: Optional[Callable[[T], bool]] = None
+    ) -> PaginaKeyset[T]:
+        """
+        Página según los argumentos de Relay (`first`/`after`, `last`/`before`).
+
+        Las posiciones se manejan en orden "lógico" (invertido si es
+        descendente) para que los cursores funcionen igual en ambos sentidos.
+        `incluir` permite filtrar sin reconstruir el índice; en ese caso solo
+        se recorren los elementos necesarios para llenar la página.
+        """
+        n = len(self.claves)
+        inicio, fin = 0, n
+
+        try:
+            if after is not None:
+                clave = decodificar_cursor(after)
+                if descendente:
+                    inicio = self._logica_desc(bisect_left(self.claves, clave), clave)
+                else:
+                    inicio = bisect_right(self.claves, clave)
+            if before is not None:
+                clave = decodificar_cursor(before)
+                if descendente:
+                    fin = self._logica_desc(bisect_right(self.claves, clave), clave)
+                else:
+                    fin = bisect_left(self.claves, clave)
+        except TypeError as e:
+            # Cursor generado con otro campo de orden
+            raise ValueError("El cursor no corresponde al orden solicitado") from e
+
+        def fisica(logica: int) -> int:
+            return self._fisica(logica, descendente)
+
+        def seleccionar(posiciones, limite: Optional[int]) -> Tuple[List[int], bool]:
+            elegidas = []
+            for logica in posiciones:
+                if incluir is None or incluir(self.elementos[fisica(logica)]):
+                    if limite is not None and len(elegidas) == limite:
+                        return elegidas, True
+                    elegidas.append(logica)
+            return elegidas, False
+
+        pagina = PaginaKeyset()
+        if last is not None and first is None:
+            elegidas, hay_mas = seleccionar(range(fin - 1, inicio - 1, -1), last)
+            elegidas.reverse()
+            pagina.has_previous_page = hay_mas
+            pagina.has_next_page = before is not None and fin < n
+        else:
+            elegidas, hay_mas = seleccionar(range(inicio, fin), first)
+            pagina.has_next_page = hay_mas
+            pagina.has_previous_page = after is not None and inicio > 0
+
+        for logica in elegidas:
+            posicion = fisica(logica)
+            pagina.elementos.append(self.elementos[posicion])
+            pagina.cursores.append(codificar_cursor(self.claves[posicion]))
+        return pagina
+
+
+class ColeccionIndexada(Generic[T]):
+    """
+    Snapshot con TTL de un listado del backend con índices keyset por campo.
+
+    Los índices y los conteos se construyen la primera vez que se piden y se
+    descartan al recargar el snapshot.
+    """
+
+    def __init__(
+        self,
+        cargar: Callable[[], Awaitable[List[T]]],
+        id_de: Callable[[T], Any],
+        ordenes: Dict[str, Callable[[T], Any]],
+        ttl: float,
+        nombre: str
+    ):
+        """
+        Args:
+            nombre: Con el que se informa la antigüedad del snapshot (el del
+                listado de origen)
+        """
+        self._cargar = cargar
+        self._id_de = id_de
+        self.ordenes = ordenes
+        self.ttl = ttl
+        self.nombre = nombre
+        self._elementos: Optional[List[T]] = None
+        self._indices: Dict[str, IndiceKeyset[T]] = {}
+        self._conteos: Dict[Hashable, int] = {}
+        self._cargado_en = 0.0
+        # Momento en que el backend entregó los datos del snapshot
+        self._datos_desde = 0.0
+        self._obsoleta = False
+        # Cambia con cada invalidación: una recarga iniciada antes queda vencida
+        self._generacion = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def vigente(self) -> bool:
+        return self._elementos is not None and (time.monotonic() - self._cargado_en) < self.ttl
+
+    async def _snapshot(self) -> List[T]:
+        if not self.vigente:
+            async with self._lock:
+                if not self.vigente:
+                    generacion = self._generacion
+                    self._elementos, edad, self._obsoleta = await cargar_con_edad(self._cargar)
+                    self._datos_desde = time.monotonic() - edad
+                    self._indices = {}
+                    self._conteos = {}
+                    self._cargado_en = time.monotonic() if generacion == self._generacion else 0.0
+        registrar_edad(self.nombre, time.monotonic() - self._datos_desde, self._obsoleta)
+        return self._elementos
+
+    def invalidar(self) -> None:
+        """Marca el snapshot como vencido; se recarga en el próximo acceso"""
+        self._generacion += 1
+        self._cargado_en = 0.0
+
+    async def indice(self, orden: str) -> IndiceKeyset[T]:
+        """Índice ordenado por `orden`, construido una vez por snapshot"""
+        if orden not in self.ordenes:
+            raise ValueError(f"Orden no soportado: {orden}. Opciones: {', '.join(self.ordenes)}")
+        elementos = await self._snapshot()
+        indices = self._indices
+        if orden not in indices:
+            valor_de = self.ordenes[orden]
+            # Ordenar fuera del event loop, igual que los índices de AnimalCatalog
+            indice = await asyncio.to_thread(
+                IndiceKeyset, elementos, lambda e: clave_orden(valor_de(e), self._id_de(e))
+            )
+            # Si el snapshot se recargó mientras tanto, el índice no se guarda
+            # en el diccionario nuevo
+            indices.setdefault(orden, indice)
+        return indices[orden]
+
+    async def contar(self, incluir: Optional[Callable[[T], bool]] = None, clave_filtro: Hashable = None) -> int:
+        """
+        Total de elementos (que cumplen `incluir`), cacheado por
+        `clave_filtro` hasta la próxima recarga.
+        """
+        elementos = await self._snapshot()
+        if incluir is None:
+            return len(elementos)
+        conteos = self._conteos
+        if clave_filtro not in conteos:
+            conteos[clave_filtro] = await asyncio.to_thread(
+                lambda: sum(1 for e in elementos if incluir(e))
+            )
+        return conteos[clave_filtro]
+
+    async def pagina(
+        self,
+        orden: str,
+        descendente: bool = False,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+        incluir: Optional[Callable[[T], bool]] = None,
+        clave_filtro: Hashable = None
+    ) -> Tuple[PaginaKeyset[T], Callable[[], Awaitable[int]]]:
+        """
+        Página por cursor y una función para obtener el total, que solo se
+        evalúa si quien llama la necesita.
+        """
+        indice = await self.indice(orden)
+        pagina = indice.pagina(first, after, last, before, descendente, incluir)
+        return pagina, lambda: self.contar(incluir, clave_filtro)
+
+    async def listar(self) -> List[T]:
+        """Todos los elementos del snapshot vigente"""
+        return list(await self._snapshot())
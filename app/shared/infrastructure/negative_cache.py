@@ -0,0 +1,46 @@
+"""
+Caché negativa de las búsquedas por ID.
+
+Los métodos `obtener_*_por_id` de los repositorios devuelven None cuando el
+backend responde 404, pero sin recordarlo: una agregación que referencia
+una publicación borrada vuelve a preguntar por el mismo ID en cada
+ejecución. `recordar_no_encontrados` guarda esos IDs por unos segundos en
+una caché acotada y compartida por todos los repositorios.
+"""
+
+import functools
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.config.settings import settings
+from app.shared.infrastructure.ttl_cache import TTLCache
+
+T = TypeVar("T")
+
+# (ruta REST de la entidad, id) -> True
+cache_no_encontrados = TTLCache(
+    "no_encontrados", settings.NEGATIVE_CACHE_TTL, settings.NEGATIVE_CACHE_MAX_ITEMS
+)
+
+
+def recordar_no_encontrados(entidad: str):
+    """
+    Decorador para `obtener_*_por_id(self, id)`: si el ID no existía hace
+    menos de `NEGATIVE_CACHE_TTL` segundos devuelve None sin consultar.
+
+    Args:
+        entidad: Ruta REST de la entidad (la misma que usa /internal/invalidate)
+    """
+    def decorador(metodo: Callable[[Any, Any], Awaitable[Optional[T]]]):
+        @functools.wraps(metodo)
+        async def envoltura(self, id_entidad) -> Optional[T]:
+            clave = (entidad, str(id_entidad))
+            if cache_no_encontrados.obtener(clave) is not None:
+                return None
+            generacion = cache_no_encontrados.generacion
+            resultado = await metodo(self, id_entidad)
+            # Si hubo una invalidación mientras se consultaba, el 404 puede estar viejo
+            if resultado is None and generacion == cache_no_encontrados.generacion:
+                cache_no_encontrados.guardar(clave, True)
+            return resultado
+        return envoltura
+    return decorador
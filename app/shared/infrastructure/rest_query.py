@@ -0,0 +1,121 @@
+"""
+Traducción de consultas de listado al backend REST.
+
+Algunas rutas del backend aceptan `limit`, `offset` y parámetros de filtro;
+otras devuelven siempre la tabla completa. `CapacidadesREST` registra qué
+acepta cada ruta (por configuración o detectándolo al arrancar) y
+`planificar()` decide qué se envía al backend y qué debe resolverse en
+memoria, de modo que los filtros y la paginación solo se aplican
+localmente cuando la ruta no los soporta.
+
+Formato de `REST_PUSHDOWN`: `ruta=param,param;ruta=param`, por ejemplo
+`animals=limit,offset,id_especie,estado_adopcion;campanias=limit,offset`.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set
+
+import httpx
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PARAMS_PAGINACION = ("limit", "offset")
+
+
+@dataclass
+class PlanConsulta:
+    """Resultado de traducir una consulta de listado"""
+    params: Dict[str, Any] = field(default_factory=dict)
+    filtros_locales: Dict[str, Any] = field(default_factory=dict)
+    paginar_local: bool = True
+
+    @property
+    def delegada(self) -> bool:
+        """True si el backend resuelve filtros y paginación por completo"""
+        return not self.paginar_local and not self.filtros_locales
+
+
+class CapacidadesREST:
+    """Registro de los parámetros de consulta que acepta cada ruta del backend"""
+
+    def __init__(self, config: str = ""):
+        self._rutas: Dict[str, Set[str]] = {}
+        for entrada in filter(None, (e.strip() for e in config.split(";"))):
+            ruta, _, params = entrada.partition("=")
+            self.registrar(ruta, (p.strip() for p in params.split(",") if p.strip()))
+
+    @staticmethod
+    def _normalizar(ruta: str) -> str:
+        return ruta.strip().strip("/")
+
+    def registrar(self, ruta: str, params: Iterable[str]) -> None:
+        """Declara parámetros soportados por una ruta"""
+        self._rutas.setdefault(self._normalizar(ruta), set()).update(params)
+
+    def soporta(self, ruta: str, param: str) -> bool:
+        return param in self._rutas.get(self._normalizar(ruta), set())
+
+    def planificar(
+        self,
+        ruta: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filtros: Optional[Dict[str, Any]] = None
+    ) -> PlanConsulta:
+        """
+        Reparte filtros y paginación entre el backend y la memoria.
+
+        Los filtros con valor None se ignoran. Si algún filtro tiene que
+        aplicarse localmente, la paginación también, porque paginar en el
+        backend antes de filtrar devolvería páginas incorrectas.
+        """
+        plan = PlanConsulta()
+        for nombre, valor in (filtros or {}).items():
+            if valor is None:
+                continue
+            if self.soporta(ruta, nombre):
+                plan.params[nombre] = str(valor)
+            else:
+                plan.filtros_locales[nombre] = valor
+
+        paginable = all(self.soporta(ruta, p) for p in PARAMS_PAGINACION)
+        if limit is not None and paginable and not plan.filtros_locales:
+            plan.params["limit"] = limit
+            plan.params["offset"] = offset
+            plan.paginar_local = False
+        elif limit is None:
+            plan.paginar_local = False
+        return plan
+
+    async def detectar_paginacion(self, client: httpx.AsyncClient, rutas: Iterable[str]) -> None:
+        """
+        Comprueba si cada ruta respeta `limit`/`offset`.
+
+        Se piden dos páginas de tamaño 1: la ruta pagina si ambas traen a
+        lo sumo un elemento y son distintas. Con tablas vacías no se puede
+        decidir y la ruta se deja sin paginación.
+        """
+        for ruta in rutas:
+            ruta = self._normalizar(ruta)
+            try:
+                primera = await client.get(f"/{ruta}", params={"limit": 1, "offset": 0})
+                segunda = await client.get(f"/{ruta}", params={"limit": 1, "offset": 1})
+                primera.raise_for_status()
+                segunda.raise_for_status()
+                p1, p2 = primera.json(), segunda.json()
+            except (httpx.HTTPError, ValueError) as e:
+                logger.warning(f"No se pudo detectar paginación en /{ruta}: {e}")
+                continue
+
+            if isinstance(p1, list) and isinstance(p2, list) and len(p1) <= 1 and len(p2) <= 1 and p1 and p1 != p2:
+                self.registrar(ruta, PARAMS_PAGINACION)
+                logger.info(f"/{ruta} soporta limit/offset")
+            else:
+                logger.info(f"/{ruta} no soporta limit/offset; se paginará en memoria")
+
+
+# Instancia compartida, inicializada desde settings
+capacidades_rest = CapacidadesREST(settings.REST_PUSHDOWN)
@@ -0,0 +1,79 @@
+"""
+Agrupación de GET idénticos simultáneos hacia el backend REST.
+
+Con tráfico en ráfaga, muchas operaciones GraphQL piden a la vez el mismo
+recurso (`GET /animals`, `GET /adopciones`...). `SingleFlightTransport`
+envuelve el transporte del cliente HTTP compartido: mientras una petición
+está en vuelo, las idénticas (mismo método, URL con parámetros y
+encabezados) esperan su respuesta en lugar de abrir otra. Al backend le
+llega una petición por recurso distinto.
+
+Los repositorios no cambian: cada uno recibe su propia `httpx.Response`
+construida con el cuerpo descargado una sola vez.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# (status, encabezados, cuerpo sin decodificar, extensiones)
+_Resultado = Tuple[int, List[Tuple[bytes, bytes]], bytes, dict]
+
+_METODOS_AGRUPABLES = ("GET", "HEAD")
+
+
+class SingleFlightTransport(httpx.AsyncBaseTransport):
+    """Transporte que comparte una única descarga entre peticiones GET idénticas"""
+
+    def __init__(self, transporte: httpx.AsyncBaseTransport):
+        self._transporte = transporte
+        self._en_vuelo: Dict[tuple, asyncio.Future] = {}
+        # Peticiones resueltas con la descarga de otra
+        self.agrupadas = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in _METODOS_AGRUPABLES:
+            return await self._transporte.handle_async_request(request)
+
+        clave = (request.method, str(request.url), tuple(request.headers.raw))
+        vuelo = self._en_vuelo.get(clave)
+        if vuelo is None:
+            vuelo = asyncio.ensure_future(self._descargar(request))
+            self._en_vuelo[clave] = vuelo
+            vuelo.add_done_callback(lambda f: self._terminar(clave, f))
+        else:
+            self.agrupadas += 1
+
+        # Cancelar a uno de los que esperan no cancela la descarga compartida
+        status, headers, contenido, extensiones = await asyncio.shield(vuelo)
+        return httpx.Response(
+            status_code=status,
+            headers=headers,
+            content=contenido,
+            request=request,
+            extensions=extensiones,
+        )
+
+    async def _descargar(self, request: httpx.Request) -> _Resultado:
+        response = await self._transporte.handle_async_request(request)
+        try:
+            # Cuerpo tal como llegó: cada respuesta lo decodifica según sus encabezados
+            contenido = b"".join([parte async for parte in response.stream])
+        finally:
+            await response.aclose()
+        extensiones = {k: v for k, v in response.extensions.items() if k == "http_version"}
+        return response.status_code, response.headers.raw, contenido, extensiones
+
+    def _terminar(self, clave: tuple, vuelo: asyncio.Future) -> None:
+        if self._en_vuelo.get(clave) is vuelo:
+            del self._en_vuelo[clave]
+        # Evita el aviso de excepción no recuperada si todos cancelaron
+        if not vuelo.cancelled():
+            vuelo.exception()
+
+    async def aclose(self) -> None:
+        await self._transporte.aclose()
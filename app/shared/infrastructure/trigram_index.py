@@ -0,0 +1,117 @@
+"""
+Índice invertido de n-gramas para búsqueda de texto en memoria.
+
+Los textos se normalizan (sin acentos, `casefold`) y cada n-grama de
+longitud 1 a 3 apunta a las posiciones que lo contienen. Una búsqueda por
+subcadena intersecta las listas de sus trigramas, empezando por la más
+corta, y solo verifica la subcadena sobre los candidatos que quedan.
+
+Para la búsqueda difusa se usa la similitud de trigramas de pg_trgm: cada
+palabra se rellena con dos espacios al inicio y uno al final y la
+similitud es |A ∩ B| / |A ∪ B|.
+"""
+
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+N_MAX = 3
+
+
+def normalizar(texto: str) -> str:
+    """Quita acentos y pasa a minúsculas ("Ámbar" -> "ambar")"""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+
+def ngramas(texto: str, n: int) -> Set[str]:
+    return {texto[i:i + n] for i in range(len(texto) - n + 1)}
+
+
+def trigramas_similitud(texto: str) -> Set[str]:
+    """Trigramas con relleno por palabra, como `pg_trgm`"""
+    resultado = set()
+    for palabra in texto.split():
+        resultado |= ngramas(f"  {palabra} ", 3)
+    return resultado
+
+
+class IndiceTrigramas:
+    """Índice de búsqueda sobre una lista de textos; trabaja con posiciones"""
+
+    def __init__(self, textos: List[Optional[str]]):
+        self.textos = [normalizar(t) if t else "" for t in textos]
+        postings: Dict[str, List[int]] = defaultdict(list)
+        postings_similitud: Dict[str, List[int]] = defaultdict(list)
+        self._tamanio_similitud: List[int] = []
+
+        for posicion, texto in enumerate(self.textos):
+            largo = len(texto)
+            gramas = {texto[i:i + n] for n in range(1, N_MAX + 1) for i in range(largo - n + 1)}
+            for grama in gramas:
+                postings[grama].append(posicion)
+            gramas = trigramas_similitud(texto)
+            self._tamanio_similitud.append(len(gramas))
+            for grama in gramas:
+                postings_similitud[grama].append(posicion)
+
+        self._postings: Dict[str, FrozenSet[int]] = {g: frozenset(p) for g, p in postings.items()}
+        self._postings_similitud: Dict[str, List[int]] = dict(postings_similitud)
+
+        # Textos ordenados para búsquedas por prefijo con bisect
+        self._ordenados: List[Tuple[str, int]] = sorted(
+            (texto, posicion) for posicion, texto in enumerate(self.textos) if texto
+        )
+
+    def contiene(self, consulta: str) -> Set[int]:
+        """Posiciones cuyo texto contiene `consulta`"""
+        consulta = normalizar(consulta)
+        if not consulta:
+            return {posicion for posicion, texto in enumerate(self.textos) if texto}
+
+        gramas = ngramas(consulta, N_MAX) if len(consulta) >= N_MAX else {consulta}
+        listas = sorted((self._postings.get(grama, frozenset()) for grama in gramas), key=len)
+        candidatos = set(listas[0])
+        for lista in listas[1:]:
+            if not candidatos:
+                break
+            candidatos &= lista
+
+        if len(consulta) <= N_MAX:
+            # El n-grama completo ya garantiza la coincidencia
+            return candidatos
+        return {posicion for posicion in candidatos if consulta in self.textos[posicion]}
+
+    def prefijo(self, consulta: str) -> Set[int]:
+        """Posiciones cuyo texto empieza por `consulta`"""
+        consulta = normalizar(consulta)
+        inicio = bisect_left(self._ordenados, (consulta, -1))
+        resultado = set()
+        for i in range(inicio, len(self._ordenados)):
+            texto, posicion = self._ordenados[i]
+            if not texto.startswith(consulta):
+                break
+            resultado.add(posicion)
+        return resultado
+
+    def similares(self, consulta: str, umbral: float = 0.3) -> List[Tuple[int, float]]:
+        """
+        Posiciones con similitud de trigramas >= `umbral`, de mayor a menor
+        similitud. Solo se puntúan los textos que comparten algún trigrama.
+        """
+        gramas = trigramas_similitud(normalizar(consulta))
+        if not gramas:
+            return []
+
+        compartidos = Counter()
+        for grama in gramas:
+            compartidos.update(self._postings_similitud.get(grama, ()))
+
+        resultado = []
+        for posicion, comunes in compartidos.items():
+            similitud = comunes / (len(gramas) + self._tamanio_similitud[posicion] - comunes)
+            if similitud >= umbral:
+                resultado.append((posicion, similitud))
+        resultado.sort(key=lambda par: (-par[1], par[0]))
+        return resultado
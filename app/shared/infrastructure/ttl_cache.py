@@ -0,0 +1,331 @@
+"""
+Caché en memoria con vencimiento (TTL) y tamaño acotado (LRU).
+
+Pensada para datos de referencia que casi no cambian (refugios, tipos de
+campaña, especies) y que hoy se vuelven a pedir al backend en cada
+resolver, agregación o reporte. Cada entidad tiene su propia `TTLCache`,
+con su TTL y su límite de entradas, obtenida de `cache_referencias`.
+
+Los listados completos (animales, publicaciones, adopciones, voluntarios)
+usan `SWRCache` desde `cache_listados`: se sirven de memoria y, pasado el
+TTL suave, se refrescan en segundo plano mientras se sigue entregando la
+copia anterior.
+
+Las lecturas de listados registran la antigüedad del dato en la operación
+en curso (ver `app/shared/interface/cache_extension.py`). Los catálogos
+indexados construidos a partir de un listado usan `cargar_con_edad` y
+`registrar_edad` para informar la antigüedad de su snapshot.
+
+Los repositorios reciben la caché en el constructor, así que se puede
+reemplazar por otra implementación con la misma interfaz (por ejemplo
+una compartida entre procesos) o desactivar con TTL 0.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_FALTA = object()
+
+# Antigüedad de los datos servidos desde caché en la operación en curso
+# (ver app/shared/interface/cache_extension.py)
+_edades: ContextVar[Optional[Dict[str, Dict[str, Any]]]] = ContextVar("edades_cache", default=None)
+
+
+def iniciar_registro_edades() -> Tuple[Dict[str, Dict[str, Any]], Any]:
+    """
+    Empieza a registrar la antigüedad de las lecturas de caché del
+    contexto actual.
+
+    Returns:
+        Tuple con (registro, token para `terminar_registro_edades`)
+    """
+    edades: Dict[str, Dict[str, Any]] = {}
+    return edades, _edades.set(edades)
+
+
+def terminar_registro_edades(token: Any) -> None:
+    _edades.reset(token)
+
+
+def registrar_edad(nombre: str, edad: float, obsoleta: bool) -> None:
+    """Guarda la lectura más antigua de cada caché en la operación en curso"""
+    edades = _edades.get()
+    if edades is None:
+        return
+    previa = edades.get(nombre)
+    if previa is None or edad > previa["edad_segundos"]:
+        edades[nombre] = {"edad_segundos": round(edad, 3), "obsoleta": obsoleta}
+
+
+async def cargar_con_edad(cargar: Callable[[], Awaitable[T]]) -> Tuple[T, float, bool]:
+    """
+    Ejecuta `cargar()` con un registro de edades propio.
+
+    Returns:
+        Tuple con (resultado, antigüedad en segundos del dato más viejo que
+        leyó de las cachés o 0, True si alguno se sirvió obsoleto)
+    """
+    edades, token = iniciar_registro_edades()
+    try:
+        valor = await cargar()
+    finally:
+        terminar_registro_edades(token)
+    edad = max((e["edad_segundos"] for e in edades.values()), default=0.0)
+    return valor, edad, any(e["obsoleta"] for e in edades.values())
+
+
+@dataclass
+class EstadisticasCache:
+    """Contadores de uso de una caché"""
+    aciertos: int = 0
+    fallos: int = 0
+    # Entradas descartadas por el límite de tamaño (LRU)
+    desalojos: int = 0
+    # Entradas descartadas por vencimiento del TTL
+    vencidas: int = 0
+    invalidaciones: int = 0
+    # Aciertos servidos pasado el TTL suave (solo SWRCache)
+    obsoletas: int = 0
+    revalidaciones: int = 0
+
+
+class TTLCache:
+    """
+    LRU de hasta `max_items` entradas que vencen `ttl` segundos después
+    de guardarse.
+
+    `obtener_o_cargar` agrupa las cargas simultáneas de una misma clave:
+    la primera consulta al backend y las demás esperan su resultado.
+    """
+
+    def __init__(self, nombre: str, ttl: float, max_items: int):
+        self.nombre = nombre
+        self.ttl = ttl
+        self.max_items = max_items
+        self.stats = EstadisticasCache()
+        self._entradas: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._cargas: Dict[Hashable, asyncio.Future] = {}
+        # Cambia con cada invalidación: una carga iniciada antes no se guarda
+        self._generacion = 0
+
+    @property
+    def habilitada(self) -> bool:
+        return self.ttl > 0 and self.max_items > 0
+
+    @property
+    def generacion(self) -> int:
+        """Número de invalidaciones aplicadas hasta ahora"""
+        return self._generacion
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def obtener(self, clave: Hashable, defecto: Any = None) -> Any:
+        """Valor vigente de `clave`, o `defecto` si no está o ya venció"""
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            self.stats.fallos += 1
+            return defecto
+        vence, valor = entrada
+        if vence <= time.monotonic():
+            del self._entradas[clave]
+            self.stats.vencidas += 1
+            self.stats.fallos += 1
+            return defecto
+        self._entradas.move_to_end(clave)
+        self.stats.aciertos += 1
+        return valor
+
+    def guardar(self, clave: Hashable, valor: Any, ttl: Optional[float] = None) -> None:
+        """Guarda `valor` por `ttl` segundos (por defecto el de la caché)"""
+        if not self.habilitada:
+            return
+        self._entradas[clave] = (time.monotonic() + (self.ttl if ttl is None else ttl), valor)
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.max_items:
+            self._entradas.popitem(last=False)
+            self.stats.desalojos += 1
+
+    def invalidar(self, clave: Hashable = _FALTA) -> int:
+        """
+        Descarta `clave`, o todas las entradas si no se indica.
+
+        Returns:
+            Cantidad de entradas descartadas
+        """
+        self._generacion += 1
+        if clave is _FALTA:
+            eliminadas = len(self._entradas)
+            self._entradas.clear()
+        else:
+            eliminadas = 1 if self._entradas.pop(clave, None) is not None else 0
+        self.stats.invalidaciones += eliminadas
+        return eliminadas
+
+    def invalidar_donde(self, condicion: Callable[[Hashable], bool]) -> int:
+        """Descarta las entradas cuya clave cumple `condicion`"""
+        self._generacion += 1
+        claves = [clave for clave in self._entradas if condicion(clave)]
+        for clave in claves:
+            del self._entradas[clave]
+        self.stats.invalidaciones += len(claves)
+        return len(claves)
+
+    async def obtener_o_cargar(self, clave: Hashable, cargar: Callable[[], Awaitable[T]]) -> T:
+        """
+        Valor de `clave` desde la caché o, si no está, desde `cargar()`.
+
+        Un resultado None no se guarda. Cancelar a uno de los que esperan
+        no cancela la carga compartida.
+        """
+        valor = self.obtener(clave, _FALTA)
+        if valor is not _FALTA:
+            return valor
+
+        carga = self._cargas.get(clave)
+        if carga is None:
+            carga = asyncio.ensure_future(self._cargar(clave, cargar))
+            # Evita el aviso de excepción no recuperada si todos cancelan
+            carga.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._cargas[clave] = carga
+        return await asyncio.shield(carga)
+
+    async def _cargar(self, clave: Hashable, cargar: Callable[[], Awaitable[T]]) -> T:
+        generacion = self._generacion
+        try:
+            valor = await cargar()
+        finally:
+            self._cargas.pop(clave, None)
+        if valor is not None and generacion == self._generacion:
+            self.guardar(clave, valor)
+        return valor
+
+    def estadisticas(self) -> Dict[str, Any]:
+        return {
+            "entradas": len(self._entradas),
+            "max_items": self.max_items,
+            "ttl": self.ttl,
+            **asdict(self.stats),
+        }
+
+
+class SWRCache(TTLCache):
+    """
+    Caché stale-while-revalidate.
+
+    - Antes de `ttl_suave` la entrada se devuelve sin más.
+    - Entre `ttl_suave` y `ttl` se devuelve la copia anterior y se lanza
+      un único refresco en segundo plano.
+    - Pasado `ttl` la entrada venció y quien la pide espera la carga.
+
+    Cada lectura registra la antigüedad del dato en la operación en curso.
+    """
+
+    def __init__(self, nombre: str, ttl_suave: float, ttl: float, max_items: int):
+        super().__init__(nombre, ttl, max_items)
+        self.ttl_suave = ttl_suave
+
+    async def obtener_o_cargar(self, clave: Hashable, cargar: Callable[[], Awaitable[T]]) -> T:
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            vence, valor = entrada
+            edad = self.ttl - (vence - time.monotonic())
+            if edad < self.ttl:
+                self._entradas.move_to_end(clave)
+                self.stats.aciertos += 1
+                obsoleta = edad >= self.ttl_suave
+                if obsoleta:
+                    self.stats.obsoletas += 1
+                    self._revalidar(clave, cargar)
+                registrar_edad(self.nombre, edad, obsoleta)
+                return valor
+
+        valor = await super().obtener_o_cargar(clave, cargar)
+        registrar_edad(self.nombre, 0.0, False)
+        return valor
+
+    def _revalidar(self, clave: Hashable, cargar: Callable[[], Awaitable[T]]) -> None:
+        """Refresca `clave` en segundo plano si no hay ya una carga en curso"""
+        if clave in self._cargas:
+            return
+        self.stats.revalidaciones += 1
+        carga = asyncio.ensure_future(self._cargar(clave, cargar))
+        carga.add_done_callback(self._registrar_error)
+        self._cargas[clave] = carga
+
+    def _registrar_error(self, carga: asyncio.Future) -> None:
+        # Si el refresco falla se sigue sirviendo la copia anterior hasta `ttl`
+        if not carga.cancelled() and carga.exception() is not None:
+            logger.warning(f"No se pudo refrescar la caché {self.nombre}: {carga.exception()}")
+
+    def estadisticas(self) -> Dict[str, Any]:
+        return {"ttl_suave": self.ttl_suave, **super().estadisticas()}
+
+
+class CacheRegistry:
+    """Una caché por entidad, con su configuración propia"""
+
+    def __init__(
+        self,
+        configuracion: Dict[str, tuple],
+        por_defecto: tuple,
+        clase: Type[TTLCache] = TTLCache
+    ):
+        """
+        Args:
+            configuracion: entidad -> argumentos de `clase` después del nombre
+                (TTLCache: TTL y máximo de entradas; SWRCache: TTL suave, TTL
+                y máximo de entradas)
+            por_defecto: Argumentos para las entidades no configuradas
+            clase: Tipo de caché a crear
+        """
+        self._configuracion = configuracion
+        self._por_defecto = por_defecto
+        self._clase = clase
+        self._caches: Dict[str, TTLCache] = {}
+
+    def para(self, entidad: str) -> TTLCache:
+        """Caché de `entidad` (se crea en el primer uso)"""
+        cache = self._caches.get(entidad)
+        if cache is None:
+            argumentos = self._configuracion.get(entidad, self._por_defecto)
+            cache = self._caches[entidad] = self._clase(entidad, *argumentos)
+        return cache
+
+    def invalidar(self, entidad: Optional[str] = None, clave: Hashable = _FALTA) -> int:
+        """Descarta `clave` de `entidad`, toda la entidad o todas las cachés"""
+        if entidad is None:
+            return sum(cache.invalidar() for cache in self._caches.values())
+        return self.para(entidad).invalidar(clave)
+
+    def estadisticas(self) -> Dict[str, Dict[str, Any]]:
+        return {entidad: cache.estadisticas() for entidad, cache in self._caches.items()}
+
+
+# Datos de referencia compartidos por todo el proceso
+cache_referencias = CacheRegistry(
+    {
+        "refugio": (settings.CACHE_REFUGIO_TTL, settings.CACHE_REFUGIO_MAX_ITEMS),
+        "tipo_campania": (settings.CACHE_TIPO_CAMPANIA_TTL, settings.CACHE_TIPO_CAMPANIA_MAX_ITEMS),
+        "especie": (settings.CACHE_ESPECIE_TTL, settings.CACHE_ESPECIE_MAX_ITEMS),
+    },
+    por_defecto=(settings.CACHE_DEFAULT_TTL, settings.CACHE_DEFAULT_MAX_ITEMS),
+)
+
+# Listados completos servidos con stale-while-revalidate (una entrada por listado)
+cache_listados = CacheRegistry(
+    {},
+    por_defecto=(settings.LIST_CACHE_SOFT_TTL, settings.LIST_CACHE_HARD_TTL, 1),
+    clase=SWRCache,
+)
@@ -0,0 +1 @@
+# Interface layer compartida (contexto GraphQL)
@@ -0,0 +1,30 @@
+"""Extensión de Strawberry que informa la antigüedad de los datos en caché."""
+
+from typing import Any, Dict, Iterator
+
+from strawberry.extensions import SchemaExtension
+
+from app.shared.infrastructure.ttl_cache import iniciar_registro_edades, terminar_registro_edades
+
+
+class CacheAgeExtension(SchemaExtension):
+    """
+    Agrega a `extensions.cache` de la respuesta la antigüedad (segundos) del
+    dato más viejo que cada listado en caché entregó durante la operación, y
+    si se sirvió pasado su TTL suave. Las lecturas de los catálogos
+    indexados cuentan con la antigüedad de su snapshot, bajo el nombre del
+    listado del que se cargaron.
+
+    Ejemplo: `{"cache": {"animales": {"edad_segundos": 7.2, "obsoleta": true}}}`
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        self._edades, token = iniciar_registro_edades()
+        try:
+            yield
+        finally:
+            terminar_registro_edades(token)
+
+    def get_results(self) -> Dict[str, Any]:
+        edades = getattr(self, "_edades", None)
+        return {"cache": dict(edades)} if edades else {}
@@ -0,0 +1,72 @@
+"""
+Tipos GraphQL de conexión estilo Relay (`edges`, `pageInfo`, cursores opacos).
+
+`totalCount` se resuelve solo si el cliente lo pide: la conexión guarda una
+función que lo calcula en lugar del valor.
+"""
+
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+
+import strawberry
+
+from app.config.settings import settings
+from app.shared.infrastructure.keyset import PaginaKeyset
+
+T = TypeVar("T")
+
+
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str] = None
+    end_cursor: Optional[str] = None
+
+
+@strawberry.type
+class Edge(Generic[T]):
+    node: T
+    cursor: str
+
+
+@strawberry.type
+class Connection(Generic[T]):
+    """Página de resultados con cursores"""
+    edges: List[Edge[T]]
+    page_info: PageInfo
+    _contar: strawberry.Private[Callable[[], Awaitable[int]]]
+
+    @strawberry.field(description="Total de elementos que cumplen los filtros (se calcula solo si se pide)")
+    async def total_count(self) -> int:
+        return await self._contar()
+
+
+def validar_argumentos(first: Optional[int], last: Optional[int]) -> None:
+    """Valida los argumentos de paginación de Relay"""
+    if first is not None and last is not None:
+        raise ValueError("No se pueden usar 'first' y 'last' a la vez")
+    for nombre, valor in (("first", first), ("last", last)):
+        if valor is not None and not 0 <= valor <= settings.CONNECTION_MAX_PAGE_SIZE:
+            raise ValueError(f"'{nombre}' debe estar entre 0 y {settings.CONNECTION_MAX_PAGE_SIZE}")
+
+
+def crear_conexion(
+    pagina: PaginaKeyset,
+    convertir: Callable[[object], T],
+    contar: Callable[[], Awaitable[int]]
+) -> Connection[T]:
+    """Arma la conexión GraphQL a partir de una página del índice keyset"""
+    edges = [
+        Edge(node=convertir(elemento), cursor=cursor)
+        for elemento, cursor in zip(pagina.elementos, pagina.cursores)
+    ]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=pagina.has_next_page,
+            has_previous_page=pagina.has_previous_page,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+        _contar=contar,
+    )
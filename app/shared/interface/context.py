@@ -0,0 +1,22 @@
+"""Contexto por request para el schema GraphQL."""
+
+from typing import Any, Dict
+
+import strawberry
+
+from app.shared.infrastructure.dataloader import Loaders
+
+
+def crear_contexto() -> Dict[str, Any]:
+    """Crea el contexto de una operación GraphQL con sus propios DataLoaders"""
+    return {"loaders": Loaders()}
+
+
+async def get_context() -> Dict[str, Any]:
+    """`context_getter` para el GraphQLRouter de FastAPI"""
+    return crear_contexto()
+
+
+def get_loaders(info: strawberry.Info) -> Loaders:
+    """Obtiene los DataLoaders de la operación en curso"""
+    return info.context["loaders"]
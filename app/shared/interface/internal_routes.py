@@ -0,0 +1,65 @@
+"""Rutas internas para que el backend REST notifique cambios al gateway."""
+
+import logging
+import secrets
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from app.config.settings import settings
+from app.shared.infrastructure.cache_invalidation import cache_invalidator
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+class CambioEntidad(BaseModel):
+    """Entidades modificadas de un tipo"""
+    entidad: str = Field(..., description="Ruta REST del tipo de entidad (animals, adopciones, refugios...)")
+    ids: Optional[List[str]] = Field(None, description="IDs modificados; vacío invalida toda la entidad")
+
+
+class InvalidationRequest(BaseModel):
+    """Aviso de cambios del backend"""
+    id_evento: Optional[str] = Field(None, description="Identificador del aviso, para no aplicarlo dos veces")
+    cambios: List[CambioEntidad] = Field(..., min_length=1)
+
+
+def _verificar_token(token: Optional[str]) -> None:
+    if not settings.CACHE_INVALIDATION_TOKEN:
+        raise HTTPException(status_code=503, detail="La invalidación de caché no está configurada")
+    if not token or not secrets.compare_digest(token, settings.CACHE_INVALIDATION_TOKEN):
+        raise HTTPException(status_code=401, detail="Token de invalidación inválido")
+
+
+@router.post("/invalidate", summary="Invalidar cachés por cambios en el backend")
+async def invalidar_cache(
+    solicitud: InvalidationRequest,
+    x_invalidation_token: Optional[str] = Header(None)
+):
+    """
+    Descarta las entradas de caché y los catálogos que dependen de las
+    entidades indicadas. Requiere el encabezado `X-Invalidation-Token`.
+
+    Ejemplo: `{"id_evento": "42", "cambios": [{"entidad": "adopciones", "ids": ["uuid"]}]}`
+    """
+    _verificar_token(x_invalidation_token)
+    try:
+        return cache_invalidator.aplicar(
+            [c.model_dump() for c in solicitud.cambios], solicitud.id_evento
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get("/invalidate/log", summary="Registro de invalidaciones")
+async def registro_invalidaciones(
+    desde: int = Query(0, ge=0, description="Devolver las entradas con secuencia mayor a esta"),
+    limite: int = Query(100, ge=1, le=1000),
+    x_invalidation_token: Optional[str] = Header(None)
+):
+    """Entradas del registro en orden, para reenviarlas a otras instancias"""
+    _verificar_token(x_invalidation_token)
+    return cache_invalidator.registro(desde, limite)
@@ -0,0 +1,35 @@
+"""Extensión de Strawberry que informa los campos resueltos con datos parciales."""
+
+from typing import Any, Dict, List
+
+import strawberry
+from strawberry.extensions import SchemaExtension
+
+_CLAVE_CONTEXTO = "datos_parciales"
+
+
+def registrar_fuentes_fallidas(info: strawberry.Info, fallidas: List[Dict[str, Any]]) -> None:
+    """
+    Anota que el campo en curso se resolvió sin algunas de sus fuentes.
+
+    Args:
+        info: Info del resolver (el campo se identifica por su alias o nombre)
+        fallidas: `{"fuente": ..., "error": ...}` por cada fuente que falló
+    """
+    if fallidas:
+        info.context.setdefault(_CLAVE_CONTEXTO, {})[info.path.key] = fallidas
+
+
+class PartialResultsExtension(SchemaExtension):
+    """
+    Agrega a `extensions.datos_parciales` de la respuesta las fuentes que
+    fallaron en cada campo que devolvió datos incompletos, para que el
+    cliente no confunda una fuente caída con actividad en cero.
+
+    Ejemplo: `{"datos_parciales": {"actividadMensual": [{"fuente": "pagos", "error": "..."}]}}`
+    """
+
+    def get_results(self) -> Dict[str, Any]:
+        contexto = self.execution_context.context
+        parciales = contexto.get(_CLAVE_CONTEXTO) if isinstance(contexto, dict) else None
+        return {_CLAVE_CONTEXTO: parciales} if parciales else {}
@@ -0,0 +1,59 @@
+"""Utilidades compartidas por las pruebas."""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+from uuid import UUID
+
+import pytest
+
+from app.modules.animal.domain.entities import Animal
+from app.shared.infrastructure import ttl_cache
+
+
+def crear_animales(cantidad: int, semilla: int = 1) -> List[Animal]:
+    """Animales con nombres, edades y fechas repetidos y algunos nulos"""
+    azar = random.Random(semilla)
+    base = datetime(2024, 1, 1)
+    return [
+        Animal(
+            id_animal=UUID(int=i + 1),
+            nombre=azar.choice(["Luna", "Max", "Bella", "Rocky", "Nala"]),
+            id_especie=None,
+            especie=None,
+            edad=azar.choice([None, 1, 2, 3, 5, 8]),
+            estado=None,
+            descripcion=None,
+            fotos=None,
+            estado_adopcion=azar.choice(["disponible", "adoptado"]),
+            id_refugio=None,
+            fecha_creacion=azar.choice([None, base + timedelta(days=azar.randint(0, 30))]),
+        )
+        for i in range(cantidad)
+    ]
+
+
+class RepositorioFalso:
+    """Repositorio en memoria con la interfaz de listado de AnimalRepository"""
+
+    def __init__(self, animales: List[Animal]):
+        self.animales = animales
+        self.llamadas = 0
+
+    async def listar_animales(self) -> List[Animal]:
+        self.llamadas += 1
+        return list(self.animales)
+
+
+@pytest.fixture
+def animales() -> List[Animal]:
+    return crear_animales(60)
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    """Reloj manual para `time.monotonic` dentro de ttl_cache"""
+    ahora = SimpleNamespace(valor=1000.0)
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: ahora.valor))
+    return ahora
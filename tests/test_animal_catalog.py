@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.modules.animal.infraestructure.animal_catalog import ORDENES_ANIMAL, AnimalCatalog
+from tests.conftest import RepositorioFalso
+
+
+def _catalogo(animales) -> AnimalCatalog:
+    return AnimalCatalog(repo=RepositorioFalso(animales), ttl=60)
+
+
+def _esperado(animales, campo, descendente):
+    """Orden de referencia: nulos al final y empates por id en el sentido del orden"""
+    con_valor = [a for a in animales if ORDENES_ANIMAL[campo](a) is not None]
+    nulos = [a for a in animales if ORDENES_ANIMAL[campo](a) is None]
+    clave = lambda a: (ORDENES_ANIMAL[campo](a), str(a.id_animal))
+    return sorted(con_valor, key=clave, reverse=descendente) + sorted(
+        nulos, key=lambda a: str(a.id_animal), reverse=descendente
+    )
+
+
+@pytest.mark.parametrize("campo", list(ORDENES_ANIMAL))
+@pytest.mark.parametrize("descendente", [False, True])
+def test_ordenar_un_criterio_con_nulos_al_final(animales, campo, descendente):
+    catalogo = _catalogo(animales)
+    resultado = asyncio.run(catalogo.ordenar([(campo, descendente)]))
+    if campo == "nombre":
+        # Comparación sin mayúsculas, igual que clave_orden
+        assert [a.nombre for a in resultado] == [a.nombre for a in _esperado(animales, campo, descendente)]
+    else:
+        assert resultado == _esperado(animales, campo, descendente)
+
+
+@pytest.mark.parametrize("criterios", [
+    [("edad", False)],
+    [("edad", True)],
+    [("edad", False), ("nombre", True)],
+])
+def test_ordenar_pagina_coincide_con_el_orden_completo(animales, criterios):
+    catalogo = _catalogo(animales)
+    completo = asyncio.run(catalogo.ordenar(criterios))
+    for offset, limit in [(0, 5), (7, 10), (55, 10), (60, 3), (0, 0)]:
+        pagina = asyncio.run(catalogo.ordenar(criterios, limit=limit, offset=offset))
+        assert pagina == completo[offset:offset + limit]
+
+
+@pytest.mark.parametrize("limit, offset", [(-1, 0), (5, -3), (-1, -1)])
+def test_ordenar_rechaza_limit_u_offset_negativos(animales, limit, offset):
+    catalogo = _catalogo(animales)
+    for criterios in ([("nombre", False)], [("nombre", True)], [("edad", False), ("nombre", True)]):
+        with pytest.raises(ValueError):
+            asyncio.run(catalogo.ordenar(criterios, limit=limit, offset=offset))
+
+
+def test_pagina_descendente_deja_los_nulos_al_final(animales):
+    catalogo = _catalogo(animales)
+    pagina, contar = asyncio.run(catalogo.pagina("fecha_creacion", descendente=True, first=len(animales)))
+    fechas = [a.fecha_creacion for a in pagina.elementos]
+    con_fecha = [f for f in fechas if f is not None]
+    assert asyncio.run(contar()) == len(animales)
+    assert fechas == con_fecha + [None] * (len(fechas) - len(con_fecha))
+    assert con_fecha == sorted(con_fecha, reverse=True)
+
+
+@pytest.mark.parametrize("descendente", [False, True])
+def test_pagina_y_ordenar_usan_el_mismo_orden(animales, descendente):
+    catalogo = _catalogo(animales)
+    ordenados = asyncio.run(catalogo.ordenar([("edad", descendente)]))
+    recorridos, cursor = [], None
+    while True:
+        pagina, _ = asyncio.run(catalogo.pagina("edad", descendente=descendente, first=7, after=cursor))
+        recorridos += pagina.elementos
+        if not pagina.has_next_page:
+            break
+        cursor = pagina.cursores[-1]
+    assert recorridos == ordenados
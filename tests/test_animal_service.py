@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.modules.animal.aplication import animal_service
+from app.modules.animal.aplication.animal_service import AnimalService
+from app.modules.animal.infraestructure.animal_catalog import AnimalCatalog
+from app.shared.infrastructure.rest_query import CapacidadesREST
+from tests.conftest import RepositorioFalso
+
+
+class RepositorioConsulta(RepositorioFalso):
+    """Repositorio que además resuelve páginas como el backend"""
+
+    def __init__(self, animales, con_total: bool):
+        super().__init__(animales)
+        self.con_total = con_total
+        self.consultas = []
+
+    async def listar_animales_consulta(self, params):
+        self.consultas.append(params)
+        inicio = int(params.get("offset", 0))
+        pagina = self.animales[inicio:inicio + int(params["limit"])]
+        return pagina, (len(self.animales) if self.con_total else None)
+
+
+@pytest.fixture
+def pushdown(monkeypatch):
+    monkeypatch.setattr(
+        animal_service, "capacidades_rest", CapacidadesREST("animals=limit,offset")
+    )
+
+
+def _servicio(animales, con_total):
+    repo = RepositorioConsulta(animales, con_total)
+    return AnimalService(repo, catalog=AnimalCatalog(repo=repo, ttl=60)), repo
+
+
+def test_sin_total_del_backend_no_se_inventa_el_total(animales, pushdown):
+    servicio, _ = _servicio(animales, con_total=False)
+    resultado = asyncio.run(servicio.obtener_animales_paginados(limit=10, offset=20))
+    assert [a.id_animal for a in resultado["animales"]] == [a.id_animal for a in animales[20:30]]
+    assert resultado["has_more"] is True
+    assert resultado["total_count"] is None
+    assert resultado["total_pages"] is None
+    assert resultado["current_page"] == 3
+
+
+def test_con_total_del_backend_se_publica(animales, pushdown):
+    servicio, _ = _servicio(animales, con_total=True)
+    resultado = asyncio.run(servicio.obtener_animales_paginados(limit=25, offset=50))
+    assert resultado["total_count"] == 60
+    assert resultado["total_pages"] == 3
+    assert resultado["has_more"] is False
+
+
+def test_delegacion_no_depende_de_la_vigencia_del_catalogo(animales, pushdown):
+    servicio, repo = _servicio(animales, con_total=True)
+    asyncio.run(servicio.catalog.listar())
+    assert servicio.catalog.vigente
+    asyncio.run(servicio.obtener_animales_paginados(limit=10))
+    assert repo.consultas == [{"limit": 11, "offset": 0}]
+
+
+def test_sin_pushdown_pagina_el_catalogo(animales, monkeypatch):
+    monkeypatch.setattr(animal_service, "capacidades_rest", CapacidadesREST(""))
+    servicio, repo = _servicio(animales, con_total=False)
+    resultado = asyncio.run(servicio.obtener_animales_paginados(limit=10, offset=55))
+    assert repo.consultas == []
+    assert resultado["total_count"] == 60
+    assert len(resultado["animales"]) == 5
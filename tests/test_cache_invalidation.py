@@ -0,0 +1,131 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.settings import settings
+from app.shared.infrastructure.cache_invalidation import CacheInvalidator
+from app.shared.infrastructure.negative_cache import cache_no_encontrados
+from app.shared.infrastructure.ttl_cache import cache_referencias
+from app.shared.interface import internal_routes
+
+
+@pytest.fixture
+def refugios():
+    cache = cache_referencias.para("refugio")
+    cache.invalidar()
+    cache.guardar("r1", {"id": "r1"})
+    cache.guardar("r2", {"id": "r2"})
+    cache.guardar("*", [{"id": "r1"}, {"id": "r2"}])
+    yield cache
+    cache.invalidar()
+
+
+def test_aviso_con_ids_descarta_esos_ids_y_el_listado(refugios):
+    entrada = CacheInvalidator(max_registro=10, archivo="").aplicar(
+        [{"entidad": "refugios", "ids": ["r1"]}], "ev-1"
+    )
+    assert refugios.obtener("r1") is None
+    assert refugios.obtener("*") is None
+    assert refugios.obtener("r2") == {"id": "r2"}
+    assert entrada["eliminadas"] == {"refugios": 2}
+    assert entrada["duplicado"] is False
+
+
+def test_aviso_repetido_no_se_aplica_otra_vez(refugios):
+    invalidador = CacheInvalidator(max_registro=10, archivo="")
+    primera = invalidador.aplicar([{"entidad": "refugios", "ids": ["r1"]}], "ev-1")
+    refugios.guardar("r1", {"id": "r1"})
+    segunda = invalidador.aplicar([{"entidad": "refugios", "ids": ["r1"]}], "ev-1")
+
+    assert segunda["duplicado"] is True
+    assert segunda["secuencia"] == primera["secuencia"]
+    assert refugios.obtener("r1") == {"id": "r1"}
+    assert len(invalidador.registro()) == 1
+
+
+def test_avisos_sin_id_se_aplican_siempre(refugios):
+    invalidador = CacheInvalidator(max_registro=10, archivo="")
+    invalidador.aplicar([{"entidad": "refugios", "ids": None}])
+    refugios.guardar("r1", {"id": "r1"})
+    invalidador.aplicar([{"entidad": "refugios", "ids": None}])
+    assert refugios.obtener("r1") is None
+    assert [e["secuencia"] for e in invalidador.registro()] == [1, 2]
+
+
+def test_entidad_desconocida_no_aplica_nada(refugios):
+    invalidador = CacheInvalidator(max_registro=10, archivo="")
+    with pytest.raises(ValueError):
+        invalidador.aplicar([{"entidad": "refugios", "ids": None}, {"entidad": "gatos", "ids": None}], "ev-1")
+    assert refugios.obtener("r1") == {"id": "r1"}
+    assert invalidador.registro() == []
+    # El id no quedó marcado como procesado
+    assert invalidador.aplicar([{"entidad": "refugios", "ids": None}], "ev-1")["duplicado"] is False
+
+
+def test_aviso_olvida_los_404_recordados():
+    cache_no_encontrados.guardar(("refugios", "r9"), True)
+    cache_no_encontrados.guardar(("refugios", "r8"), True)
+    CacheInvalidator(max_registro=10, archivo="").aplicar([{"entidad": "refugios", "ids": ["r9"]}])
+    assert cache_no_encontrados.obtener(("refugios", "r9")) is None
+    assert cache_no_encontrados.obtener(("refugios", "r8")) is True
+    cache_no_encontrados.invalidar()
+
+
+def test_registro_acotado_y_archivo(tmp_path):
+    archivo = tmp_path / "invalidaciones.jsonl"
+    invalidador = CacheInvalidator(max_registro=2, archivo=str(archivo))
+    for i in range(3):
+        invalidador.aplicar([{"entidad": "pagos", "ids": None}], f"ev-{i}")
+    assert [e["secuencia"] for e in invalidador.registro()] == [2, 3]
+    assert [e["secuencia"] for e in invalidador.registro(desde=2)] == [3]
+    lineas = archivo.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(linea)["id_evento"] for linea in lineas] == ["ev-0", "ev-1", "ev-2"]
+    # El más viejo salió del registro de ids: se aplicaría otra vez
+    assert invalidador.aplicar([{"entidad": "pagos", "ids": None}], "ev-0")["duplicado"] is False
+
+
+@pytest.fixture
+def cliente(monkeypatch, refugios):
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_TOKEN", "secreto")
+    monkeypatch.setattr(internal_routes, "cache_invalidator", CacheInvalidator(max_registro=10, archivo=""))
+    app = FastAPI()
+    app.include_router(internal_routes.router)
+    return TestClient(app)
+
+
+def test_webhook_exige_token(cliente):
+    cuerpo = {"cambios": [{"entidad": "refugios"}]}
+    assert cliente.post("/internal/invalidate", json=cuerpo).status_code == 401
+    assert cliente.post(
+        "/internal/invalidate", json=cuerpo, headers={"X-Invalidation-Token": "otro"}
+    ).status_code == 401
+
+
+def test_webhook_sin_token_configurado(cliente, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_TOKEN", "")
+    respuesta = cliente.post(
+        "/internal/invalidate", json={"cambios": [{"entidad": "refugios"}]},
+        headers={"X-Invalidation-Token": ""}
+    )
+    assert respuesta.status_code == 503
+
+
+def test_webhook_idempotente(cliente, refugios):
+    encabezados = {"X-Invalidation-Token": "secreto"}
+    cuerpo = {"id_evento": "42", "cambios": [{"entidad": "refugios", "ids": ["r1"]}]}
+    primera = cliente.post("/internal/invalidate", json=cuerpo, headers=encabezados)
+    segunda = cliente.post("/internal/invalidate", json=cuerpo, headers=encabezados)
+    assert primera.status_code == segunda.status_code == 200
+    assert primera.json()["duplicado"] is False
+    assert segunda.json()["duplicado"] is True
+    assert len(cliente.get("/internal/invalidate/log", headers=encabezados).json()) == 1
+
+
+def test_webhook_entidad_desconocida(cliente):
+    respuesta = cliente.post(
+        "/internal/invalidate", json={"cambios": [{"entidad": "gatos"}]},
+        headers={"X-Invalidation-Token": "secreto"}
+    )
+    assert respuesta.status_code == 422
@@ -0,0 +1,48 @@
+import asyncio
+
+from app.config.settings import settings as app_settings
+from app.reports.clients.graphql_client import GraphQLClient
+from app.reports.config import settings as report_settings
+
+
+def _cliente(respuestas, pedidas):
+    cliente = GraphQLClient("http://reportes.example/graphql", local=False)
+
+    async def execute_query(query, variables=None):
+        pedidas.append(dict(variables))
+        return respuestas.pop(0)
+
+    cliente.execute_query = execute_query
+    return cliente
+
+
+def _conexion(nodos, cursor=None):
+    return {"animalesConexion": {
+        "edges": [{"node": nodo} for nodo in nodos],
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+    }}
+
+
+async def _recorrer(cliente, **filtros):
+    return [pagina async for pagina in cliente.iterar_animales(**filtros)]
+
+
+def test_iterar_animales_sigue_los_cursores():
+    pedidas = []
+    cliente = _cliente([_conexion([{"idAnimal": "1"}], "c1"), _conexion([{"idAnimal": "2"}])], pedidas)
+    paginas = asyncio.run(_recorrer(cliente, estado_adopcion="disponible"))
+    assert paginas == [[{"idAnimal": "1"}], [{"idAnimal": "2"}]]
+    assert "after" not in pedidas[0]
+    assert pedidas[1]["after"] == "c1"
+    assert pedidas[1]["estadoAdopcion"] == "disponible"
+
+
+def test_tamanio_de_pagina_se_recorta_al_maximo_de_la_conexion(monkeypatch):
+    monkeypatch.setattr(report_settings, "export_page_size", app_settings.CONNECTION_MAX_PAGE_SIZE * 5)
+    pedidas = []
+    asyncio.run(_recorrer(_cliente([_conexion([])], pedidas)))
+    assert pedidas[0]["first"] == app_settings.CONNECTION_MAX_PAGE_SIZE
+
+    pedidas = []
+    asyncio.run(_recorrer(_cliente([_conexion([])], pedidas), page_size=10))
+    assert pedidas[0]["first"] == 10
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from app.modules.animal.infraestructure.animal_catalog import ORDENES_ANIMAL, AnimalCatalog
+from app.shared.infrastructure.keyset import ColeccionIndexada, IndiceKeyset, clave_orden
+from tests.conftest import RepositorioFalso, crear_animales
+
+
+def _indice(animales, campo="edad") -> IndiceKeyset:
+    valor_de = ORDENES_ANIMAL[campo]
+    return IndiceKeyset(animales, lambda a: clave_orden(valor_de(a), a.id_animal))
+
+
+def _recorrer(indice, descendente, tamanio, incluir=None):
+    elementos, cursor = [], None
+    while True:
+        pagina = indice.pagina(first=tamanio, after=cursor, descendente=descendente, incluir=incluir)
+        elementos += pagina.elementos
+        if not pagina.has_next_page:
+            return elementos
+        cursor = pagina.cursores[-1]
+
+
+def _recorrer_hacia_atras(indice, descendente, tamanio):
+    elementos, cursor = [], None
+    while True:
+        pagina = indice.pagina(last=tamanio, before=cursor, descendente=descendente)
+        elementos = pagina.elementos + elementos
+        if not pagina.has_previous_page:
+            return elementos
+        cursor = pagina.cursores[0]
+
+
+@pytest.mark.parametrize("descendente", [False, True])
+@pytest.mark.parametrize("tamanio", [1, 7, 100])
+def test_recorrido_con_cursores_cubre_todo_sin_repetir(animales, descendente, tamanio):
+    indice = _indice(animales)
+    adelante = _recorrer(indice, descendente, tamanio)
+    assert adelante == indice.rebanada(descendente=descendente)
+    assert len({a.id_animal for a in adelante}) == len(animales)
+    assert _recorrer_hacia_atras(indice, descendente, tamanio) == adelante
+
+
+@pytest.mark.parametrize("descendente", [False, True])
+def test_cursor_de_un_elemento_eliminado_sigue_siendo_valido(animales, descendente):
+    indice = _indice(animales)
+    primera = indice.pagina(first=10, descendente=descendente)
+    cursor = primera.cursores[-1]
+    eliminado = primera.elementos[-1]
+
+    restante = _indice([a for a in animales if a.id_animal != eliminado.id_animal])
+    siguiente = restante.pagina(first=10, after=cursor, descendente=descendente)
+    assert siguiente.elementos == restante.rebanada(9, 19, descendente)
+    assert siguiente.has_previous_page
+
+
+def test_cursor_de_otro_orden_es_rechazado(animales):
+    cursor = _indice(animales, "nombre").pagina(first=3).cursores[-1]
+    with pytest.raises(ValueError):
+        _indice(animales, "edad").pagina(first=3, after=cursor)
+
+
+def test_cursor_invalido_es_rechazado(animales):
+    with pytest.raises(ValueError):
+        _indice(animales).pagina(first=3, after="no-es-un-cursor")
+
+
+def test_filtro_en_la_pagina_recorre_solo_lo_necesario(animales):
+    evaluados = []
+
+    def incluir(animal):
+        evaluados.append(animal)
+        return animal.estado_adopcion == "disponible"
+
+    pagina = _indice(animales).pagina(first=3, incluir=incluir)
+    assert [a.estado_adopcion for a in pagina.elementos] == ["disponible"] * 3
+    assert len(evaluados) < len(animales)
+
+
+def test_coleccion_cuenta_solo_cuando_se_pide(animales):
+    coleccion = ColeccionIndexada(
+        cargar=RepositorioFalso(animales).listar_animales,
+        id_de=lambda a: a.id_animal,
+        ordenes=ORDENES_ANIMAL,
+        ttl=60,
+        nombre="animales",
+    )
+    evaluados = []
+
+    def incluir(animal):
+        evaluados.append(animal)
+        return animal.edad is not None
+
+    async def escenario():
+        pagina, contar = await coleccion.pagina("edad", first=2, incluir=incluir, clave_filtro="con_edad")
+        recorridos_por_pagina = len(evaluados)
+        total = await contar()
+        return pagina, recorridos_por_pagina, total
+
+    pagina, recorridos_por_pagina, total = asyncio.run(escenario())
+    assert len(pagina.elementos) == 2
+    assert recorridos_por_pagina == 3
+    assert total == sum(1 for a in animales if a.edad is not None)
+
+
+@pytest.mark.parametrize("filtros", [
+    {"nombre": "a"},
+    {"nombre": "LÚNA"},
+    {"estado_adopcion": "adoptado", "edad_min": 2},
+    {"edad_min": 2, "edad_max": 5},
+    {"edad_max": 1, "nombre": "ma"},
+])
+def test_pagina_filtrada_del_catalogo_coincide_con_el_filtro(filtros):
+    animales = crear_animales(80, semilla=3)
+    catalogo = AnimalCatalog(repo=RepositorioFalso(animales), ttl=60)
+
+    async def escenario():
+        esperados = await catalogo.filtrar(**filtros)
+        pagina, contar = await catalogo.pagina("nombre", first=len(animales), **filtros)
+        return esperados, pagina, await contar()
+
+    esperados, pagina, total = asyncio.run(escenario())
+    assert {a.id_animal for a in pagina.elementos} == {a.id_animal for a in esperados}
+    assert total == len(esperados)
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.shared.infrastructure.negative_cache import cache_no_encontrados, recordar_no_encontrados
+
+
+class Repositorio:
+    """Repositorio por ID con un backend en memoria"""
+
+    def __init__(self, existentes=()):
+        self.existentes = set(existentes)
+        self.consultas = []
+        self.durante_consulta = None
+
+    @recordar_no_encontrados("pruebas")
+    async def obtener_por_id(self, id_entidad):
+        self.consultas.append(id_entidad)
+        if self.durante_consulta is not None:
+            self.durante_consulta()
+        await asyncio.sleep(0)
+        return {"id": id_entidad} if id_entidad in self.existentes else None
+
+
+@pytest.fixture(autouse=True)
+def cache_limpia():
+    cache_no_encontrados.invalidar()
+    yield
+    cache_no_encontrados.invalidar()
+
+
+def test_404_se_recuerda():
+    repo = Repositorio()
+    assert asyncio.run(repo.obtener_por_id("x")) is None
+    assert asyncio.run(repo.obtener_por_id("x")) is None
+    assert repo.consultas == ["x"]
+
+
+def test_encontrados_no_se_recuerdan():
+    repo = Repositorio(existentes={"a"})
+    asyncio.run(repo.obtener_por_id("a"))
+    asyncio.run(repo.obtener_por_id("a"))
+    assert repo.consultas == ["a", "a"]
+
+
+def test_clave_por_entidad_e_id_como_texto():
+    repo = Repositorio()
+    asyncio.run(repo.obtener_por_id(7))
+    assert cache_no_encontrados.obtener(("pruebas", "7")) is True
+    assert cache_no_encontrados.obtener(("otras", "7")) is None
+
+
+def test_invalidar_permite_ver_un_alta():
+    repo = Repositorio()
+    asyncio.run(repo.obtener_por_id("x"))
+    repo.existentes.add("x")
+    cache_no_encontrados.invalidar(("pruebas", "x"))
+    assert asyncio.run(repo.obtener_por_id("x")) == {"id": "x"}
+
+
+def test_404_obtenido_durante_una_invalidacion_no_se_guarda():
+    repo = Repositorio()
+    # El alta llega (y se invalida) mientras la consulta está en vuelo
+    repo.durante_consulta = lambda: cache_no_encontrados.invalidar(("pruebas", "x"))
+    asyncio.run(repo.obtener_por_id("x"))
+    repo.durante_consulta = None
+    repo.existentes.add("x")
+    assert asyncio.run(repo.obtener_por_id("x")) == {"id": "x"}
+    assert repo.consultas == ["x", "x"]
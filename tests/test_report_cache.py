@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from app.reports.services.report_cache import ReportCache, ReportePDF, calcular_etag
+
+
+def _cache(tmp_path, **kwargs):
+    opciones = {"max_items": 4, "max_bytes_memoria": 16, "max_archivos": 8}
+    opciones.update(kwargs)
+    return ReportCache(directorio=str(tmp_path), **opciones)
+
+
+def _renderizador(contenido: bytes, llamadas: list, demora: float = 0.01):
+    async def renderizar():
+        llamadas.append(1)
+        await asyncio.sleep(demora)
+        return contenido
+    return renderizar
+
+
+def test_clave_depende_de_tipo_parametros_y_datos():
+    base = ReportCache.clave("animales_general", [{"id": 1}], {})
+    assert base == ReportCache.clave("animales_general", [{"id": 1}], {})
+    assert base != ReportCache.clave("animales_general", [{"id": 2}], {})
+    assert base != ReportCache.clave("campanias", [{"id": 1}], {})
+    assert base != ReportCache.clave("animales_general", [{"id": 1}], {"titulo": "x"})
+
+
+def test_renders_simultaneos_de_una_clave_se_agrupan(tmp_path):
+    cache, llamadas = _cache(tmp_path), []
+    renderizar = _renderizador(b"%PDF chico", llamadas)
+
+    async def escenario():
+        return await asyncio.gather(*(cache.obtener_o_generar("k", renderizar) for _ in range(10)))
+
+    reportes = asyncio.run(escenario())
+    assert len(llamadas) == 1
+    assert {r.etag for r in reportes} == {calcular_etag(b"%PDF chico")}
+    assert all(r.leer() == b"%PDF chico" for r in reportes)
+
+
+def test_pdf_grande_va_a_disco_y_cada_lectura_recibe_su_enlace(tmp_path):
+    cache, llamadas = _cache(tmp_path), []
+    contenido = b"%PDF " + b"x" * 100
+
+    async def escenario():
+        return await asyncio.gather(*(
+            cache.obtener_o_generar("k", _renderizador(contenido, llamadas)) for _ in range(5)
+        ))
+
+    reportes = asyncio.run(escenario())
+    assert len(llamadas) == 1
+    rutas = {r.ruta for r in reportes}
+    assert len(rutas) == 5
+    assert all(r.temporal and r.ruta.suffix == ".envio" for r in reportes)
+    assert all(r.leer() == contenido for r in reportes)
+
+    # Desalojar la entrada no afecta a los envíos en curso
+    cache._ruta("k").unlink()
+    assert all(r.leer() == contenido for r in reportes)
+    assert asyncio.run(cache.obtener("k")) is None
+
+
+def test_escrituras_concurrentes_no_comparten_temporales(tmp_path):
+    cache = _cache(tmp_path)
+    contenidos = {f"k{i}": bytes([65 + i]) * 64 for i in range(6)}
+
+    async def escenario():
+        await asyncio.gather(*(cache.guardar(clave, contenido) for clave, contenido in contenidos.items()))
+
+    asyncio.run(escenario())
+    for clave, contenido in contenidos.items():
+        assert cache._ruta(clave).read_bytes() == contenido
+    assert list(cache.directorio.glob("*.tmp")) == []
+
+
+def test_disco_conserva_solo_max_archivos(tmp_path):
+    cache = _cache(tmp_path, max_archivos=2)
+
+    async def escenario():
+        for i in range(4):
+            await cache.guardar(f"k{i}", b"x" * 64)
+            await asyncio.sleep(0.01)
+
+    asyncio.run(escenario())
+    assert sorted(r.stem for r in cache.directorio.glob("*.pdf")) == ["k2", "k3"]
+
+
+def test_error_de_render_llega_a_todos_y_permite_reintentar(tmp_path):
+    cache = _cache(tmp_path)
+
+    async def falla():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("render roto")
+
+    async def escenario():
+        return await asyncio.gather(*(cache.obtener_o_generar("k", falla) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(escenario()))
+    assert asyncio.run(cache.obtener_o_generar("k", _renderizador(b"%PDF", []))).leer() == b"%PDF"
+
+
+@pytest.mark.parametrize("encabezado, coincide", [
+    (None, False),
+    ('"otro"', False),
+    ('"abc"', True),
+    ('"otro", W/"abc"', True),
+    ("*", True),
+])
+def test_if_none_match(encabezado, coincide):
+    assert ReportePDF(etag='"abc"', contenido=b"").coincide(encabezado) is coincide
@@ -0,0 +1,46 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.reports.services.report_jobs import GestorNoIniciado, ReportJob, ReportJobManager
+
+
+def _gestor(tmp_path, ttl=60):
+    gestor = ReportJobManager(report_service=None, workers=1, queue_size=1, ttl=ttl, directorio=str(tmp_path))
+    gestor.directorio.mkdir(parents=True)
+    return gestor
+
+
+def _terminado(gestor, id_trabajo, hace):
+    ruta = gestor.directorio / f"{id_trabajo}.pdf"
+    ruta.write_bytes(b"%PDF")
+    trabajo = ReportJob(id=id_trabajo, tipo="prueba", parametros={}, clave=id_trabajo, estado="completado", ruta=ruta)
+    trabajo._finalizado = time.monotonic() - hace
+    gestor._trabajos[id_trabajo] = trabajo
+    return trabajo
+
+
+def test_encolar_sin_iniciar_es_un_error_propio(tmp_path):
+    with pytest.raises(GestorNoIniciado):
+        _gestor(tmp_path).encolar("prueba")
+
+
+def test_limpiar_borra_vencidos_y_huerfanos(tmp_path):
+    gestor = _gestor(tmp_path, ttl=60)
+    vencido = _terminado(gestor, "vencido", hace=120)
+    reciente = _terminado(gestor, "reciente", hace=1)
+    huerfano = gestor.directorio / "huerfano.pdf"
+    huerfano.write_bytes(b"%PDF")
+    viejo = time.time() - 120
+    os.utime(huerfano, (viejo, viejo))
+    nuevo = gestor.directorio / "nuevo.pdf"
+    nuevo.write_bytes(b"%PDF")
+
+    assert asyncio.run(gestor.limpiar()) == 1
+    assert gestor.obtener("vencido") is None
+    assert not vencido.ruta.exists()
+    assert not huerfano.exists()
+    assert reciente.ruta.exists()
+    assert nuevo.exists()
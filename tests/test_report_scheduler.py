@@ -0,0 +1,65 @@
+import asyncio
+
+from app.reports.services.report_scheduler import ReportScheduler
+
+
+class ServicioFalso:
+    """Lo que ReportScheduler usa de ReportService"""
+
+    def __init__(self):
+        self.animales = [{"nombre": "Luna"}]
+        self.renderizados = 0
+
+    async def datos_animales_general(self):
+        return self.animales
+
+    async def datos_campanias(self):
+        return [{"nombre": "Campaña"}]
+
+    async def pregenerar_pdf(self, data, report_type, destino):
+        self.renderizados += 1
+        destino.write_bytes(f"%PDF {report_type} {data}".encode())
+        return destino
+
+
+def _scheduler(tmp_path, gracia):
+    scheduler = ReportScheduler(ServicioFalso(), interval=60, directorio=str(tmp_path), gracia=gracia)
+    scheduler.directorio.mkdir(parents=True)
+    return scheduler
+
+
+def test_solo_se_renderiza_si_cambian_los_datos(tmp_path):
+    scheduler = _scheduler(tmp_path, gracia=300)
+    assert asyncio.run(scheduler.regenerar("animales_general")) is True
+    assert asyncio.run(scheduler.regenerar("animales_general")) is False
+    assert scheduler.report_service.renderizados == 1
+    reporte, nombre = scheduler.obtener("animales_general")
+    assert reporte.ruta.exists()
+    assert nombre == "reporte_general_animales.pdf"
+
+
+def test_archivo_reemplazado_se_conserva_durante_la_gracia(tmp_path):
+    scheduler = _scheduler(tmp_path, gracia=300)
+    asyncio.run(scheduler.regenerar("animales_general"))
+    anterior, _ = scheduler.obtener("animales_general")
+
+    scheduler.report_service.animales = [{"nombre": "Max"}]
+    asyncio.run(scheduler.regenerar("animales_general"))
+    vigente, _ = scheduler.obtener("animales_general")
+    scheduler._limpiar("animales_general")
+    assert vigente.ruta != anterior.ruta
+    assert anterior.ruta.exists()
+
+    scheduler.gracia = 0
+    scheduler._limpiar("animales_general")
+    assert not anterior.ruta.exists()
+    assert vigente.ruta.exists()
+
+
+def test_limpieza_no_toca_otros_tipos(tmp_path):
+    scheduler = _scheduler(tmp_path, gracia=0)
+    asyncio.run(scheduler.regenerar("animales_general"))
+    asyncio.run(scheduler.regenerar("campanias"))
+    scheduler._limpiar("animales_general")
+    assert scheduler.obtener("animales_general")[0].ruta.exists()
+    assert scheduler.obtener("campanias")[0].ruta.exists()
@@ -0,0 +1,82 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+
+from app.shared.infrastructure.single_flight import SingleFlightTransport
+
+
+def _cliente(llamadas, demora=0.01):
+    async def backend(request: httpx.Request) -> httpx.Response:
+        llamadas.append((request.method, str(request.url)))
+        await asyncio.sleep(demora)
+        cuerpo = gzip.compress(json.dumps({"url": str(request.url)}).encode())
+        return httpx.Response(200, content=cuerpo, headers={"Content-Encoding": "gzip"})
+
+    transporte = SingleFlightTransport(httpx.MockTransport(backend))
+    return httpx.AsyncClient(transport=transporte, base_url="http://backend"), transporte
+
+
+def test_get_identicos_simultaneos_llegan_una_vez_al_backend():
+    llamadas = []
+
+    async def escenario():
+        cliente, transporte = _cliente(llamadas)
+        async with cliente:
+            respuestas = await asyncio.gather(*(cliente.get("/animals") for _ in range(10)))
+        return respuestas, transporte
+
+    respuestas, transporte = asyncio.run(escenario())
+    assert llamadas == [("GET", "http://backend/animals")]
+    assert transporte.agrupadas == 9
+    assert all(r.json() == {"url": "http://backend/animals"} for r in respuestas)
+
+
+def test_peticiones_distintas_no_se_agrupan():
+    llamadas = []
+
+    async def escenario():
+        cliente, _ = _cliente(llamadas)
+        async with cliente:
+            await asyncio.gather(
+                cliente.get("/animals", params={"limit": 1}),
+                cliente.get("/animals", params={"limit": 2}),
+                cliente.get("/animals", headers={"Authorization": "otro"}),
+                cliente.get("/animals"),
+                cliente.post("/animals", json={}),
+                cliente.post("/animals", json={}),
+            )
+
+    asyncio.run(escenario())
+    assert len(llamadas) == 6
+
+
+def test_despues_de_responder_se_vuelve_a_consultar():
+    llamadas = []
+
+    async def escenario():
+        cliente, _ = _cliente(llamadas, demora=0)
+        async with cliente:
+            await cliente.get("/animals")
+            await cliente.get("/animals")
+
+    asyncio.run(escenario())
+    assert len(llamadas) == 2
+
+
+def test_cancelar_a_uno_no_cancela_la_descarga_compartida():
+    llamadas = []
+
+    async def escenario():
+        cliente, _ = _cliente(llamadas, demora=0.05)
+        async with cliente:
+            primera = asyncio.ensure_future(cliente.get("/animals"))
+            segunda = asyncio.ensure_future(cliente.get("/animals"))
+            await asyncio.sleep(0.01)
+            primera.cancel()
+            return await segunda
+
+    respuesta = asyncio.run(escenario())
+    assert respuesta.status_code == 200
+    assert len(llamadas) == 1
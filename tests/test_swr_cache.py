@@ -0,0 +1,152 @@
+import asyncio
+
+from app.modules.animal.infraestructure.animal_catalog import AnimalCatalog
+from app.shared.infrastructure.ttl_cache import (
+    SWRCache,
+    cargar_con_edad,
+    iniciar_registro_edades,
+    registrar_edad,
+    terminar_registro_edades,
+)
+from tests.conftest import crear_animales
+
+
+class Backend:
+    """Carga que devuelve una versión nueva en cada llamada"""
+
+    def __init__(self, falla: bool = False):
+        self.version = 0
+        self.falla = falla
+
+    async def cargar(self):
+        self.version += 1
+        await asyncio.sleep(0)
+        if self.falla and self.version > 1:
+            raise RuntimeError("backend caído")
+        return f"v{self.version}"
+
+
+def _leer(cache, backend):
+    """Lee con registro de edades y deja correr los refrescos en segundo plano"""
+    async def escenario():
+        edades, token = iniciar_registro_edades()
+        try:
+            valor = await cache.obtener_o_cargar("*", backend.cargar)
+        finally:
+            terminar_registro_edades(token)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return valor, edades.get(cache.nombre)
+
+    return asyncio.run(escenario())
+
+
+def test_dentro_del_ttl_suave_no_se_consulta(reloj):
+    cache, backend = SWRCache("animales", ttl_suave=10, ttl=60, max_items=1), Backend()
+    assert _leer(cache, backend)[0] == "v1"
+    reloj.valor += 5
+    valor, edad = _leer(cache, backend)
+    assert valor == "v1"
+    assert backend.version == 1
+    assert edad == {"edad_segundos": 5.0, "obsoleta": False}
+
+
+def test_pasado_el_ttl_suave_se_sirve_la_copia_y_se_refresca(reloj):
+    cache, backend = SWRCache("animales", ttl_suave=10, ttl=60, max_items=1), Backend()
+    _leer(cache, backend)
+    reloj.valor += 15
+    valor, edad = _leer(cache, backend)
+    assert valor == "v1"
+    assert edad == {"edad_segundos": 15.0, "obsoleta": True}
+    assert cache.stats.revalidaciones == 1
+
+    valor, edad = _leer(cache, backend)
+    assert valor == "v2"
+    assert edad == {"edad_segundos": 0.0, "obsoleta": False}
+
+
+def test_una_sola_revalidacion_por_rafaga(reloj):
+    cache, backend = SWRCache("animales", ttl_suave=10, ttl=60, max_items=1), Backend()
+    _leer(cache, backend)
+    reloj.valor += 15
+
+    async def rafaga():
+        valores = await asyncio.gather(*(cache.obtener_o_cargar("*", backend.cargar) for _ in range(10)))
+        await asyncio.sleep(0.01)
+        return valores
+
+    assert asyncio.run(rafaga()) == ["v1"] * 10
+    assert backend.version == 2
+    assert cache.stats.revalidaciones == 1
+
+
+def test_si_el_refresco_falla_se_sigue_sirviendo_hasta_el_ttl(reloj):
+    cache, backend = SWRCache("animales", ttl_suave=10, ttl=60, max_items=1), Backend(falla=True)
+    _leer(cache, backend)
+    reloj.valor += 15
+    assert _leer(cache, backend)[0] == "v1"
+    assert _leer(cache, backend)[0] == "v1"
+
+
+def test_pasado_el_ttl_se_espera_la_carga(reloj):
+    cache, backend = SWRCache("animales", ttl_suave=10, ttl=60, max_items=1), Backend()
+    _leer(cache, backend)
+    reloj.valor += 60
+    valor, edad = _leer(cache, backend)
+    assert valor == "v2"
+    assert edad == {"edad_segundos": 0.0, "obsoleta": False}
+
+
+def test_registro_guarda_la_lectura_mas_vieja():
+    edades, token = iniciar_registro_edades()
+    try:
+        registrar_edad("animales", 3, False)
+        registrar_edad("animales", 8, True)
+        registrar_edad("animales", 1, False)
+    finally:
+        terminar_registro_edades(token)
+    assert edades == {"animales": {"edad_segundos": 8, "obsoleta": True}}
+    # Fuera de una operación no se registra nada
+    registrar_edad("animales", 99, True)
+    assert edades["animales"]["edad_segundos"] == 8
+
+
+def test_cargar_con_edad_no_afecta_al_registro_exterior():
+    async def cargar():
+        registrar_edad("animales", 12, True)
+        return "datos"
+
+    async def escenario():
+        edades, token = iniciar_registro_edades()
+        try:
+            resultado = await cargar_con_edad(cargar)
+        finally:
+            terminar_registro_edades(token)
+        return resultado, edades
+
+    resultado, exterior = asyncio.run(escenario())
+    assert resultado == ("datos", 12, True)
+    assert exterior == {}
+
+
+def test_catalogo_informa_la_edad_del_listado_del_que_se_cargo():
+    animales = crear_animales(5)
+
+    class Repositorio:
+        async def listar_animales(self):
+            registrar_edad("animales", 20, True)
+            return animales
+
+    async def escenario():
+        catalogo = AnimalCatalog(repo=Repositorio(), ttl=60)
+        edades, token = iniciar_registro_edades()
+        try:
+            await catalogo.listar()
+            await catalogo.listar()
+        finally:
+            terminar_registro_edades(token)
+        return edades
+
+    edad = asyncio.run(escenario())["animales"]
+    assert 20 <= edad["edad_segundos"] < 21
+    assert edad["obsoleta"] is True
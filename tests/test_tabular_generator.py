@@ -0,0 +1,81 @@
+import asyncio
+import csv
+import io
+import json
+import zipfile
+
+import pytest
+
+from app.reports.generators.tabular_generator import (
+    CSVGenerator,
+    NDJSONGenerator,
+    TabularGenerator,
+    XLSXGenerator,
+    crear_exportador,
+)
+
+COLUMNAS = [("nombre", "Nombre"), ("edad", "Edad")]
+
+
+def _leer_csv(contenido: bytes):
+    texto = contenido.decode("utf-8")
+    assert texto.startswith("\ufeff")
+    return list(csv.reader(io.StringIO(texto[1:])))
+
+
+@pytest.mark.parametrize("valor", [
+    "=cmd|' /C calc'!A0",
+    "+1+1",
+    "-2+3",
+    "@SUM(A1:A2)",
+    "\t=1+1",
+    "\r=1+1",
+])
+def test_csv_neutraliza_formulas(valor):
+    filas = _leer_csv(CSVGenerator(COLUMNAS).generate([{"nombre": valor, "edad": 2}]).getvalue())
+    assert filas[1] == ["'" + valor, "2"]
+
+
+def test_csv_no_altera_texto_ni_numeros():
+    datos = [{"nombre": "Luna = gata", "edad": -3}, {"nombre": None, "edad": None}]
+    filas = _leer_csv(CSVGenerator(COLUMNAS).generate(datos).getvalue())
+    assert filas == [["Nombre", "Edad"], ["Luna = gata", "-3"], ["", ""]]
+
+
+def test_stream_emite_un_bloque_por_pagina():
+    async def paginas():
+        yield [{"nombre": "Luna", "edad": 1}]
+        yield [{"nombre": "Max", "edad": 2}]
+
+    async def recorrer():
+        return [bloque async for bloque in NDJSONGenerator(COLUMNAS).stream(paginas())]
+
+    bloques = asyncio.run(recorrer())
+    assert [json.loads(b) for b in bloques] == [{"nombre": "Luna", "edad": 1}, {"nombre": "Max", "edad": 2}]
+
+
+def test_xlsx_escribe_formulas_como_texto():
+    async def paginas():
+        yield [{"nombre": "=1+1", "edad": 4}]
+
+    async def recorrer():
+        return b"".join([bloque async for bloque in XLSXGenerator(COLUMNAS).stream(paginas())])
+
+    with zipfile.ZipFile(io.BytesIO(asyncio.run(recorrer()))) as libro:
+        hoja = libro.read("xl/worksheets/sheet1.xml").decode()
+    assert "<f>" not in hoja
+    assert '<t xml:space="preserve">=1+1</t>' in hoja
+    assert '<c r="B2"><v>4</v></c>' in hoja
+
+
+def test_subclase_sin_filas_no_se_puede_instanciar():
+    class SinFilas(TabularGenerator):
+        pass
+
+    with pytest.raises(TypeError):
+        SinFilas(COLUMNAS)
+
+
+def test_formato_desconocido():
+    with pytest.raises(ValueError):
+        crear_exportador("ods", COLUMNAS)
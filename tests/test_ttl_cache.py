@@ -0,0 +1,128 @@
+import asyncio
+
+from app.shared.infrastructure.ttl_cache import CacheRegistry, TTLCache
+
+
+def test_entrada_vence_al_cumplir_el_ttl(reloj):
+    cache = TTLCache("prueba", ttl=10, max_items=5)
+    cache.guardar("a", 1)
+    reloj.valor += 9.9
+    assert cache.obtener("a") == 1
+    reloj.valor += 0.1
+    assert cache.obtener("a") is None
+    assert cache.stats.vencidas == 1
+    assert len(cache) == 0
+
+
+def test_ttl_por_entrada(reloj):
+    cache = TTLCache("prueba", ttl=10, max_items=5)
+    cache.guardar("corta", 1, ttl=1)
+    reloj.valor += 2
+    assert cache.obtener("corta") is None
+
+
+def test_lru_desaloja_la_menos_usada():
+    cache = TTLCache("prueba", ttl=60, max_items=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    assert cache.obtener("a") == 1
+    cache.guardar("c", 3)
+    assert cache.obtener("b") is None
+    assert cache.obtener("a") == 1
+    assert cache.obtener("c") == 3
+    assert cache.stats.desalojos == 1
+
+
+def test_ttl_cero_deshabilita_la_cache():
+    cache = TTLCache("prueba", ttl=0, max_items=10)
+    cache.guardar("a", 1)
+    assert cache.obtener("a") is None
+
+
+def test_cargas_simultaneas_de_una_clave_consultan_una_vez():
+    cache = TTLCache("prueba", ttl=60, max_items=10)
+    llamadas = []
+
+    async def cargar():
+        llamadas.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    async def escenario():
+        return await asyncio.gather(*(cache.obtener_o_cargar("a", cargar) for _ in range(20)))
+
+    resultados = asyncio.run(escenario())
+    assert len(llamadas) == 1
+    assert all(r is resultados[0] for r in resultados)
+    assert cache.obtener("a") == {"id": 1}
+
+
+def test_error_de_carga_llega_a_todos_y_no_se_guarda():
+    cache = TTLCache("prueba", ttl=60, max_items=10)
+
+    async def cargar():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend caído")
+
+    async def escenario():
+        return await asyncio.gather(
+            *(cache.obtener_o_cargar("a", cargar) for _ in range(3)), return_exceptions=True
+        )
+
+    resultados = asyncio.run(escenario())
+    assert all(isinstance(r, RuntimeError) for r in resultados)
+    assert len(cache) == 0
+
+
+def test_none_no_se_guarda():
+    cache = TTLCache("prueba", ttl=60, max_items=10)
+    llamadas = []
+
+    async def cargar():
+        llamadas.append(1)
+        return None
+
+    asyncio.run(cache.obtener_o_cargar("a", cargar))
+    asyncio.run(cache.obtener_o_cargar("a", cargar))
+    assert len(llamadas) == 2
+
+
+def test_carga_iniciada_antes_de_invalidar_no_se_guarda():
+    cache = TTLCache("prueba", ttl=60, max_items=10)
+
+    async def escenario():
+        iniciada, liberar = asyncio.Event(), asyncio.Event()
+
+        async def cargar():
+            iniciada.set()
+            await liberar.wait()
+            return "viejo"
+
+        carga = asyncio.ensure_future(cache.obtener_o_cargar("a", cargar))
+        await iniciada.wait()
+        cache.invalidar("a")
+        liberar.set()
+        return await carga
+
+    assert asyncio.run(escenario()) == "viejo"
+    assert cache.obtener("a") is None
+    assert cache.generacion == 1
+
+
+def test_invalidar_donde():
+    cache = TTLCache("prueba", ttl=60, max_items=10)
+    for clave in [("refugio", 1), ("refugio", 2), ("especie", 1)]:
+        cache.guardar(clave, clave)
+    assert cache.invalidar_donde(lambda clave: clave[0] == "refugio") == 2
+    assert cache.obtener(("especie", 1)) == ("especie", 1)
+
+
+def test_registro_crea_una_cache_por_entidad():
+    registro = CacheRegistry({"refugio": (30, 2)}, por_defecto=(60, 10))
+    refugios = registro.para("refugio")
+    assert registro.para("refugio") is refugios
+    assert (refugios.ttl, refugios.max_items) == (30, 2)
+    assert registro.para("especie").ttl == 60
+    refugios.guardar("a", 1)
+    registro.para("especie").guardar("b", 2)
+    assert registro.invalidar() == 2